@@ -0,0 +1,393 @@
+"""Offline benchmarks of the contract model-build, write and read hot paths.
+
+Runs against a local DuckDb database and a DuckLake catalog keeping its metadata in a local DuckDb file and its
+data files in a local folder, so neither Postgres nor S3 is needed. Every case runs per entity width and record
+count, and the results are written as one JSON document, with the version, commit and environment they were
+measured on, to compare between versions.
+
+    python -m benchmarks.contract_benchmarks --widths 8 32 128 --records 10 100 1000 --output results.json
+    python -m benchmarks.contract_benchmarks --baseline results.json --output candidate.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tomllib
+from importlib import metadata
+from pathlib import Path
+from typing import Any, Callable
+
+import duckdb
+import pydantic
+
+from ygg.config import YggSetup
+from ygg.core.data_contract_loader import DataContractLoader
+from ygg.core.polyglot_contract import PolyglotContract
+from ygg.helpers.enums import Model
+from ygg.helpers.synthetic_data import SyntheticDataGenerator
+from ygg.polyglot.polyglot import Polyglot
+from ygg.utils.commons import get_json_signature
+from ygg.utils.ygg_logs import LogMode, configure_logging, get_logger
+
+ROOT = Path(__file__).resolve().parent.parent
+CATALOG = "bench"
+SUITE = "ygg-contract-benchmarks"
+
+
+def get_config(workspace: Path) -> dict:
+    """Get the Ygg config of a workspace, with the DuckLake metadata and data files kept locally."""
+
+    return {
+        "ygg-database-config": {
+            "database": "ygg",
+            "database_extension": "duckdb",
+            "database_location": str(workspace / "database"),
+            "data_location": str(workspace / "data"),
+        },
+        "ygg-ducklake-config": {"metadata_repository": "duckdb", "repository": "local"},
+    }
+
+
+def get_contract_schema(generator: SyntheticDataGenerator, width: int) -> dict:
+    """Get the synthetic contract schema of an entity width."""
+    return generator.contract_schema(f"benchmark_w{width}", width)
+
+
+def get_records(generator: SyntheticDataGenerator, schema: dict, count: int, prefix: str) -> list[dict]:
+    """Get count synthetic records of a contract schema, keyed by the prefix."""
+    return list(generator.records(schema, count, prefix=prefix))
+
+
+def measure(func: Callable[[int], Any], repeat: int, warmup: int = 1) -> dict[str, float]:
+    """Time a function, handed the run number, returning the wall time stats of the measured runs."""
+
+    for run in range(warmup):
+        func(-1 - run)
+
+    timings: list[float] = []
+    for run in range(repeat):
+        start = time.perf_counter()
+        func(run)
+        timings.append(time.perf_counter() - start)
+
+    return {
+        "min_seconds": min(timings),
+        "median_seconds": statistics.median(timings),
+        "mean_seconds": statistics.fmean(timings),
+        "max_seconds": max(timings),
+        "stdev_seconds": statistics.stdev(timings) if len(timings) > 1 else 0.0,
+    }
+
+
+def get_result(case: str, width: int | None, records: int | None, repeat: int, timings: dict) -> dict:
+    """Get a case result, with the per record cost of its median run."""
+
+    result: dict[str, Any] = {"case": case, "width": width, "records": records, "repeat": repeat, **timings}
+    if records:
+        result["median_us_per_record"] = timings["median_seconds"] / records * 1e6
+        result["records_per_second"] = records / timings["median_seconds"] if timings["median_seconds"] else None
+
+    print(
+        f"{case:<24} width={width!s:<5} records={records!s:<7} median={timings['median_seconds'] * 1000:10.3f} ms",
+        file=sys.stderr,
+    )
+    return result
+
+
+def build_loader(generator: SyntheticDataGenerator, width: int) -> DataContractLoader:
+    """Build the Data Contract Loader of an entity width."""
+
+    return DataContractLoader(
+        model=Model.CONTRACT,
+        data_contract_schema_config=generator.schema_config(),
+        odcs_schema_reference=generator.odcs_reference(),
+        data_contract_schema=get_contract_schema(generator, width),
+        catalog_name=CATALOG,
+        odcs_schema_signature="synthetic",
+    )
+
+
+def run_model_cases(
+    generator: SyntheticDataGenerator, width: int, record_counts: list[int], repeat: int
+) -> tuple[Polyglot, list[dict]]:
+    """Run the model-build and validation cases of an entity width."""
+
+    results: list[dict] = [
+        get_result("loader.init", width, None, repeat, measure(lambda _: build_loader(generator, width), repeat))
+    ]
+
+    entity = build_loader(generator, width).polyglot_entity
+    results.append(
+        get_result("polyglot.build", width, None, repeat, measure(lambda _: Polyglot(entity).build(), repeat))
+    )
+
+    polyglot = Polyglot(entity)
+    polyglot.build()
+    model = polyglot.instance
+    schema = get_contract_schema(generator, width)
+
+    for count in record_counts:
+        records = get_records(generator, schema, count, "model")
+        models = [model.inflate(r) for r in records]
+        results += [
+            get_result("inflate", width, count, repeat, measure(lambda _: [model.inflate(r) for r in records], repeat)),
+            get_result("inflate_many", width, count, repeat, measure(lambda _: model.inflate_many(records), repeat)),
+            get_result(
+                "statement_map", width, count, repeat, measure(lambda _: [m.statement_map for m in models], repeat)
+            ),
+            get_result(
+                "get_json_signature",
+                width,
+                count,
+                repeat,
+                measure(lambda _: [get_json_signature(r) for r in records], repeat),
+            ),
+        ]
+
+    return polyglot, results
+
+
+def run_catalog_cases(
+    generator: SyntheticDataGenerator,
+    polyglot: Polyglot,
+    width: int,
+    record_counts: list[int],
+    repeat: int,
+    max_single_writes: int,
+) -> list[dict]:
+    """Run the write and read cases of an entity width against the local DuckLake catalog."""
+
+    contract = PolyglotContract(entity=polyglot).setup()
+    model = polyglot.instance
+    schema = get_contract_schema(generator, width)
+    results: list[dict] = []
+
+    for count in record_counts:
+        # Every run writes new keys, a key already in the catalog is skipped and would make the write look cheaper.
+        singles = min(count, max_single_writes)
+
+        def write_single(run: int) -> None:
+            for record in get_records(generator, schema, singles, f"single_{count}_{run}"):
+                PolyglotContract(entity=model.inflate(record)).write_contract()
+
+        def write_batch(run: int) -> None:
+            contract.write_contracts(
+                model.inflate_many(get_records(generator, schema, count, f"batch_{count}_{run}")).records
+            )
+
+        results += [
+            get_result("write_contract", width, singles, repeat, measure(write_single, repeat)),
+            get_result("write_contracts", width, count, repeat, measure(write_batch, repeat)),
+        ]
+
+    key = generator.record(schema, 0, f"batch_{record_counts[0]}_0")["id"]
+    results.append(
+        get_result(
+            "read_contract.key", width, 1, repeat, measure(lambda _: contract.read_contract({"id": key}), repeat)
+        )
+    )
+    for count in record_counts:
+        results.append(
+            get_result(
+                "read_contract.scan",
+                width,
+                count,
+                repeat,
+                measure(lambda _: contract.read_contract(limit=count), repeat),
+            )
+        )
+
+    return results
+
+
+def probe_logger(mode: str, calls: int) -> None:
+    """Time filtered and emitted Logger calls in this process, printing the result as the last stderr line."""
+
+    configure_logging(mode=mode, log_level="INFO", force=True)
+    logs = get_logger(logger_name="Benchmark")
+
+    timings: dict[str, float] = {}
+    for level in ("debug", "info"):
+        log = getattr(logs, level)
+        start = time.perf_counter()
+        for i in range(calls):
+            log("Benchmark statement.", entity="benchmark", record=i)
+        timings[f"{level}_us_per_call"] = (time.perf_counter() - start) / calls * 1e6
+
+    print(json.dumps(timings), file=sys.stderr)
+
+
+def run_logger_cases(calls: int) -> list[dict]:
+    """Run the Logger cases, one process per mode as logging is configured once per process."""
+
+    results: list[dict] = []
+    for mode in (LogMode.DEVELOPMENT.value, LogMode.PRODUCTION.value):
+        completed = subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "benchmarks.contract_benchmarks",
+                "--logger-probe",
+                mode,
+                "--logger-calls",
+                str(calls),
+            ],
+            cwd=ROOT,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+            check=True,
+        )
+        timings = json.loads(completed.stderr.strip().splitlines()[-1])
+        results.append({"case": f"logger.{mode}", "width": None, "records": calls, "repeat": 1, **timings})
+        print(
+            f"{'logger.' + mode:<24} debug={timings['debug_us_per_call']:.2f} us info={timings['info_us_per_call']:.2f} us",
+            file=sys.stderr,
+        )
+
+    return results
+
+
+def get_version() -> str | None:
+    """Get the Ygg version."""
+
+    try:
+        return metadata.version("ygg")
+    except metadata.PackageNotFoundError:
+        with open(ROOT / "pyproject.toml", "rb") as file:
+            return tomllib.load(file).get("project", {}).get("version")
+
+
+def get_git_commit() -> str | None:
+    """Get the commit the benchmarks ran on, None outside a git checkout."""
+
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+        dirty = subprocess.run(["git", "status", "--porcelain"], cwd=ROOT, capture_output=True, text=True).stdout
+        return f"{commit}-dirty" if dirty.strip() else commit
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def get_environment() -> dict[str, Any]:
+    """Get the environment the benchmarks ran on."""
+
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "duckdb": duckdb.__version__,
+        "pydantic": pydantic.VERSION,
+        "ygg_metrics": os.getenv("YGG_METRICS"),
+        "ygg_duckdb_profiling": os.getenv("YGG_DUCKDB_PROFILING"),
+    }
+
+
+def compare(results: list[dict], baseline_file: Path) -> None:
+    """Add the ratio to the baseline median of every case measured in both runs, above 1 is slower."""
+
+    baseline = json.loads(baseline_file.read_text())
+    medians = {(r["case"], r["width"], r["records"]): r.get("median_seconds") for r in baseline.get("results", [])}
+    for result in results:
+        if baseline_median := medians.get((result["case"], result["width"], result["records"])):
+            result["baseline_ratio"] = result["median_seconds"] / baseline_median
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Ygg offline contract benchmarks")
+    parser.add_argument("--widths", type=int, nargs="+", default=[8, 32, 128], help="Entity widths, in columns.")
+    parser.add_argument("--records", type=int, nargs="+", default=[10, 100, 1000], help="Record counts.")
+    parser.add_argument("--repeat", type=int, default=5, help="Measured runs of every case.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the synthetic schemas and records.")
+    parser.add_argument("--max-single-writes", type=int, default=20, help="Most single write_contract calls.")
+    parser.add_argument("--logger-calls", type=int, default=20000, help="Logger calls per level and mode.")
+    parser.add_argument("--skip-catalog", action="store_true", help="Skip the write and read cases.")
+    parser.add_argument("--workspace", help="Folder of the local database and catalog, a temporary one by default.")
+    parser.add_argument("--baseline", help="Results file to compare the medians against.")
+    parser.add_argument("--output", help="Results file, stdout by default.")
+    parser.add_argument("--logger-probe", choices=[m.value for m in LogMode], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if min(args.widths) < 1:
+        parser.error("Entity widths start at 1 column, the key.")
+
+    if args.logger_probe:
+        probe_logger(args.logger_probe, args.logger_calls)
+        return
+
+    # Only warnings are logged while measuring, the Logger cases measure logging itself.
+    configure_logging(mode=LogMode.PRODUCTION, log_level="WARNING", force=True)
+
+    workspace = Path(args.workspace) if args.workspace else Path(tempfile.mkdtemp(prefix="ygg-benchmarks-"))
+    YggSetup(config_data=get_config(workspace))
+    (workspace / "data" / CATALOG).mkdir(parents=True, exist_ok=True)
+
+    generator = SyntheticDataGenerator(seed=args.seed)
+    started = time.time()
+    results: list[dict] = []
+    skipped: list[dict] = []
+    try:
+        for width in args.widths:
+            polyglot, model_results = run_model_cases(generator, width, args.records, args.repeat)
+            results += model_results
+
+            if args.skip_catalog:
+                continue
+
+            try:
+                results += run_catalog_cases(
+                    generator, polyglot, width, args.records, args.repeat, args.max_single_writes
+                )
+            except duckdb.Error as e:
+                # e.g. the DuckLake extension is not installed and cannot be downloaded.
+                skipped.append({"case": "catalog", "width": width, "reason": str(e)})
+                print(f"Catalog cases skipped, width={width}: {e}", file=sys.stderr)
+
+        results += run_logger_cases(args.logger_calls)
+
+    finally:
+        if not args.workspace:
+            shutil.rmtree(workspace, ignore_errors=True)
+
+    if args.baseline:
+        compare(results, Path(args.baseline))
+
+    document = {
+        "suite": SUITE,
+        "version": get_version(),
+        "git_commit": get_git_commit(),
+        "started_at": started,
+        "seconds": time.time() - started,
+        "environment": get_environment(),
+        "parameters": {
+            "widths": args.widths,
+            "records": args.records,
+            "repeat": args.repeat,
+            "seed": args.seed,
+            "max_single_writes": args.max_single_writes,
+            "logger_calls": args.logger_calls,
+        },
+        "results": results,
+        "skipped": skipped,
+    }
+
+    output = json.dumps(document, indent=2)
+    if args.output:
+        Path(args.output).write_text(output + "\n")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+"""Load test of the local HTTP ingestion service.
+
+Runs concurrent keep-alive clients posting records, each with a unique key, and reports throughput, latency
+percentiles and the micro-batch stats of the service. Records are generated from a contract schema with a seed,
+so runs post the same records, or copied from a template record.
+
+    python -m benchmarks.ingestion_load_test --entity contract --schema-file contract.yaml --seed 7 --clients 16
+    python -m benchmarks.ingestion_load_test --entity contract --record-file record.json --clients 16
+"""
+
+import argparse
+import copy
+import http.client
+import json
+import statistics
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Callable
+from urllib.parse import urlsplit
+
+from ygg.helpers.synthetic_data import SyntheticDataGenerator
+from ygg.utils.commons import get_yaml_content
+
+Batches = Callable[[int, int], list[dict]]
+
+
+def get_template_batches(template: dict, key_field: str, records: int, run_id: int) -> Batches:
+    """Get the batches of a client and request, copies of the template record with a unique key."""
+
+    def batch(client: int, request: int) -> list[dict]:
+        batch_records = []
+        for i in range(records):
+            record = copy.deepcopy(template)
+            record[key_field] = f"load_{run_id}_{client}_{request}_{i}"
+            batch_records.append(record)
+        return batch_records
+
+    return batch
+
+
+def get_synthetic_batches(generator: SyntheticDataGenerator, schema: dict, records: int, run_id: int) -> Batches:
+    """Get the batches of a client and request, synthetic records of the contract schema."""
+
+    def batch(client: int, request: int) -> list[dict]:
+        return list(generator.records(schema, records, start=request * records, prefix=f"load-{run_id}-{client}"))
+
+    return batch
+
+
+def run_client(url: str, entity: str, batches: Batches, client: int, args: argparse.Namespace, results: dict) -> None:
+    """Post the requests of one client over a single keep-alive connection."""
+
+    target = urlsplit(url)
+    connection = http.client.HTTPConnection(target.hostname, target.port, timeout=args.timeout)
+    latencies: list[float] = []
+    statuses: Counter = Counter()
+
+    for request in range(args.requests):
+        body = json.dumps(batches(client, request), default=str).encode("utf-8")
+        start = time.perf_counter()
+        connection.request(
+            "POST", f"/entities/{entity}/records", body=body, headers={"Content-Type": "application/json"}
+        )
+        response = connection.getresponse()
+        response.read()
+        latencies.append(time.perf_counter() - start)
+        statuses[response.status] += 1
+
+    connection.close()
+    results[client] = (latencies, statuses)
+
+
+def get_status(url: str) -> list[dict]:
+    """Get the micro-batch stats of the service."""
+
+    target = urlsplit(url)
+    connection = http.client.HTTPConnection(target.hostname, target.port, timeout=10)
+    connection.request("GET", "/status")
+    status = json.loads(connection.getresponse().read())
+    connection.close()
+    return status
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Ygg ingestion service load test")
+    parser.add_argument("--url", default="http://127.0.0.1:8765", help="Ingestion service URL.")
+    parser.add_argument("--entity", required=True, help="Entity the records are posted to.")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--schema-file", help="Contract schema YAML or JSON file the records are generated from.")
+    source.add_argument("--record-file", help="JSON file with the template record.")
+    parser.add_argument("--odcs-file", help="ODCS schema file, for schema properties bound to ODCS.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the synthetic records.")
+    parser.add_argument("--invalid-ratio", type=float, default=0.0, help="Share of synthetic records made invalid.")
+    parser.add_argument("--run-id", type=int, help="Run id in the record keys, the current time by default.")
+    parser.add_argument("--key-field", default="id", help="Template record field made unique for every record.")
+    parser.add_argument("--clients", type=int, default=16, help="Number of concurrent clients.")
+    parser.add_argument("--requests", type=int, default=100, help="Requests posted by every client.")
+    parser.add_argument("--records", type=int, default=10, help="Records per request.")
+    parser.add_argument("--timeout", type=float, default=60.0, help="Request timeout in seconds.")
+    args = parser.parse_args()
+
+    # The run id keeps the keys of two runs apart, a key already in the catalog is skipped.
+    run_id = args.run_id if args.run_id is not None else int(time.time())
+    if args.schema_file:
+        generator = SyntheticDataGenerator(
+            seed=args.seed,
+            invalid_ratio=args.invalid_ratio,
+            odcs_reference=get_yaml_content(args.odcs_file) if args.odcs_file else None,
+        )
+        batches = get_synthetic_batches(generator, get_yaml_content(args.schema_file), args.records, run_id)
+    else:
+        template = json.loads(Path(args.record_file).read_text())
+        batches = get_template_batches(template, args.key_field, args.records, run_id)
+
+    results: dict[int, tuple[list[float], Counter]] = {}
+    threads = [
+        threading.Thread(target=run_client, args=(args.url, args.entity, batches, c, args, results))
+        for c in range(args.clients)
+    ]
+
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    latencies = sorted(latency for client_latencies, _ in results.values() for latency in client_latencies)
+    statuses: Counter = sum((client_statuses for _, client_statuses in results.values()), Counter())
+    percentiles = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else latencies * 99
+    requests = len(latencies)
+
+    summary = {
+        "run_id": run_id,
+        "seed": args.seed if args.schema_file else None,
+        "clients": args.clients,
+        "requests": requests,
+        "records": requests * args.records,
+        "seconds": round(elapsed, 3),
+        "requests_per_second": round(requests / elapsed, 2),
+        "records_per_second": round(requests * args.records / elapsed, 2),
+        "latency_ms": {
+            "p50": round(percentiles[49] * 1000, 2),
+            "p95": round(percentiles[94] * 1000, 2),
+            "p99": round(percentiles[98] * 1000, 2),
+            "max": round(latencies[-1] * 1000, 2),
+        },
+        "statuses": {str(k): v for k, v in sorted(statuses.items())},
+        "service": get_status(args.url),
+    }
+    print(json.dumps(summary, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -3,12 +3,91 @@ import os
 
 from dotenv import load_dotenv
 
-from ygg.services.ygg_service import YggService
-from ygg.utils.ygg_logs import get_logger
+from ygg.config import YggSetup
+from ygg.core.bulk_registration import BulkRegistration
+from ygg.core.contract_graph_writer import ContractGraphLevel, ContractGraphWriter
+from ygg.core.contract_registration import ContractRegistration
+from ygg.core.contract_watcher import ContractWatcher
+from ygg.core.data_contract_loader import DataContractLoader
+from ygg.core.folder_registration import FolderRegistration
+from ygg.core.polyglot_contract import PolyglotContract
+from ygg.helpers.enums import Model
+from ygg.polyglot.polyglot import Polyglot
+from ygg.polyglot.quack_profiler import configure_profiler
+from ygg.services.ingestion_service import IngestionService
+from ygg.utils.commons import get_file_content_signature, get_yaml_content
+from ygg.utils.ygg_logs import configure_logging, get_logger
+from ygg.utils.ygg_metrics import configure_metrics
 
 logs = get_logger(logger_name="YggCli")
 
 load_dotenv()
+# Logger settings may come from the .env file, loaded after the modules configured logging on import.
+configure_logging(force=True)
+configure_metrics()
+configure_profiler()
+
+
+def get_ygg_service():
+    """Get the Ygg service behind the setup and build modes, imported once one of them runs."""
+
+    # The service module is not shipped with this package, the other modes run without it.
+    from ygg.services.ygg_service import YggService
+
+    return YggService
+
+
+def get_model_schema(value: str) -> tuple[Model, str]:
+    """Get the model and file of a MODEL=FILE model schema argument."""
+
+    model, _, file = value.partition("=")
+    try:
+        return Model(model), file
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Model schema must be MODEL=FILE, MODEL one of {[m.value for m in Model]}.")
+
+
+def get_contracts(args: argparse.Namespace) -> list[tuple[PolyglotContract, str]]:
+    """Load the schema config once and set up the contract of every model schema, with its document path."""
+
+    missing = [a for a in ("config", "schema_config", "odcs_schema", "model_schema") if not getattr(args, a)]
+    if missing:
+        logs.error("Contract settings not informed.", settings=missing)
+        raise ValueError(f"Contract settings not informed: {missing}")
+
+    YggSetup(config_data=get_yaml_content(args.config))
+    schema_config = get_yaml_content(args.schema_config)
+    odcs_reference = FolderRegistration.load_document(args.odcs_schema)
+
+    contracts: list[tuple[PolyglotContract, str]] = []
+    for model, model_schema_file in args.model_schema:
+        model_schema = get_yaml_content(model_schema_file)
+        loader = DataContractLoader(
+            model=model,
+            data_contract_schema_config=dict(schema_config),
+            odcs_schema_reference=odcs_reference,
+            data_contract_schema=dict(model_schema),
+            catalog_name=args.catalog,
+            odcs_schema_signature=get_file_content_signature(args.odcs_schema),
+        )
+        polyglot = Polyglot(loader.polyglot_entity)
+        polyglot.build()
+        contracts.append(
+            (PolyglotContract(entity=polyglot).setup(evolve=args.evolve), model_schema.get("document_path", ""))
+        )
+
+    return contracts
+
+
+def get_graph_writer(contracts: list[tuple[PolyglotContract, str]]) -> ContractGraphWriter:
+    """Get the writer of the contract documents, the first model schema is the document itself."""
+
+    return ContractGraphWriter(
+        [
+            ContractGraphLevel(contract=contract, document_path=document_path if i else "")
+            for i, (contract, document_path) in enumerate(contracts)
+        ]
+    )
 
 
 def main():
@@ -24,23 +103,94 @@ def main():
     parser.add_argument("-c", "--create-db", action="store_true", help="Create the Ygg database.")
     parser.add_argument("-s", "--setup", action="store_true", help="Setup Ygg DuckLake.")
     parser.add_argument("-b", "--build", action="store_true", help="Build the data contract.")
+    parser.add_argument(
+        "--bulk",
+        action="store_true",
+        help="Stream the records of the contract file into the first model schema entity, checkpointing every chunk.",
+    )
+    parser.add_argument(
+        "--resume", action="store_true", help="Resume the bulk registration run from its last committed checkpoint."
+    )
+    parser.add_argument("--run-name", default="default", help="Name of the registration run the checkpoints belong to.")
+    parser.add_argument(
+        "--folder", action="store_true", help="Register every contract file found in the contracts input folder."
+    )
+    parser.add_argument(
+        "--include", action="append", help="Glob of the contract files to register in folder mode, repeatable."
+    )
+    parser.add_argument(
+        "--exclude", action="append", help="Glob of the contract files to skip in folder mode, repeatable."
+    )
+    parser.add_argument("--workers", type=int, default=4, help="Number of files registered at once in folder mode.")
+    parser.add_argument("--config", default=os.getenv("YGG_CONFIG_FILE"), help="Ygg config file.")
+    parser.add_argument(
+        "--schema-config", default=os.getenv("YGG_SCHEMA_CONFIG_FILE"), help="Schema config file of the models."
+    )
+    parser.add_argument("--odcs-schema", default=os.getenv("YGG_ODCS_SCHEMA_FILE"), help="ODCS JSON schema file.")
+    parser.add_argument(
+        "--model-schema",
+        action="append",
+        type=get_model_schema,
+        help="Model schema as MODEL=FILE, repeatable, parents first. Each model below the first is found at the "
+        "document_path of its schema inside its parent.",
+    )
+    parser.add_argument("--catalog", default="ygg", help="DuckLake catalog the contracts are registered in.")
+    parser.add_argument(
+        "--evolve", action="store_true", help="Alter the existing DuckLake tables to the model schema columns."
+    )
+    parser.add_argument(
+        "--watch", action="store_true", help="Keep running and register the contract files as they change."
+    )
+    parser.add_argument("--poll-interval", type=float, default=0.5, help="Seconds between polls in watch mode.")
+    parser.add_argument("--status-file", help="File the watch mode status and latency counters are written to.")
+    parser.add_argument("--serve", action="store_true", help="Serve the local HTTP ingestion service.")
+    parser.add_argument("--host", default="127.0.0.1", help="Host the ingestion service listens on.")
+    parser.add_argument("--port", type=int, default=8765, help="Port the ingestion service listens on.")
 
     args = parser.parse_args()
     contracts_input_folder = os.getenv("CONTRACTS_INPUT_FOLDER", None)
 
     if args.setup:
         logs.info("Setting up Ygg DuckLake")
-        YggService.setup()
+        get_ygg_service().setup()
+
+    if args.serve:
+        contracts = [contract for contract, _ in get_contracts(args)]
+        IngestionService(contracts, host=args.host, port=args.port).serve_forever()
+
+    if contracts_input_folder and args.folder and args.register_contract:
+        registration = FolderRegistration(get_graph_writer(get_contracts(args)), workers=args.workers)
+        summary = registration.register(contracts_input_folder, include=args.include, exclude=args.exclude)
+        if summary.failures:
+            raise SystemExit(1)
+
+    if contracts_input_folder and args.watch:
+        watcher = ContractWatcher(
+            FolderRegistration(get_graph_writer(get_contracts(args))),
+            contracts_input_folder,
+            include=args.include,
+            exclude=args.exclude,
+            poll_interval=args.poll_interval,
+            status_file=args.status_file,
+        )
+        watcher.run()
 
     if contracts_input_folder and args.file:
         contracts_input_folder = contracts_input_folder + "/"
         contract_data_path = contracts_input_folder + args.file
 
-        if args.register_contract:
-            YggService.register_data_contract(contract_data=contract_data_path, insert_on_conflict_ignore=True)
+        if args.register_contract and args.bulk:
+            contract, document_path = get_contracts(args)[0]
+            registration = BulkRegistration(contract, run_name=args.run_name, document_path=document_path)
+            registration.register([contract_data_path], resume=args.resume)
+
+        elif args.register_contract:
+            document = FolderRegistration.load_document(contract_data_path)
+            registration = ContractRegistration.from_graph(get_graph_writer(get_contracts(args)), document)
+            registration.register()
 
     if args.build:
-        YggService.build_contract(contract_data=contract_data_path)
+        get_ygg_service().build_contract(contract_data=contract_data_path)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,137 @@
+"""Resumed bulk runs must skip completed files, continue unfinished ones and restart changed ones."""
+
+import json
+import os
+from pathlib import Path
+
+import duckdb
+import pytest
+
+from ygg.core.bulk_registration import BulkRegistration
+from ygg.core.polyglot_contract import PolyglotContract
+from ygg.helpers.data_types import get_data_type
+from ygg.helpers.logical_data_models import PolyglotEntity, PolyglotEntityColumn, PolyglotEntityColumnDataType
+from ygg.polyglot.checkpoint_store import CheckpointStore
+from ygg.polyglot.polyglot import build_dynamic_model
+from ygg.polyglot.quack_signature import RECORD_HASH_COLUMN
+
+
+class StoredContract(PolyglotContract):
+    """Contract whose catalog is a local DuckDb file instead of DuckLake, counting its writes."""
+
+    def __init__(self, entity: PolyglotEntity, catalog_file: Path):
+        columns = ", ".join(f"{c.name} {c.data_type.duck_db_type}" for c in entity.columns)
+
+        self._entity = entity
+        self._model = build_dynamic_model(entity)
+        self._model.bind_polyglot_entity(entity)
+        self._reports_snapshots = False
+        self._PolyglotContract__first_layer_instructions = [
+            f"CREATE SCHEMA IF NOT EXISTS {entity.schema_}",
+            f"CREATE TABLE {entity.schema_}.{entity.name} ({columns}, PRIMARY KEY (id))",
+        ]
+        self._PolyglotContract__second_layer_instructions = [f"ATTACH '{catalog_file}' AS {entity.catalog}"]
+        with duckdb.connect(str(catalog_file)) as con:
+            con.execute(f"CREATE SCHEMA IF NOT EXISTS {entity.schema_}")
+            con.execute(f"CREATE TABLE IF NOT EXISTS {entity.schema_}.{entity.name} ({columns})")
+
+        self.writes: int = 0
+
+    def write_staged(self, *args, **kwargs) -> int | None:
+        self.writes += 1
+        return super().write_staged(*args, **kwargs)
+
+
+def get_column(name: str, data_type_name: str, **kwargs) -> PolyglotEntityColumn:
+    """Get a nullable entity column of a Ygg data type."""
+
+    physical_type: str = get_data_type(data_type_name, "physical")["type"]
+    return PolyglotEntityColumn(
+        name=name,
+        alias=name,
+        nullable=True,
+        data_type=PolyglotEntityColumnDataType(
+            data_type_name=data_type_name, duck_db_type=physical_type, duck_lake_type=physical_type
+        ),
+        **kwargs,
+    )
+
+
+ENTITY: PolyglotEntity = PolyglotEntity(
+    name="events",
+    catalog="registry",
+    schema_="ygg",
+    columns=[
+        get_column("id", "string", primary_key=True),
+        get_column("name", "string"),
+        get_column(RECORD_HASH_COLUMN, "string", skip_from_signature=True),
+    ],
+)
+
+
+def write_records(file: Path, names: list[str]) -> Path:
+    """Write an NDJSON record file, one record per name."""
+
+    file.write_text("".join(json.dumps({"id": n, "name": n}) + "\n" for n in names))
+    return file
+
+
+def get_stored_ids(catalog_file: Path) -> list[str]:
+    """Get the id of every stored record, duplicates included."""
+
+    with duckdb.connect(str(catalog_file)) as con:
+        return [r[0] for r in con.execute(f"SELECT id FROM {ENTITY.schema_}.{ENTITY.name} ORDER BY id").fetchall()]
+
+
+@pytest.fixture
+def registration(tmp_path) -> BulkRegistration:
+    """Get a bulk registration of two record chunks, checkpointed next to its catalog."""
+
+    contract = StoredContract(ENTITY, tmp_path / "catalog.duckdb")
+    checkpoints = CheckpointStore(tmp_path / "checkpoints.duckdb")
+    return BulkRegistration(contract, checkpoints=checkpoints, run_name="run", chunk_size=2)
+
+
+def test_completed_file_is_skipped(registration, tmp_path):
+    file = write_records(tmp_path / "events.ndjson", ["a", "b", "c"])
+
+    [report] = registration.register([file], upsert=False)
+    assert (report.records, report.chunks) == (3, 2)
+
+    assert registration.register([file], resume=True, upsert=False) == []
+    assert registration._contract.writes == 2
+    assert get_stored_ids(tmp_path / "catalog.duckdb") == ["a", "b", "c"]
+
+
+def test_interrupted_file_resumes_after_its_last_committed_chunk(registration, tmp_path, monkeypatch):
+    file = write_records(tmp_path / "events.ndjson", ["a", "b", "c", "d", "e"])
+    contract = registration._contract
+    write_staged = contract.write_staged
+
+    def stop_on_second_chunk(*args, **kwargs):
+        if contract.writes == 1:
+            raise RuntimeError("Run stopped.")
+        return write_staged(*args, **kwargs)
+
+    monkeypatch.setattr(contract, "write_staged", stop_on_second_chunk)
+    with pytest.raises(RuntimeError, match="Run stopped."):
+        registration.register([file], upsert=False)
+    monkeypatch.undo()
+
+    [report] = registration.register([file], resume=True, upsert=False)
+
+    assert report.records == 3
+    assert registration._checkpoints.get("run", file, ENTITY.name).records == 5
+    assert get_stored_ids(tmp_path / "catalog.duckdb") == ["a", "b", "c", "d", "e"]
+
+
+def test_changed_file_starts_over(registration, tmp_path):
+    file = write_records(tmp_path / "events.ndjson", ["a", "b"])
+    registration.register([file], upsert=False)
+
+    write_records(file, ["a", "b", "c"])
+    os.utime(file, ns=(0, 0))
+    [report] = registration.register([file], resume=True)
+
+    assert report.records == 3
+    assert registration._checkpoints.get("run", file, ENTITY.name).completed
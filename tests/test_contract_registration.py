@@ -0,0 +1,202 @@
+"""Incremental registration must only touch the nodes of its scope whose signature changed."""
+
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import duckdb
+import pytest
+
+from ygg.core.contract_graph_writer import ContractGraphLevel, ContractGraphWriter
+from ygg.core.contract_registration import ContractRegistration, RegistrationLevel
+from ygg.core.polyglot_contract import PolyglotContract
+from ygg.helpers.data_types import get_data_type
+from ygg.helpers.logical_data_models import PolyglotEntity, PolyglotEntityColumn, PolyglotEntityColumnDataType
+from ygg.polyglot.polyglot import build_dynamic_model
+from ygg.polyglot.quack_signature import RECORD_HASH_COLUMN
+
+CREATED: datetime = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+class StoredContract(PolyglotContract):
+    """Contract whose catalog is a local DuckDb file instead of DuckLake."""
+
+    def __init__(self, entity: PolyglotEntity, catalog_file: Path):
+        columns = ", ".join(f"{c.name} {c.data_type.duck_db_type}" for c in entity.columns)
+        primary_key = ", ".join(c.name for c in entity.columns if c.primary_key)
+
+        self._entity = entity
+        self._model = build_dynamic_model(entity)
+        self._model.bind_polyglot_entity(entity)
+        self._PolyglotContract__first_layer_instructions = [
+            f"CREATE SCHEMA IF NOT EXISTS {entity.schema_}",
+            f"CREATE TABLE {entity.schema_}.{entity.name} ({columns}, PRIMARY KEY ({primary_key}))",
+        ]
+        self._PolyglotContract__second_layer_instructions = [f"ATTACH '{catalog_file}' AS {entity.catalog}"]
+        with duckdb.connect(str(catalog_file)) as con:
+            con.execute(f"CREATE SCHEMA IF NOT EXISTS {entity.schema_}")
+            con.execute(f"CREATE TABLE IF NOT EXISTS {entity.schema_}.{entity.name} ({columns})")
+
+
+def get_column(name: str, data_type_name: str, **kwargs) -> PolyglotEntityColumn:
+    """Get a nullable entity column of a Ygg data type."""
+
+    physical_type: str = get_data_type(data_type_name, "physical")["type"]
+    return PolyglotEntityColumn(
+        name=name,
+        alias=name,
+        nullable=True,
+        data_type=PolyglotEntityColumnDataType(
+            data_type_name=data_type_name, duck_db_type=physical_type, duck_lake_type=physical_type
+        ),
+        **kwargs,
+    )
+
+
+def get_entity(**kwargs) -> PolyglotEntity:
+    """Get an entity keyed by a boolean and a timestamp, scoped by its contract."""
+
+    return PolyglotEntity(
+        name="keyed",
+        catalog="registry",
+        schema_="ygg",
+        columns=[
+            get_column("contract_id", "string"),
+            get_column("active", "boolean", primary_key=True),
+            # Records holding timestamps are not signable, the key is kept out of the signature.
+            get_column("created", "timestamp", primary_key=True, skip_from_signature=True),
+            get_column("name", "string"),
+            get_column(RECORD_HASH_COLUMN, "string", skip_from_signature=True),
+        ],
+        **kwargs,
+    )
+
+
+def get_registration(tmp_path: Path, **kwargs) -> tuple[ContractRegistration, Path]:
+    """Get the registration of contract c1 against a catalog holding a stored, a changed and a removed node of it."""
+
+    contract = StoredContract(get_entity(**kwargs), tmp_path / "catalog.duckdb")
+    stored = contract.model(contract_id="c1", active=True, created=CREATED, name="stored")
+    changed = contract.model(contract_id="c1", active=False, created=CREATED, name="edited")
+    inserted = contract.model(contract_id="c1", active=True, created=CREATED + timedelta(days=1), name="inserted")
+
+    catalog_file = tmp_path / "catalog.duckdb"
+    with duckdb.connect(str(catalog_file)) as con:
+        con.executemany(
+            "INSERT INTO ygg.keyed VALUES (?, ?, ?, ?, ?)",
+            [
+                ["c1", True, CREATED.astimezone(timezone(timedelta(hours=2))), "stored", stored.record_signature],
+                ["c1", False, CREATED, "original", "outdated"],
+                ["c1", False, CREATED - timedelta(days=1), "removed", "removed"],
+                ["c2", True, CREATED - timedelta(days=2), "other", "other contract"],
+            ],
+        )
+
+    level = RegistrationLevel(contract=contract, records=[stored, changed, inserted], scope={"contract_id": "c1"})
+    return ContractRegistration([level]), catalog_file
+
+
+def get_stored_names(catalog_file: Path) -> list[tuple]:
+    """Get the contract and name of every stored node."""
+
+    with duckdb.connect(str(catalog_file)) as con:
+        return con.execute("SELECT contract_id, name FROM ygg.keyed ORDER BY contract_id, name").fetchall()
+
+
+def test_boolean_and_timestamp_keys_match_the_stored_ones(tmp_path):
+    registration, _ = get_registration(tmp_path)
+
+    [diff] = registration.diff()
+
+    assert diff.unchanged == 1
+    assert diff.changed == [(False, CREATED)]
+    assert diff.inserted == [(True, CREATED + timedelta(days=1))]
+    assert diff.removed == [(False, CREATED - timedelta(days=1))]
+
+
+def test_changed_nodes_are_replaced_when_updates_are_not_allowed(tmp_path):
+    registration, catalog_file = get_registration(tmp_path, update_allowed=False, delete_allowed=False)
+
+    [diff] = registration.register()
+
+    assert get_stored_names(catalog_file) == [
+        ("c1", "edited"),
+        ("c1", "inserted"),
+        ("c1", "removed"),
+        ("c1", "stored"),
+        ("c2", "other"),
+    ]
+    assert diff.kept == diff.removed == [(False, CREATED - timedelta(days=1))]
+    assert registration.diff()[0].changed == []
+
+
+def test_removed_nodes_are_deleted_within_the_scope(tmp_path):
+    registration, catalog_file = get_registration(tmp_path, delete_allowed=True)
+
+    [diff] = registration.register()
+
+    assert get_stored_names(catalog_file) == [("c1", "edited"), ("c1", "inserted"), ("c1", "stored"), ("c2", "other")]
+    assert diff.kept == []
+
+
+def test_planned_signatures_are_written(tmp_path, monkeypatch):
+    registration, catalog_file = get_registration(tmp_path)
+    plan = registration._plan()
+
+    def sign_again(*_):
+        pytest.fail("Records must not be signed again.")
+
+    monkeypatch.setattr(ContractRegistration, "_plan", lambda _: plan)
+    monkeypatch.setattr(type(registration._levels[0].records[0]), "_get_record_signature", staticmethod(sign_again))
+    registration.register()
+
+    with duckdb.connect(str(catalog_file)) as con:
+        assert con.execute(f"SELECT count(*) FROM ygg.keyed WHERE {RECORD_HASH_COLUMN} = 'outdated'").fetchone() == (0,)
+
+
+def test_levels_must_be_scoped(tmp_path):
+    contract = StoredContract(get_entity(), tmp_path / "catalog.duckdb")
+
+    with pytest.raises(ValueError, match="must be scoped"):
+        ContractRegistration([RegistrationLevel(contract=contract, records=[], scope={})])
+
+
+def get_graph_writer(tmp_path: Path) -> ContractGraphWriter:
+    """Get the writer of contract documents holding their keyed nodes."""
+
+    contract = PolyglotEntity(
+        name="contract",
+        catalog="registry",
+        schema_="ygg",
+        columns=[
+            get_column("id", "string", primary_key=True),
+            get_column("name", "string"),
+            get_column(RECORD_HASH_COLUMN, "string", skip_from_signature=True),
+        ],
+    )
+    return ContractGraphWriter(
+        [
+            ContractGraphLevel(contract=StoredContract(contract, tmp_path / "catalog.duckdb")),
+            ContractGraphLevel(
+                contract=StoredContract(get_entity(), tmp_path / "catalog.duckdb"), document_path="nodes"
+            ),
+        ]
+    )
+
+
+def test_contract_document_levels_are_scoped_by_its_id(tmp_path):
+    document = {"id": "c1", "name": "first", "nodes": [{"active": True, "created": CREATED, "name": "node"}]}
+
+    registration = ContractRegistration.from_graph(get_graph_writer(tmp_path), document)
+    registration.register()
+    document["nodes"].append({"active": False, "created": CREATED, "name": "added"})
+    diffs = ContractRegistration.from_graph(get_graph_writer(tmp_path), document).diff()
+
+    assert [level.scope for level in registration._levels] == [{"id": "c1"}, {"contract_id": "c1"}]
+    assert [(d.unchanged, d.inserted) for d in diffs] == [(1, []), (1, [(False, CREATED)])]
+
+
+def test_contract_document_with_invalid_records_is_not_registered(tmp_path):
+    document = {"id": "c1", "nodes": [{"active": "neither", "created": CREATED}]}
+
+    with pytest.raises(ValueError, match="invalid records"):
+        ContractRegistration.from_graph(get_graph_writer(tmp_path), document)
@@ -0,0 +1,120 @@
+"""The contract watcher must register a settled change once and skip touched files whose content is unchanged."""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from ygg.core import contract_watcher
+from ygg.core.contract_watcher import ContractWatcher
+from ygg.core.folder_registration import FolderRegistration
+from ygg.helpers.logical_data_models import FileRegistrationReport
+
+
+class RecordedRegistration(FolderRegistration):
+    """Folder registration recording the documents it is handed instead of writing them."""
+
+    def __init__(self):
+        self.documents: list[tuple[str, dict]] = []
+        self.error: str | None = None
+
+    def register_file(self, file, upsert=True, document=None) -> FileRegistrationReport:
+        self.documents.append((Path(file).name, document))
+        return FileRegistrationReport(file=str(file), rows=1, error=self.error)
+
+    def close(self) -> None:
+        pass
+
+
+class Clock:
+    """Monotonic clock moved by hand."""
+
+    def __init__(self):
+        self.now: float = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch) -> Clock:
+    """Get the clock of the watcher debounce."""
+
+    clock = Clock()
+    monkeypatch.setattr(contract_watcher.time, "monotonic", clock)
+    return clock
+
+
+def write_contract(file: Path, name: str, mtime: int) -> None:
+    """Write a contract document, stamped with its own modification time."""
+
+    file.write_text(json.dumps({"name": name}))
+    os.utime(file, ns=(mtime, mtime))
+
+
+def get_watcher(tmp_path: Path, **kwargs) -> tuple[ContractWatcher, RecordedRegistration]:
+    """Get a watcher of a folder holding the orders contract, debouncing changes for a second."""
+
+    (tmp_path / "contracts").mkdir()
+    write_contract(tmp_path / "contracts" / "orders.json", "orders", 1)
+    registration = RecordedRegistration()
+    return ContractWatcher(registration, tmp_path / "contracts", debounce=1.0, **kwargs), registration
+
+
+def test_initial_sync_registers_the_files_found(tmp_path, clock):
+    watcher, registration = get_watcher(tmp_path)
+
+    assert watcher.poll_once() == 1
+    clock.now += 5
+    assert watcher.poll_once() == 0
+    assert registration.documents == [("orders.json", {"name": "orders"})]
+
+
+def test_change_is_registered_once_it_settles(tmp_path, clock):
+    watcher, registration = get_watcher(tmp_path, initial_sync=False)
+    file = tmp_path / "contracts" / "orders.json"
+    watcher.poll_once()
+
+    write_contract(file, "half saved", 2)
+    assert watcher.poll_once() == 0
+
+    # A second write restarts the debounce.
+    clock.now += 0.6
+    write_contract(file, "saved", 3)
+    assert watcher.poll_once() == 0
+    clock.now += 0.6
+    assert watcher.poll_once() == 0
+    assert watcher.status.pending == 1
+
+    clock.now += 0.6
+    assert watcher.poll_once() == 1
+    assert registration.documents == [("orders.json", {"name": "saved"})]
+    assert watcher.status.pending == 0
+
+
+def test_touched_file_with_unchanged_content_is_skipped(tmp_path, clock):
+    watcher, registration = get_watcher(tmp_path)
+    watcher.poll_once()
+
+    write_contract(tmp_path / "contracts" / "orders.json", "orders", 2)
+    watcher.poll_once()
+    clock.now += 1
+    assert watcher.poll_once() == 0
+
+    assert len(registration.documents) == 1
+    assert (watcher.status.registered, watcher.status.unchanged) == (1, 1)
+
+
+def test_failed_registration_is_retried_on_the_next_change(tmp_path, clock):
+    watcher, registration = get_watcher(tmp_path)
+    registration.error = "Catalog unavailable."
+    assert watcher.poll_once() == 0
+    assert watcher.status.last_error == "Catalog unavailable."
+
+    registration.error = None
+    write_contract(tmp_path / "contracts" / "orders.json", "orders", 2)
+    watcher.poll_once()
+    clock.now += 1
+    assert watcher.poll_once() == 1
+    assert (watcher.status.registered, watcher.status.failed, watcher.status.unchanged) == (1, 1, 0)
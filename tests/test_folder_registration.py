@@ -0,0 +1,67 @@
+"""Folder registration must only pick the contract files its include and exclude patterns select."""
+
+from pathlib import Path
+
+import pytest
+
+from ygg.core.folder_registration import FolderRegistration
+
+
+def get_folder(tmp_path: Path) -> Path:
+    """Get a contracts folder holding contracts, drafts and files of other kinds."""
+
+    for name in [
+        "orders.yaml",
+        "customers.yml",
+        "payments.json",
+        "README.md",
+        "domain/invoices.yaml",
+        "domain/drafts/refunds.yaml",
+        "drafts/returns.json",
+    ]:
+        file = tmp_path / "contracts" / name
+        file.parent.mkdir(parents=True, exist_ok=True)
+        file.write_text("{}")
+
+    # A folder named like a contract is not a file to register.
+    (tmp_path / "contracts" / "archive.yaml").mkdir()
+    return tmp_path / "contracts"
+
+
+def get_names(folder: Path, files: list[Path]) -> list[str]:
+    """Get the paths of the files relative to their folder."""
+    return [f.relative_to(folder).as_posix() for f in files]
+
+
+def test_default_patterns_find_every_contract_file(tmp_path):
+    folder = get_folder(tmp_path)
+
+    assert get_names(folder, FolderRegistration.discover(folder)) == [
+        "customers.yml",
+        "domain/drafts/refunds.yaml",
+        "domain/invoices.yaml",
+        "drafts/returns.json",
+        "orders.yaml",
+        "payments.json",
+    ]
+
+
+def test_overlapping_include_patterns_find_a_file_once(tmp_path):
+    folder = get_folder(tmp_path)
+
+    files = FolderRegistration.discover(folder, include=["*.yaml", "orders.*", "domain/*.yaml"])
+
+    assert get_names(folder, files) == ["domain/invoices.yaml", "orders.yaml"]
+
+
+def test_exclude_patterns_match_paths_relative_to_the_folder(tmp_path):
+    folder = get_folder(tmp_path)
+
+    files = FolderRegistration.discover(folder, exclude=["drafts/*", "*/drafts/*", "*.json"])
+
+    assert get_names(folder, files) == ["customers.yml", "domain/invoices.yaml", "orders.yaml"]
+
+
+def test_missing_folder_is_rejected(tmp_path):
+    with pytest.raises(ValueError, match="not found"):
+        FolderRegistration.discover(tmp_path / "missing")
@@ -0,0 +1,140 @@
+"""Concurrent ingestion requests of an entity must be committed together and fail together."""
+
+from pathlib import Path
+
+import duckdb
+import pytest
+
+from ygg.core.polyglot_contract import PolyglotContract
+from ygg.helpers.data_types import get_data_type
+from ygg.helpers.logical_data_models import PolyglotEntity, PolyglotEntityColumn, PolyglotEntityColumnDataType
+from ygg.polyglot.polyglot import build_dynamic_model
+from ygg.polyglot.quack_signature import RECORD_HASH_COLUMN
+from ygg.services.ingestion_service import MicroBatcher
+
+
+class StoredContract(PolyglotContract):
+    """Contract whose catalog is a local DuckDb file instead of DuckLake."""
+
+    def __init__(self, entity: PolyglotEntity, catalog_file: Path):
+        columns = ", ".join(f"{c.name} {c.data_type.duck_db_type}" for c in entity.columns)
+
+        self._entity = entity
+        self._model = build_dynamic_model(entity)
+        self._model.bind_polyglot_entity(entity)
+        self._reports_snapshots = False
+        self._PolyglotContract__first_layer_instructions = [
+            f"CREATE SCHEMA IF NOT EXISTS {entity.schema_}",
+            f"CREATE TABLE {entity.schema_}.{entity.name} ({columns}, PRIMARY KEY (id))",
+        ]
+        self._PolyglotContract__second_layer_instructions = [f"ATTACH '{catalog_file}' AS {entity.catalog}"]
+        with duckdb.connect(str(catalog_file)) as con:
+            con.execute(f"CREATE SCHEMA IF NOT EXISTS {entity.schema_}")
+            con.execute(f"CREATE TABLE IF NOT EXISTS {entity.schema_}.{entity.name} ({columns}, PRIMARY KEY (id))")
+
+
+def get_column(name: str, data_type_name: str, **kwargs) -> PolyglotEntityColumn:
+    """Get a nullable entity column of a Ygg data type."""
+
+    physical_type: str = get_data_type(data_type_name, "physical")["type"]
+    return PolyglotEntityColumn(
+        name=name,
+        alias=name,
+        nullable=True,
+        data_type=PolyglotEntityColumnDataType(
+            data_type_name=data_type_name, duck_db_type=physical_type, duck_lake_type=physical_type
+        ),
+        **kwargs,
+    )
+
+
+ENTITY: PolyglotEntity = PolyglotEntity(
+    name="events",
+    catalog="registry",
+    schema_="ygg",
+    columns=[
+        get_column("id", "string", primary_key=True),
+        get_column("name", "string"),
+        get_column(RECORD_HASH_COLUMN, "string", skip_from_signature=True),
+    ],
+)
+
+
+@pytest.fixture
+def contract(tmp_path) -> StoredContract:
+    """Get the events contract stored in a local catalog."""
+    return StoredContract(ENTITY, tmp_path / "catalog.duckdb")
+
+
+def get_records(contract: StoredContract, *names: str) -> list:
+    """Get event records keyed by the first letter of their name."""
+    return [contract.model(id=name[0], name=name) for name in names]
+
+
+def get_stored_names(catalog_file: Path) -> list[tuple]:
+    """Get the id and name of every stored event."""
+
+    with duckdb.connect(str(catalog_file)) as con:
+        return con.execute(f"SELECT id, name FROM {ENTITY.schema_}.{ENTITY.name} ORDER BY id").fetchall()
+
+
+def test_waiting_requests_are_committed_as_one_batch(contract, tmp_path):
+    batcher = MicroBatcher(contract, max_wait=0.5)
+    futures = [
+        batcher.submit(get_records(contract, "alpha", "bravo")),
+        batcher.submit(get_records(contract, "charlie")),
+        batcher.submit(get_records(contract, "both")),
+    ]
+
+    batcher.start()
+    results = [f.result(timeout=10) for f in futures]
+    batcher.stop()
+
+    assert [(len(hydrate_returns), records) for hydrate_returns, records, _ in results] == [(2, 4), (1, 4), (1, 4)]
+    assert (batcher.stats.requests, batcher.stats.records, batcher.stats.batches) == (3, 4, 1)
+    # The later record replaces the earlier one with the same key, as a separate commit would.
+    assert get_stored_names(tmp_path / "catalog.duckdb") == [("a", "alpha"), ("b", "both"), ("c", "charlie")]
+
+
+def test_batches_stop_at_the_batch_size(contract):
+    batcher = MicroBatcher(contract, max_batch_records=2, max_wait=0.5)
+    futures = [batcher.submit(get_records(contract, name)) for name in ["alpha", "bravo", "charlie"]]
+
+    batcher.start()
+    assert [f.result(timeout=10)[1] for f in futures] == [2, 2, 1]
+    batcher.stop()
+
+    assert batcher.stats.batches == 2
+
+
+def test_failed_batch_fails_every_request_in_it(contract, tmp_path, monkeypatch):
+    batcher = MicroBatcher(contract, max_wait=0.5)
+    write_staged = contract.write_staged
+
+    def fail(*args, **kwargs):
+        raise RuntimeError("Catalog unavailable.")
+
+    monkeypatch.setattr(contract, "write_staged", fail)
+    futures = [batcher.submit(get_records(contract, name)) for name in ["alpha", "bravo"]]
+    batcher.start()
+    for future in futures:
+        with pytest.raises(RuntimeError, match="Catalog unavailable."):
+            future.result(timeout=10)
+
+    # The committer goes on with a new session.
+    monkeypatch.setattr(contract, "write_staged", write_staged)
+    batcher.submit(get_records(contract, "charlie")).result(timeout=10)
+    batcher.stop()
+
+    assert (batcher.stats.failed_batches, batcher.stats.batches) == (1, 1)
+    assert get_stored_names(tmp_path / "catalog.duckdb") == [("c", "charlie")]
+
+
+def test_stopped_batcher_fails_the_waiting_requests(contract):
+    batcher = MicroBatcher(contract)
+    future = batcher.submit(get_records(contract, "alpha"))
+
+    batcher.stop()
+
+    with pytest.raises(RuntimeError, match="stopped"):
+        future.result(timeout=10)
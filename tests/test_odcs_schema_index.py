@@ -0,0 +1,49 @@
+"""Shared ODCS schema indexes must follow the schema content they were built from."""
+
+import os
+
+from ygg.core.odcs_schema_index import OdcsSchemaIndex
+from ygg.utils.commons import get_file_content_signature, get_json_file_content
+
+
+def get_odcs_schema(description: str) -> dict:
+    """Get a minimal ODCS schema describing its id property."""
+
+    return {"properties": {"id": {"type": "string", "description": description}}}
+
+
+def test_same_schema_object_shares_its_index():
+    OdcsSchemaIndex.clear()
+    odcs_schema = get_odcs_schema("Id.")
+    index = OdcsSchemaIndex.for_schema(odcs_schema, "3.1.0", "odcs.json")
+
+    assert OdcsSchemaIndex.for_schema(odcs_schema, "3.1.0", "odcs.json") is index
+    assert OdcsSchemaIndex.for_schema(get_odcs_schema("Edited id."), "3.1.0", "odcs.json") is not index
+
+
+def test_same_signature_shares_its_index():
+    OdcsSchemaIndex.clear()
+    index = OdcsSchemaIndex.for_schema(get_odcs_schema("Id."), "3.1.0", "odcs.json", "first")
+    changed = OdcsSchemaIndex.for_schema(get_odcs_schema("Edited id."), "3.1.0", "odcs.json", "second")
+
+    assert OdcsSchemaIndex.for_schema(get_odcs_schema("Id."), "3.1.0", "odcs.json", "second") is changed
+    assert changed is not index
+    assert changed.get_property_spec("properties.id").description == "Edited id."
+
+
+def test_edited_schema_file_rebuilds_its_index(tmp_path):
+    OdcsSchemaIndex.clear()
+    schema_file = tmp_path / "odcs.json"
+    schema_file.write_text('{"properties": {"id": {"description": "Id."}}}')
+
+    def get_index() -> OdcsSchemaIndex:
+        return OdcsSchemaIndex.for_schema(
+            get_json_file_content(str(schema_file)), "3.1.0", "odcs.json", get_file_content_signature(schema_file)
+        )
+
+    index = get_index()
+    assert get_index() is index
+
+    schema_file.write_text('{"properties": {"id": {"description": "Edited id."}}}')
+    os.utime(schema_file, ns=(0, 0))
+    assert get_index().get_property_spec("properties.id").description == "Edited id."
@@ -0,0 +1,37 @@
+"""Transaction handling of the DuckDb connections."""
+
+import duckdb
+import pytest
+
+from ygg.polyglot.quack_connector import QuackConnector
+
+
+def test_rollback_discards_the_open_transaction():
+    with duckdb.connect() as con:
+        con.execute("CREATE TABLE t (i BIGINT)")
+        con.execute("BEGIN TRANSACTION")
+        con.execute("INSERT INTO t VALUES (1)")
+
+        QuackConnector.rollback(con)
+
+        assert con.execute("SELECT count(*) FROM t").fetchone()[0] == 0
+
+
+def test_rollback_keeps_the_commit_error():
+    with duckdb.connect() as con:
+        con.execute("CREATE TABLE t (i BIGINT PRIMARY KEY)")
+        first, second = con.cursor(), con.cursor()
+        first.execute("BEGIN TRANSACTION")
+        second.execute("BEGIN TRANSACTION")
+        first.execute("INSERT INTO t VALUES (1)")
+        second.execute("INSERT INTO t VALUES (1)")
+        first.execute("COMMIT")
+
+        with pytest.raises(duckdb.TransactionException, match="Failed to commit"):
+            try:
+                second.execute("COMMIT")
+            except Exception:
+                QuackConnector.rollback(second)
+                raise
+
+        assert con.execute("SELECT count(*) FROM t").fetchone()[0] == 1
@@ -0,0 +1,100 @@
+"""Schema evolution of existing entity tables."""
+
+import duckdb
+import pytest
+
+from ygg.config import YggSetup
+from ygg.helpers.data_types import get_data_type
+from ygg.helpers.enums import DuckLakeDbEntityType
+from ygg.helpers.logical_data_models import PolyglotEntity, PolyglotEntityColumn, PolyglotEntityColumnDataType
+from ygg.polyglot.quack_meta_class import QuackMetaClass
+
+CUSTOM_PROPERTY_TYPE: str = "STRUCT(id VARCHAR, property VARCHAR, value VARCHAR, description VARCHAR)"
+
+
+@pytest.fixture(scope="module")
+def meta_class(tmp_path_factory) -> QuackMetaClass:
+    folder = tmp_path_factory.mktemp("ygg")
+    YggSetup(
+        create_ygg_folders=False,
+        config_data={
+            "ygg-database-config": {
+                "database": "ygg",
+                "database_extension": "duckdb",
+                "database_location": str(folder),
+                "data_location": str(folder),
+            }
+        },
+    )
+
+    columns = []
+    for name, data_type_name in [("id", "StableId"), ("size", "integer"), ("custom_properties", "CustomProperties")]:
+        physical_type: str = get_data_type(data_type_name, "physical")["type"]
+        columns.append(
+            PolyglotEntityColumn(
+                name=name,
+                alias=name,
+                data_type=PolyglotEntityColumnDataType(
+                    data_type_name=data_type_name, duck_db_type=physical_type, duck_lake_type=physical_type
+                ),
+            )
+        )
+
+    entity = PolyglotEntity(name="evolving", catalog="ygg", schema_="ygg", columns=columns)
+    return QuackMetaClass(entity, catalog_name="ygg")
+
+
+def get_existing_columns(con: duckdb.DuckDBPyConnection) -> dict[str, str]:
+    """Get the columns of the table and their types, without the quotes DuckDb puts around reserved field names."""
+
+    rows = con.execute(
+        "SELECT column_name, data_type FROM information_schema.columns WHERE table_name = 'evolving'"
+    ).fetchall()
+    return {name: data_type.replace('"', "") for name, data_type in rows}
+
+
+def create_table(con: duckdb.DuckDBPyConnection, custom_properties: str | None = None) -> dict[str, str]:
+    """Create the table as it was before CustomProperties became a list, with one row."""
+
+    con.execute("CREATE SCHEMA ygg")
+    con.execute(f"CREATE TABLE ygg.evolving (id VARCHAR, size INTEGER, custom_properties {CUSTOM_PROPERTY_TYPE})")
+    custom_property = {"id": "p", "property": "owner", "value": custom_properties, "description": None}
+    con.execute("INSERT INTO ygg.evolving VALUES ('a', 1, ?)", [custom_property if custom_properties else None])
+    return get_existing_columns(con)
+
+
+def test_widening_is_altered_in_place(meta_class):
+    instructions = meta_class.get_entity_evolution_instructions(
+        {"id": "VARCHAR", "size": "INTEGER", "custom_properties": f"{CUSTOM_PROPERTY_TYPE}[]"},
+        DuckLakeDbEntityType.DUCKDB,
+    )
+
+    assert instructions == ["ALTER TABLE ygg.evolving ALTER COLUMN size SET DATA TYPE BIGINT"]
+
+
+def test_empty_column_takes_a_new_type(meta_class):
+    with duckdb.connect() as con:
+        existing_columns = create_table(con)
+        retyped_columns = meta_class.get_retyped_columns(existing_columns, DuckLakeDbEntityType.DUCKDB)
+        assert retyped_columns == ["custom_properties"]
+
+        instructions = meta_class.get_entity_evolution_instructions(
+            existing_columns, DuckLakeDbEntityType.DUCKDB, empty_columns=set(retyped_columns)
+        )
+        for instruction in instructions:
+            con.execute(instruction)
+
+        assert get_existing_columns(con) == {
+            "id": "VARCHAR",
+            "size": "BIGINT",
+            "custom_properties": f"{CUSTOM_PROPERTY_TYPE}[]",
+        }
+        assert con.execute("SELECT id, size FROM ygg.evolving").fetchall() == [("a", 1)]
+
+
+def test_column_with_values_needs_the_entity_recreated(meta_class):
+    with duckdb.connect() as con:
+        existing_columns = create_table(con, custom_properties="team")
+
+        with pytest.raises(ValueError, match="must be recreated"):
+            meta_class.get_entity_evolution_instructions(existing_columns, DuckLakeDbEntityType.DUCKDB)
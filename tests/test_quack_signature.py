@@ -0,0 +1,239 @@
+"""DuckDb record signatures must match the Python ones byte-for-byte."""
+
+from typing import Any
+
+import duckdb
+import pytest
+
+from ygg.core.shared_model_mixin import SharedModelMixin
+from ygg.helpers.data_types import get_data_type
+from ygg.helpers.enums import SignatureAlgorithm
+from ygg.helpers.logical_data_models import PolyglotEntity, PolyglotEntityColumn, PolyglotEntityColumnDataType
+from ygg.polyglot.polyglot import build_dynamic_model
+from ygg.polyglot.quack_meta_class import QuackMetaClass
+from ygg.polyglot.quack_signature import RECORD_HASH_COLUMN, QuackSignature
+
+
+def get_column(name: str, data_type_name: str, **kwargs: Any) -> PolyglotEntityColumn:
+    """Get a nullable entity column of a Ygg data type."""
+
+    physical_type: str = get_data_type(data_type_name, "physical")["type"]
+    return PolyglotEntityColumn(
+        name=name,
+        alias=name,
+        nullable=True,
+        data_type=PolyglotEntityColumnDataType(
+            data_type_name=data_type_name, duck_db_type=physical_type, duck_lake_type=physical_type
+        ),
+        **kwargs,
+    )
+
+
+def get_entity(*columns: PolyglotEntityColumn, **kwargs: Any) -> PolyglotEntity:
+    """Get an entity of the columns, signed into its record_hash column."""
+
+    record_hash = get_column(RECORD_HASH_COLUMN, "string", skip_from_signature=True)
+    return PolyglotEntity(name="signed", catalog="ygg", schema_="ygg", columns=[*columns, record_hash], **kwargs)
+
+
+def get_duckdb_signatures(entity: PolyglotEntity, dumps: list[dict[str, Any]]) -> list[str]:
+    """Stage dumped records the way the batch writer does and sign them in DuckDb, unless it cannot sign them."""
+
+    quack_signature = QuackSignature(entity)
+    names = [QuackMetaClass.physical_column_name(c.name) for c in entity.columns]
+    types = [
+        f"ENUM({', '.join(repr(e) for e in c.enum)})" if c.enum else c.data_type.duck_db_type for c in entity.columns
+    ]
+    rows = [[None if d.get(c.name) in ("", ...) else d.get(c.name) for c in entity.columns] for d in dumps]
+    for row, dump in zip(rows, dumps):
+        if not quack_signature.is_signable(dump):
+            row[names.index(RECORD_HASH_COLUMN)] = SharedModelMixin._get_record_signature(dump, entity)
+
+    with duckdb.connect() as con:
+        con.execute(f"CREATE TABLE stage ({', '.join(f'{n} {t}' for n, t in zip(names, types))})")
+        con.executemany(f"INSERT INTO stage VALUES ({', '.join('?' for _ in names)})", rows)
+        con.execute(
+            f"UPDATE stage SET {RECORD_HASH_COLUMN} = {quack_signature.signature_expression} "
+            f"WHERE {RECORD_HASH_COLUMN} IS NULL"
+        )
+        return [r[0] for r in con.execute(f"SELECT {RECORD_HASH_COLUMN} FROM stage ORDER BY rowid").fetchall()]
+
+
+def assert_signatures_match(entity: PolyglotEntity, records: list[dict[str, Any]]) -> None:
+    """Assert DuckDb signs every record as the Python model does."""
+
+    model = build_dynamic_model(entity)
+    dumps = [model(**r).model_dump() for r in records]
+
+    assert QuackSignature(entity).is_supported
+    assert get_duckdb_signatures(entity, dumps) == [SharedModelMixin._get_record_signature(d, entity) for d in dumps]
+
+
+UNICODE_TEXT: str = 'ünïcødé ☃ 𝄞 😀 "quoted" \\ back\\slash'
+CONTROL_TEXT: str = "line\nbreak\ttab\rreturn\b\f \x00\x01\x1f\x7f end"
+
+
+@pytest.mark.parametrize(
+    "value",
+    ["plain", "None", "", None, UNICODE_TEXT, CONTROL_TEXT, "'single' quotes", "  ", "퟿￿"],
+)
+def test_varchar(value):
+    assert_signatures_match(get_entity(get_column("name", "string")), [{"name": value}])
+
+
+@pytest.mark.parametrize("value", [0, 1, -1, 2**62, -(2**62), None])
+def test_bigint(value):
+    assert_signatures_match(get_entity(get_column("count", "integer")), [{"count": value}])
+
+
+@pytest.mark.parametrize("value", [True, False, None])
+def test_boolean(value):
+    assert_signatures_match(get_entity(get_column("active", "boolean")), [{"active": value}])
+
+
+@pytest.mark.parametrize(
+    "value", [["a", "b"], [], None, ["", "None"], [UNICODE_TEXT, CONTROL_TEXT], ['"', "\\", "x,y", "[z]"]]
+)
+def test_varchar_list(value):
+    assert_signatures_match(get_entity(get_column("tags", "list_of_strings")), [{"tags": value}])
+
+
+@pytest.mark.parametrize("value", ["draft", "active", "ünïcødé", None])
+def test_enum(value):
+    column = get_column("status", "string", enum=["draft", "active", "ünïcødé"])
+    assert_signatures_match(get_entity(column), [{"status": value}])
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        {"purpose": "p", "limitations": "l", "usage": "u"},
+        {"purpose": "", "limitations": UNICODE_TEXT, "usage": CONTROL_TEXT},
+        {"purpose": '"', "limitations": "\\", "usage": "None"},
+        None,
+    ],
+)
+def test_struct(value):
+    assert_signatures_match(get_entity(get_column("description", "StructuredDescription")), [{"description": value}])
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        [{"id": "a", "url": "https://a", "type": "doc", "description": "first"}],
+        [
+            {"id": "a", "url": "https://a", "type": "doc", "description": None},
+            {"id": "b", "url": UNICODE_TEXT, "type": CONTROL_TEXT, "description": ""},
+        ],
+        [],
+        None,
+    ],
+)
+def test_struct_list(value):
+    column = get_column("authoritative_definitions", "AuthoritativeDefinitions")
+    assert_signatures_match(get_entity(column), [{"authoritative_definitions": value}])
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        [{"id": "a", "property": "owner", "value": "team", "description": None}],
+        [{"id": "a", "property": "owner", "value": UNICODE_TEXT, "description": CONTROL_TEXT}],
+        [{"id": "a", "property": "empty", "value": "", "description": ""}],
+        [{"id": "a", "property": "size", "value": 5, "description": None}],
+        [{"id": "a", "property": "zero", "value": 0, "description": None}],
+        [{"id": "a", "property": "enabled", "value": True, "description": None}],
+        [{"id": "a", "property": "disabled", "value": False, "description": None}],
+        [{"id": "a", "property": "ratio", "value": 1.5, "description": None}],
+        [{"id": "a", "property": "five", "value": "5", "description": None}],
+        [
+            {"id": "a", "property": "owner", "value": "team", "description": None},
+            {"id": "b", "property": "size", "value": 5, "description": None},
+        ],
+        [],
+        None,
+    ],
+)
+def test_struct_list_with_non_string_fields(value):
+    column = get_column("custom_properties", "CustomProperties")
+    assert_signatures_match(get_entity(column), [{"custom_properties": value}])
+
+
+def test_non_string_struct_fields_are_not_signable():
+    entity = get_entity(get_column("custom_properties", "CustomProperties"))
+    quack_signature = QuackSignature(entity)
+
+    def custom_properties(value: Any) -> dict[str, Any]:
+        return {"custom_properties": [{"id": "a", "property": "p", "value": value, "description": None}]}
+
+    assert quack_signature.is_supported and not quack_signature.is_exact
+    assert quack_signature.is_signable(custom_properties("5"))
+    assert quack_signature.is_signable({"custom_properties": None})
+    assert not any(quack_signature.is_signable(custom_properties(v)) for v in (5, 0, True, 1.5, ["x"], {"k": "v"}))
+    assert QuackSignature(get_entity(get_column("description", "StructuredDescription"))).is_exact
+
+
+def test_reserved_column_names():
+    entity = get_entity(get_column("date", "string"), get_column("timestamp", "integer"))
+    assert_signatures_match(entity, [{"date": "2026-01-01", "timestamp": 7}, {"date": None, "timestamp": 0}])
+
+
+def test_mixed_batch():
+    entity = get_entity(
+        get_column("name", "string"),
+        get_column("count", "integer"),
+        get_column("active", "boolean"),
+        get_column("tags", "list_of_strings"),
+        get_column("status", "string", enum=["draft", "active"]),
+        get_column("description", "StructuredDescription"),
+        get_column("authoritative_definitions", "AuthoritativeDefinitions"),
+        get_column("custom_properties", "CustomProperties"),
+    )
+    records = [
+        {
+            "name": UNICODE_TEXT,
+            "count": 3,
+            "active": True,
+            "tags": ["x", CONTROL_TEXT],
+            "status": "draft",
+            "description": {"purpose": "p", "limitations": "", "usage": UNICODE_TEXT},
+            "authoritative_definitions": [{"id": "a", "url": "u", "type": "t", "description": None}],
+            "custom_properties": [{"id": "a", "property": "p", "value": "v", "description": None}],
+        },
+        {
+            "name": "",
+            "count": 0,
+            "active": False,
+            "tags": [],
+            "status": None,
+            "custom_properties": [{"id": "a", "property": "p", "value": 5, "description": None}],
+        },
+        {},
+    ]
+    assert_signatures_match(entity, records)
+
+
+def test_skipped_columns_are_not_signed():
+    entity = get_entity(get_column("name", "string"), get_column("note", "string", skip_from_signature=True))
+    model = build_dynamic_model(entity)
+    dumps = [model(name="n", note="first").model_dump(), model(name="n", note="second").model_dump()]
+
+    signatures = get_duckdb_signatures(entity, dumps)
+    assert signatures[0] == signatures[1] == SharedModelMixin._get_record_signature(dumps[0], entity)
+
+
+@pytest.mark.parametrize("signature_algorithm", [None, SignatureAlgorithm.SHA256, "sha256"])
+def test_sha256_entities_are_supported(signature_algorithm):
+    kwargs = {"signature_algorithm": signature_algorithm} if signature_algorithm else {}
+    entity = get_entity(get_column("name", "string"), **kwargs)
+
+    assert entity.signature_algorithm == SignatureAlgorithm.SHA256.value
+    assert QuackSignature(entity).is_supported
+
+
+def test_unsupported_entities():
+    assert not QuackSignature(get_entity(get_column("name", "string"), signature_algorithm="blake2b")).is_supported
+    assert not QuackSignature(get_entity(get_column("created", "timestamp"))).is_supported
+    assert not QuackSignature(
+        PolyglotEntity(name="unsigned", catalog="ygg", schema_="ygg", columns=[get_column("name", "string")])
+    ).is_supported
@@ -0,0 +1,87 @@
+"""Reading a record stream must resume exactly after any record it handed out."""
+
+import json
+
+import pytest
+
+from ygg.helpers.enums import RecordStreamFormat
+from ygg.helpers.logical_data_models import StreamPosition
+from ygg.utils.record_stream import RecordStreamReader
+
+YAML_DOCUMENTS: str = """%YAML 1.2
+---
+items:
+  - id: a1
+  - id: a2
+  - id: a3
+...
+# a comment before the next document
+---
+items:
+  - id: b1
+---
+---
+items: []
+---
+items:
+  - id: c1
+    note: "ünïcødé ☃"
+  - id: c2
+"""
+
+NDJSON_LINES: list = [
+    {"id": "a1"},
+    [{"id": "b1"}, {"id": "b2"}, "not a record"],
+    None,
+    {"id": "c1", "note": "ünïcødé ☃"},
+    [],
+    {"id": "d1"},
+    {"id": "d2"},
+]
+
+
+@pytest.fixture(params=[RecordStreamFormat.YAML, RecordStreamFormat.NDJSON])
+def reader(request, tmp_path) -> RecordStreamReader:
+    """Get a reader of a record file holding documents of several records, empty ones included."""
+
+    if request.param == RecordStreamFormat.YAML:
+        file = tmp_path / "records.yaml"
+        file.write_text(YAML_DOCUMENTS, encoding="utf-8")
+        return RecordStreamReader(file, document_path="items", chunk_size=2)
+
+    file = tmp_path / "records.ndjson"
+    file.write_text("\n".join("" if line is None else json.dumps(line) for line in NDJSON_LINES) + "\n")
+    return RecordStreamReader(file, chunk_size=2)
+
+
+def test_reading_resumes_after_every_record(reader):
+    records = list(reader.records())
+
+    assert len(records) == 6
+    for i, (position, _) in enumerate(records):
+        assert [r for _, r in reader.records(position)] == [r for _, r in records[i + 1 :]]
+
+
+def test_reading_resumes_after_every_chunk(reader):
+    records = [r for _, r in reader.records()]
+    chunks = list(reader.chunks())
+
+    assert [len(c.records) for c in chunks] == [2, 2, 2]
+    assert [r for c in chunks for r in c.records] == records
+    for chunk in chunks:
+        resumed = [r for c in reader.chunks(chunk.position) for r in c.records]
+        assert resumed == records[chunk.first_record + len(chunk.records) :]
+
+
+def test_reading_from_the_end_yields_nothing(reader):
+    position, _ = list(reader.records())[-1]
+
+    assert position == StreamPosition(offset=reader.file_path.stat().st_size, index=0)
+    assert list(reader.records(position)) == []
+
+
+def test_unknown_suffix_needs_a_format(tmp_path):
+    with pytest.raises(ValueError, match="not supported"):
+        RecordStreamReader(tmp_path / "records.txt")
+
+    assert RecordStreamReader(tmp_path / "records.txt", stream_format=RecordStreamFormat.NDJSON)
@@ -0,0 +1,49 @@
+"""Batch validation of contract records."""
+
+from typing import ClassVar
+
+from pydantic import model_validator
+
+from ygg.core.shared_model_mixin import SharedModelMixin
+from ygg.helpers.logical_data_models import YggBaseModel
+
+
+class Record(YggBaseModel, SharedModelMixin):
+    """Record counting its validations."""
+
+    validations: ClassVar[int] = 0
+
+    id: str
+    size: int | None = None
+
+    @model_validator(mode="before")
+    @classmethod
+    def count_validation(cls, data):
+        Record.validations += 1
+        return data
+
+
+def test_clean_batch():
+    result = Record.inflate_many({"id": str(i), "size": i} for i in range(3))
+
+    assert [r.id for r in result.records] == ["0", "1", "2"]
+    assert result.errors == []
+
+
+def test_invalid_records_are_reported_in_place():
+    records = [{"id": "a"}, {"id": "b", "size": "large"}, {"size": 1}, {"id": "d"}, "not a record"]
+
+    Record.validations = 0
+    result = Record.inflate_many(records, model_hydrate={"size": 7})
+
+    assert Record.validations == len(records)
+    assert [(r.id, r.size) for r in result.records] == [("a", 7), ("d", 7)]
+    assert [e.index for e in result.errors] == [1, 2, 4]
+    assert [[e["loc"] for e in error.errors] for error in result.errors] == [[(1, "size")], [(2, "id")], [(4,)]]
+
+
+def test_every_record_invalid():
+    result = Record.inflate_many([{}, {"size": "x"}])
+
+    assert result.records == []
+    assert [e.index for e in result.errors] == [0, 1]
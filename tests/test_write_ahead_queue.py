@@ -0,0 +1,166 @@
+"""Queued batches must come back as they were enqueued and reach DuckLake exactly once."""
+
+import json
+import sqlite3
+import time
+import uuid
+from datetime import datetime, timezone
+from decimal import Decimal
+from pathlib import Path
+
+import duckdb
+import pytest
+
+from ygg.core.commit_coordinator import CommitCoordinator
+from ygg.core.polyglot_contract import PolyglotContract
+from ygg.helpers.logical_data_models import PolyglotEntity, PolyglotEntityColumn, PolyglotEntityColumnDataType
+from ygg.polyglot.write_ahead_queue import WriteAheadQueue
+
+CREATED: datetime = datetime(2026, 1, 1, 12, 30, tzinfo=timezone.utc)
+
+
+class StoredContract(PolyglotContract):
+    """Contract whose catalog is a local DuckDb file instead of DuckLake."""
+
+    def __init__(self, entity: PolyglotEntity, catalog_file: Path):
+        columns = ", ".join(f"{c.name} {c.data_type.duck_db_type}" for c in entity.columns)
+
+        self._entity = entity
+        self._PolyglotContract__first_layer_instructions = [
+            f"CREATE SCHEMA IF NOT EXISTS {entity.schema_}",
+            f"CREATE TABLE {entity.schema_}.{entity.name} ({columns}, PRIMARY KEY (id))",
+        ]
+        self._PolyglotContract__second_layer_instructions = [f"ATTACH '{catalog_file}' AS {entity.catalog}"]
+        with duckdb.connect(str(catalog_file)) as con:
+            con.execute(f"CREATE SCHEMA IF NOT EXISTS {entity.schema_}")
+            con.execute(f"CREATE TABLE IF NOT EXISTS {entity.schema_}.{entity.name} ({columns})")
+
+
+def get_column(name: str, physical_type: str, **kwargs) -> PolyglotEntityColumn:
+    """Get a nullable entity column of a physical type."""
+
+    return PolyglotEntityColumn(
+        name=name,
+        alias=name,
+        nullable=True,
+        data_type=PolyglotEntityColumnDataType(
+            data_type_name=name, duck_db_type=physical_type, duck_lake_type=physical_type
+        ),
+        **kwargs,
+    )
+
+
+ENTITY: PolyglotEntity = PolyglotEntity(
+    name="payments",
+    catalog="registry",
+    schema_="ygg",
+    update_allowed=False,
+    columns=[
+        get_column("id", "UUID", primary_key=True),
+        get_column("created", "TIMESTAMPTZ"),
+        get_column("amount", "DECIMAL(10, 2)"),
+    ],
+)
+
+
+def get_statements(*rows: list) -> list[dict]:
+    """Get the first layer insert of payment rows."""
+
+    return [
+        {
+            "statement": f"INSERT INTO {ENTITY.schema_}.{ENTITY.name} (id, created, amount) VALUES (?, ?, ?)",
+            "values": list(rows),
+            "many": True,
+        }
+    ]
+
+
+def get_payments(catalog_file: Path) -> list[tuple]:
+    """Get every payment stored in the catalog."""
+
+    with duckdb.connect(str(catalog_file)) as con:
+        return con.execute(f"SELECT id, created, amount FROM {ENTITY.schema_}.{ENTITY.name} ORDER BY amount").fetchall()
+
+
+def test_statement_values_keep_their_types(tmp_path):
+    queue = WriteAheadQueue(tmp_path / "queue.sqlite")
+    row = [uuid.uuid4(), CREATED, Decimal("12.50")]
+
+    batch_id = queue.enqueue(ENTITY.name, get_statements(row), rows=1, upsert=False)
+    [batch] = queue.claim(max_batches=10, max_rows=10)
+
+    assert (batch.batch_id, batch.entity, batch.upsert, batch.rows) == (batch_id, ENTITY.name, False, 1)
+    assert batch.statements == get_statements(row)
+    assert [type(v) for v in batch.statements[0]["values"][0]] == [uuid.UUID, datetime, Decimal]
+
+
+def test_batches_enqueued_as_json_are_still_read(tmp_path):
+    queue = WriteAheadQueue(tmp_path / "queue.sqlite")
+    with sqlite3.connect(queue.queue_file) as con:
+        con.execute(
+            "INSERT INTO write_ahead_batches (entity, upsert, statements, rows, status, enqueued_at) "
+            "VALUES (?, 1, ?, 1, 'pending', ?)",
+            (ENTITY.name, json.dumps(get_statements(["a", "b", "c"])), time.time()),
+        )
+
+    assert queue.claim(max_batches=10, max_rows=10)[0].statements == get_statements(["a", "b", "c"])
+
+
+def test_queue_keeps_its_id(tmp_path):
+    queue = WriteAheadQueue(tmp_path / "queue.sqlite")
+
+    assert WriteAheadQueue(tmp_path / "queue.sqlite").queue_id == queue.queue_id
+    assert WriteAheadQueue(tmp_path / "other.sqlite").queue_id != queue.queue_id
+
+
+def test_full_queue_times_out(tmp_path):
+    queue = WriteAheadQueue(tmp_path / "queue.sqlite", max_pending_rows=2)
+    queue.enqueue(ENTITY.name, get_statements([uuid.uuid4(), CREATED, Decimal("1")]), rows=2)
+
+    with pytest.raises(TimeoutError, match="queue is full"):
+        queue.enqueue(ENTITY.name, get_statements([uuid.uuid4(), CREATED, Decimal("2")]), rows=1, timeout=0.1)
+
+
+def test_batches_of_a_stopped_committer_are_recovered(tmp_path):
+    queue = WriteAheadQueue(tmp_path / "queue.sqlite")
+    row = [uuid.uuid4(), CREATED, Decimal("3.10")]
+    queue.enqueue(ENTITY.name, get_statements(row), rows=1)
+    queue.claim(max_batches=10, max_rows=10)
+
+    restarted = WriteAheadQueue(tmp_path / "queue.sqlite")
+    assert restarted.claim(max_batches=10, max_rows=10) == []
+    assert restarted.recover() == 1
+    assert restarted.claim(max_batches=10, max_rows=10)[0].statements == get_statements(row)
+
+
+def test_queued_batches_are_committed(tmp_path):
+    catalog_file = tmp_path / "catalog.duckdb"
+    queue = WriteAheadQueue(tmp_path / "queue.sqlite")
+    rows = [[uuid.uuid4(), CREATED, Decimal("1.25")], [uuid.uuid4(), CREATED, Decimal("2.50")]]
+    for row in rows:
+        queue.enqueue(ENTITY.name, get_statements(row), rows=1, upsert=False)
+
+    [report] = CommitCoordinator([StoredContract(ENTITY, catalog_file)], queue).drain()
+
+    assert (report.batches, report.rows) == (2, 2)
+    assert get_payments(catalog_file) == [tuple(r) for r in rows]
+    assert queue.pending_rows == 0
+
+
+def test_replayed_batch_is_not_written_twice(tmp_path, monkeypatch):
+    catalog_file = tmp_path / "catalog.duckdb"
+    queue = WriteAheadQueue(tmp_path / "queue.sqlite")
+    row = [uuid.uuid4(), CREATED, Decimal("9.99")]
+    queue.enqueue(ENTITY.name, get_statements(row), rows=1, upsert=False)
+    coordinator = CommitCoordinator([StoredContract(ENTITY, catalog_file)], queue)
+
+    # The committer stops after the DuckLake commit, before the batch is taken off the queue.
+    complete = queue.complete
+    monkeypatch.setattr(queue, "complete", lambda batch_ids: pytest.fail("Committer stopped."))
+    with pytest.raises(pytest.fail.Exception):
+        coordinator.commit_once()
+    monkeypatch.setattr(queue, "complete", complete)
+
+    assert coordinator.drain()
+    assert get_payments(catalog_file) == [tuple(row)]
+    assert queue.pending_rows == 0
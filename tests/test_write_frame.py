@@ -0,0 +1,89 @@
+"""Frame writes must report the rows they inserted and the rows they rejected, timed as DuckLake writes."""
+
+from pathlib import Path
+
+import duckdb
+import pandas
+
+from ygg.core.polyglot_contract import PolyglotContract
+from ygg.helpers.data_types import get_data_type
+from ygg.helpers.logical_data_models import PolyglotEntity, PolyglotEntityColumn, PolyglotEntityColumnDataType
+from ygg.polyglot.quack_signature import RECORD_HASH_COLUMN
+from ygg.utils.ygg_metrics import metrics
+
+
+class StoredContract(PolyglotContract):
+    """Contract whose catalog is a local DuckDb file instead of DuckLake."""
+
+    def __init__(self, entity: PolyglotEntity, catalog_file: Path):
+        columns = ", ".join(f"{c.name} {c.data_type.duck_db_type}" for c in entity.columns)
+
+        self._entity = entity
+        self._PolyglotContract__first_layer_instructions = [
+            f"CREATE SCHEMA IF NOT EXISTS {entity.schema_}",
+            f"CREATE TABLE {entity.schema_}.{entity.name} ({columns}, PRIMARY KEY (id))",
+        ]
+        self._PolyglotContract__second_layer_instructions = [f"ATTACH '{catalog_file}' AS {entity.catalog}"]
+        with duckdb.connect(str(catalog_file)) as con:
+            con.execute(f"CREATE SCHEMA IF NOT EXISTS {entity.schema_}")
+            con.execute(f"CREATE TABLE IF NOT EXISTS {entity.schema_}.{entity.name} ({columns})")
+
+
+def get_column(name: str, data_type_name: str, **kwargs) -> PolyglotEntityColumn:
+    """Get an entity column of a Ygg data type."""
+
+    physical_type: str = get_data_type(data_type_name, "physical")["type"]
+    return PolyglotEntityColumn(
+        name=name,
+        alias=name,
+        data_type=PolyglotEntityColumnDataType(
+            data_type_name=data_type_name, duck_db_type=physical_type, duck_lake_type=physical_type
+        ),
+        **kwargs,
+    )
+
+
+ENTITY: PolyglotEntity = PolyglotEntity(
+    name="events",
+    catalog="registry",
+    schema_="ygg",
+    update_allowed=False,
+    columns=[
+        # Nullable columns are the required ones.
+        get_column("id", "string", primary_key=True, nullable=True),
+        get_column("name", "string", nullable=False),
+        get_column(RECORD_HASH_COLUMN, "string", nullable=False, skip_from_signature=True),
+    ],
+)
+
+
+def test_rows_skipped_on_conflict_are_not_counted(tmp_path):
+    catalog_file = tmp_path / "catalog.duckdb"
+    frame = pandas.DataFrame({"id": ["a", "a", "b", None], "name": ["first", "again", "second", "no key"]})
+
+    result = StoredContract(ENTITY, catalog_file).write_frame(frame, upsert=False)
+
+    assert result.written == 2
+    assert [r.record["name"] for r in result.rejected] == ["no key"]
+    with duckdb.connect(str(catalog_file)) as con:
+        assert con.execute(f"SELECT count(*) FROM {ENTITY.schema_}.{ENTITY.name}").fetchone() == (2,)
+
+
+def test_valid_frame_reports_no_rejected_rows(tmp_path):
+    frame = pandas.DataFrame({"id": ["a", "b"], "name": ["first", "second"]})
+
+    result = StoredContract(ENTITY, tmp_path / "catalog.duckdb").write_frame(frame)
+
+    assert (result.written, result.rejected) == (2, [])
+
+
+def test_frame_write_is_timed_as_a_ducklake_write(tmp_path):
+    metrics.enable(export_at_exit=False)
+    try:
+        StoredContract(ENTITY, tmp_path / "catalog.duckdb").write_frame(pandas.DataFrame({"id": ["a"]}))
+        timers = [(t.name, t.labels, t.count) for t in metrics.snapshot().timers if t.name == "ducklake.write"]
+    finally:
+        metrics.disable()
+        metrics.reset()
+
+    assert timers == [("ducklake.write", {"entity": ENTITY.name}, 1)]
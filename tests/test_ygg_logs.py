@@ -0,0 +1,59 @@
+"""The background log writer must keep error lines and report the lines it dropped."""
+
+import json
+import threading
+
+from ygg.utils.ygg_logs import _QueueLogger, _QueueWriter
+
+
+class StalledFile:
+    """Binary file whose writes wait until it is released."""
+
+    def __init__(self):
+        self.released = threading.Event()
+        self.writing = threading.Event()
+        self.content = b""
+
+    def write(self, data: bytes) -> None:
+        self.writing.set()
+        self.released.wait(timeout=10)
+        self.content += data
+
+    def flush(self) -> None:
+        pass
+
+
+def get_stalled_writer() -> tuple[_QueueWriter, StalledFile]:
+    """Get a writer of one queued line, stalled on writing its first line."""
+
+    file = StalledFile()
+    writer = _QueueWriter(file, max_size=1)
+    writer.write(b"first\n")
+    file.writing.wait(timeout=10)
+    writer.write(b"queued\n")
+    return writer, file
+
+
+def test_lines_are_dropped_and_reported_when_the_writer_falls_behind():
+    writer, file = get_stalled_writer()
+
+    _QueueLogger(writer).info(b"dropped")
+    _QueueLogger(writer).warning(b"dropped")
+    file.released.set()
+    writer.close()
+
+    *lines, report = file.content.splitlines()
+    assert lines == [b"first", b"queued"]
+    assert writer.dropped == 2
+    assert json.loads(report)["dropped"] == 2
+
+
+def test_error_lines_wait_for_room():
+    writer, file = get_stalled_writer()
+
+    threading.Timer(0.1, file.released.set).start()
+    _QueueLogger(writer).error(b"error")
+    writer.close()
+
+    assert file.content.splitlines() == [b"first", b"queued", b"error"]
+    assert writer.dropped == 0
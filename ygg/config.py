@@ -20,12 +20,14 @@ class DuckLakeMetadataRepository(Enum):
     """DuckLake Metadata Repository"""
 
     POSTGRES = "postgres"
+    DUCKDB = "duckdb"
 
 
 class DuckLakeRepository(Enum):
     """DuckLake Repository"""
 
     S3 = "s3"
+    LOCAL = "local"
 
 
 class YggS3Config(YggBaseConfig):
@@ -48,6 +50,19 @@ class YggQuackDatabaseConfig(YggBaseConfig):
     password: str | None = Field(default=None, description="Database password")
 
 
+class YggDuckLakeConfig(YggBaseConfig):
+    """DuckLake Config."""
+
+    metadata_repository: DuckLakeMetadataRepository = Field(
+        default=DuckLakeMetadataRepository.POSTGRES,
+        description="Repository of the DuckLake metadata, duckdb keeps it in a file next to the Ygg database.",
+    )
+    repository: DuckLakeRepository = Field(
+        default=DuckLakeRepository.S3,
+        description="Repository of the DuckLake data files, local keeps them in the Ygg data location.",
+    )
+
+
 class YggDatabaseConfig(YggBaseConfig):
     database: str = Field(..., description="Database name")
     database_extension: str = Field(..., description="Database extension, e.g. .db or .duckdb")
@@ -103,6 +118,18 @@ class YggSetup:
 
         return YggS3Config(**self._config.get("ygg-s3-config", {}))
 
+    @property
+    def ygg_ducklake_config(self) -> YggDuckLakeConfig:
+        """Get the Ygg DuckLake Config."""
+
+        return YggDuckLakeConfig(**self._config.get("ygg-ducklake-config", {}))
+
+    @property
+    def ygg_database_config(self) -> YggDatabaseConfig:
+        """Get the Ygg Database Config."""
+
+        return self._database_config
+
     def _ygg_database_config(self) -> YggDatabaseConfig:
         """Get the Ygg Database Config."""
         ygg_database_config = self._config.get("ygg-database-config", {})
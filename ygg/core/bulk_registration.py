@@ -0,0 +1,122 @@
+"""Checkpointed bulk registration of record files, resumable after a failed run."""
+
+from pathlib import Path
+from typing import Iterable
+
+from ygg.core.polyglot_contract import PolyglotContract
+from ygg.helpers.logical_data_models import RunCheckpoint, StreamWriteReport
+from ygg.polyglot.checkpoint_store import CheckpointStore
+from ygg.utils.record_stream import RecordStreamReader
+from ygg.utils.ygg_logs import get_logger
+
+logs = get_logger(logger_name="BulkRegistration")
+
+
+class BulkRegistration:
+    """Bulk Registration.
+
+    Streams every input file into DuckLake chunk by chunk and checkpoints the position after each commit. A resumed
+    run skips the files it completed and continues the others after their last committed chunk, unless the file
+    changed since, then it starts over.
+    """
+
+    def __init__(
+        self,
+        contract: PolyglotContract,
+        checkpoints: CheckpointStore | None = None,
+        run_name: str = "default",
+        document_path: str = "",
+        chunk_size: int = 1_000,
+    ):
+        """Initialize the Bulk Registration."""
+
+        if not contract:
+            logs.error("Polyglot Contract cannot be empty.")
+            raise ValueError("Polyglot Contract cannot be empty.")
+
+        self._contract: PolyglotContract = contract
+        self._checkpoints: CheckpointStore = checkpoints or CheckpointStore()
+        self._run_name: str = run_name
+        self._document_path: str = document_path
+        self._chunk_size: int = chunk_size
+
+    def _get_checkpoint(self, file: Path, resume: bool) -> RunCheckpoint | None:
+        """Get the checkpoint a file starts from, None when a resumed run already completed it."""
+
+        checkpoint = RunCheckpoint(
+            run_name=self._run_name,
+            file=str(file),
+            entity=self._contract.entity.name,
+            file_signature=CheckpointStore.get_file_signature(file),
+        )
+        if not resume:
+            return checkpoint
+
+        stored = self._checkpoints.get(self._run_name, file, self._contract.entity.name)
+        if stored is None:
+            return checkpoint
+
+        if stored.file_signature != checkpoint.file_signature:
+            logs.warning("File changed since its checkpoint, starting over.", file=str(file))
+            return checkpoint
+
+        if stored.completed:
+            logs.info("File already registered, skipping.", file=str(file), snapshot_id=stored.snapshot_id)
+            return None
+
+        logs.info(
+            "Resuming file from checkpoint.",
+            file=str(file),
+            offset=stored.position.offset,
+            index=stored.position.index,
+            records=stored.records,
+            snapshot_id=stored.snapshot_id,
+        )
+        return stored
+
+    def register_file(self, file: Path | str, resume: bool = False, upsert: bool = True) -> StreamWriteReport | None:
+        """Register a file, checkpointing every committed chunk, None when a resumed run already completed it."""
+
+        file = Path(file).resolve()
+        checkpoint = self._get_checkpoint(file, resume)
+        if checkpoint is None:
+            return None
+
+        committed = checkpoint.records
+
+        def on_chunk(report: StreamWriteReport) -> None:
+            checkpoint.position = report.position
+            checkpoint.snapshot_id = report.snapshot_id
+            checkpoint.records = committed + report.records
+            self._checkpoints.save(checkpoint)
+
+        reader = RecordStreamReader(file, document_path=self._document_path, chunk_size=self._chunk_size)
+        report = self._contract.write_stream(reader, start=checkpoint.position, upsert=upsert, on_chunk=on_chunk)
+
+        checkpoint.completed = True
+        self._checkpoints.save(checkpoint)
+        return report
+
+    def register(
+        self, files: Iterable[Path | str], resume: bool = False, upsert: bool = True
+    ) -> list[StreamWriteReport]:
+        """Register every file in order, a failure stops the run and leaves its checkpoint behind."""
+
+        reports: list[StreamWriteReport] = []
+        skipped = 0
+        for file in files:
+            report = self.register_file(file, resume=resume, upsert=upsert)
+            if report is None:
+                skipped += 1
+                continue
+
+            reports.append(report)
+
+        logs.info(
+            "Bulk Registration Finished.",
+            run_name=self._run_name,
+            files=len(reports),
+            skipped=skipped,
+            records=sum(r.records for r in reports),
+        )
+        return reports
@@ -0,0 +1,225 @@
+"""Single committer draining the write ahead queue into DuckLake in grouped commits."""
+
+import random
+import threading
+import time
+from typing import Any
+
+from ygg.core.polyglot_contract import PolyglotContract
+from ygg.helpers.logical_data_models import CommitReport, WriteAheadBatch
+from ygg.polyglot.quack_connector import QuackConnector
+from ygg.polyglot.write_ahead_queue import WRITE_AHEAD_COMMITS_TABLE, WriteAheadQueue
+from ygg.utils.ygg_logs import get_logger
+from ygg.utils.ygg_metrics import metrics
+
+logs = get_logger(logger_name="CommitCoordinator")
+
+
+class CommitCoordinator:
+    """Commit Coordinator.
+
+    Claims the oldest batches of the write ahead queue and commits them in one DuckLake transaction, one merge per
+    entity, so the catalog sees one commit per group instead of one per worker batch. Commit conflicts are retried
+    with a jittered exponential backoff, and a group failing for any other reason is committed batch by batch so
+    only the broken batch is held back. The ids of the committed batches are written in the same transaction, so a
+    batch replayed after a crash is taken off the queue without being written again. Only one coordinator is
+    expected to run per queue.
+    """
+
+    def __init__(
+        self,
+        contracts: list[PolyglotContract],
+        queue: WriteAheadQueue,
+        max_batches: int = 256,
+        max_rows: int = 50_000,
+        max_attempts: int = 5,
+        retry_backoff: float = 0.5,
+        max_retry_backoff: float = 30.0,
+    ):
+        """Initialize the Commit Coordinator."""
+
+        if not contracts:
+            logs.error("Contracts cannot be empty.")
+            raise ValueError("Contracts cannot be empty.")
+
+        catalogs = {contract.entity.catalog for contract in contracts}
+        if len(catalogs) > 1:
+            logs.error("Contracts must share the same catalog.", catalogs=sorted(catalogs))
+            raise ValueError(f"Contracts must share the same catalog: {sorted(catalogs)}")
+
+        self._contracts: dict[str, PolyglotContract] = {c.entity.name: c for c in contracts}
+        self._queue: WriteAheadQueue = queue
+        self._max_batches: int = max_batches
+        self._max_rows: int = max_rows
+        self._max_attempts: int = max_attempts
+        self._retry_backoff: float = retry_backoff
+        self._max_retry_backoff: float = max_retry_backoff
+
+    def _write(self, con: Any, batches: list[WriteAheadBatch], commits_table: str, timings: dict[str, float]) -> None:
+        """Stage a group of batches and merge it into DuckLake in one transaction, with the ids of its batches."""
+
+        entities: list[str] = list(dict.fromkeys(b.entity for b in batches))
+        stage: list[dict[str, Any]] = [
+            PolyglotContract.get_replacing_instruction(s) for b in batches for s in b.statements
+        ]
+        # Every entity is moved once, merged when any of its batches asks for it.
+        merges: list[Any] = [
+            self._contracts[entity].get_second_layer_write_instruction(
+                any(b.upsert for b in batches if b.entity == entity)
+            )
+            for entity in entities
+        ]
+        merges.append(
+            {
+                "statement": f"INSERT INTO {commits_table} VALUES (?, ?, now())",
+                "values": [[self._queue.queue_id, b.batch_id] for b in batches],
+                "many": True,
+            }
+        )
+
+        start = time.perf_counter()
+        QuackConnector.run_instructions(con, stage)
+        timings["stage"] = time.perf_counter() - start
+
+        # A transaction can only write to one attached database, the in-memory first layer stays out of it.
+        start = time.perf_counter()
+        con.execute("BEGIN TRANSACTION")
+        try:
+            QuackConnector.run_instructions(con, merges)
+            con.execute("COMMIT")
+        except Exception:
+            QuackConnector.rollback(con)
+            raise
+        timings["commit"] = time.perf_counter() - start
+        metrics.observe("ducklake.commit", timings["commit"])
+
+    def _commit(self, batches: list[WriteAheadBatch]) -> CommitReport:
+        """Commit a group of batches in one transaction, retrying on commit conflicts."""
+
+        unknown_entities = sorted({b.entity for b in batches} - set(self._contracts))
+        if unknown_entities:
+            logs.error("Batches of entities without a contract.", entities=unknown_entities)
+            raise ValueError(f"Batches of entities without a contract: {unknown_entities}")
+
+        entities: list[str] = list(dict.fromkeys(b.entity for b in batches))
+        catalog: str = self._contracts[entities[0]].entity.catalog
+        commits_table: str = f"{catalog}.main.{WRITE_AHEAD_COMMITS_TABLE}"
+        setup: list[Any] = []
+        for entity in entities:
+            setup += self._contracts[entity].first_layer_instructions
+        setup += self._contracts[entities[0]].catalog_instructions
+        setup.append(
+            f"CREATE TABLE IF NOT EXISTS {commits_table} "
+            "(queue_id VARCHAR NOT NULL, batch_id BIGINT NOT NULL, committed_at TIMESTAMPTZ)"
+        )
+
+        attempt = 0
+        while True:
+            attempt += 1
+            timings: dict[str, float] = {}
+            try:
+                with QuackConnector.session(instructions=setup) as con:
+                    # A batch replayed after a crash may already be in DuckLake, it is only taken off the queue.
+                    committed = {
+                        r[0]
+                        for r in con.execute(
+                            f"SELECT batch_id FROM {commits_table} WHERE queue_id = ? AND batch_id IN "
+                            f"({', '.join('?' for _ in batches)})",
+                            [self._queue.queue_id, *(b.batch_id for b in batches)],
+                        ).fetchall()
+                    }
+                    pending = [b for b in batches if b.batch_id not in committed]
+                    if committed:
+                        logs.warning("Batches already committed, they are not written again.", batches=len(committed))
+
+                    if pending:
+                        self._write(con, pending, commits_table, timings)
+
+                break
+
+            except Exception as e:
+                if not QuackConnector.is_commit_conflict(e) or attempt >= self._max_attempts:
+                    raise
+
+                metrics.increment("ducklake.commit_conflicts")
+                backoff = min(self._max_retry_backoff, self._retry_backoff * 2 ** (attempt - 1))
+                backoff *= 0.5 + random.random() / 2
+                logs.warning("Commit conflict, retrying.", attempt=attempt, backoff=round(backoff, 3), error=str(e))
+                time.sleep(backoff)
+
+        self._queue.complete([b.batch_id for b in batches])
+        return CommitReport(
+            batches=len(batches),
+            rows=sum(b.rows for b in batches),
+            entities=entities,
+            attempts=attempt,
+            timings=timings,
+        )
+
+    def commit_once(self) -> CommitReport | None:
+        """Commit the next group of queued batches, None when the queue has nothing pending."""
+
+        batches = self._queue.claim(self._max_batches, self._max_rows)
+        if not batches:
+            return None
+
+        try:
+            report = self._commit(batches)
+
+        except Exception as e:
+            if len(batches) == 1:
+                self._queue.release([batches[0].batch_id], error=str(e), max_attempts=self._max_attempts)
+                logs.error("Batch commit failed.", batch_id=batches[0].batch_id, entity=batches[0].entity, error=str(e))
+                return CommitReport()
+
+            logs.warning(
+                "Grouped commit failed, committing its batches one by one.", batches=len(batches), error=str(e)
+            )
+            report = CommitReport()
+            for batch in batches:
+                try:
+                    batch_report = self._commit([batch])
+                except Exception as batch_error:
+                    self._queue.release([batch.batch_id], error=str(batch_error), max_attempts=self._max_attempts)
+                    logs.error(
+                        "Batch commit failed.", batch_id=batch.batch_id, entity=batch.entity, error=str(batch_error)
+                    )
+                    continue
+
+                report.batches += batch_report.batches
+                report.rows += batch_report.rows
+                report.attempts += batch_report.attempts
+                report.entities = list(dict.fromkeys(report.entities + batch_report.entities))
+
+        logs.info(
+            "Group Committed.",
+            batches=report.batches,
+            rows=report.rows,
+            entities=report.entities,
+            attempts=report.attempts,
+            timings={k: round(v, 4) for k, v in report.timings.items()},
+        )
+        return report
+
+    def drain(self) -> list[CommitReport]:
+        """Commit until no batch is pending."""
+
+        self._queue.recover()
+        reports: list[CommitReport] = []
+        while (report := self.commit_once()) is not None:
+            reports.append(report)
+
+        return reports
+
+    def run(self, stop_event: threading.Event | None = None, idle_interval: float = 0.5) -> None:
+        """Commit queued batches until the stop event is set, polling the queue when it is empty."""
+
+        stop_event = stop_event or threading.Event()
+        self._queue.recover()
+        logs.info("Commit Coordinator started.", queue=str(self._queue.queue_file))
+
+        while not stop_event.is_set():
+            if self.commit_once() is None:
+                stop_event.wait(idle_interval)
+
+        logs.info("Commit Coordinator stopped.")
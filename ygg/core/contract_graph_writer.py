@@ -0,0 +1,222 @@
+"""Graph ordered write of nested data contract documents, one batch per level in a single DuckLake transaction."""
+
+import contextlib
+import time
+from typing import Any
+
+import duckdb
+from glom import glom
+from pydantic import ConfigDict, Field
+
+from ygg.core.polyglot_contract import PolyglotContract
+from ygg.helpers.logical_data_models import PolyglotEntity, RecordValidationError, YggBaseModel
+from ygg.polyglot.quack_connector import QuackConnector
+from ygg.utils.ygg_logs import get_logger
+from ygg.utils.ygg_metrics import metrics
+
+logs = get_logger(logger_name="ContractGraphWriter")
+
+
+class ContractGraphLevel(YggBaseModel):
+    """Contract Graph Level, one entity of the contract tree."""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    contract: PolyglotContract = Field(..., description="Polyglot contract of the level entity")
+    document_path: str = Field(
+        default="", description="Path of the level documents inside the parent document, empty for the document itself"
+    )
+    parent: str | None = Field(default=None, description="Parent entity name, the previous level when not informed")
+
+
+class ContractGraphLevelReport(YggBaseModel):
+    """Contract Graph Level Report."""
+
+    entity: str = Field(..., description="Entity name")
+    rows: int = Field(default=0, description="Number of records written")
+    errors: list[RecordValidationError] = Field(default_factory=list, description="Records that failed validation")
+    timings: dict[str, float] = Field(default_factory=dict, description="Phase timings in seconds")
+
+
+class ContractGraphWriter:
+    """Contract Graph Writer.
+
+    Walks a nested contract document level by level, parents first. Each level is validated in one batch and its
+    records get the keys of their ancestors in memory, as hydrate_return would hand them one write at a time. The
+    first layer is staged on a single connection and every level is merged into DuckLake in one transaction.
+    """
+
+    def __init__(self, levels: list[ContractGraphLevel]):
+        """Initialize the Contract Graph Writer, levels are expected parents first."""
+
+        if not levels:
+            logs.error("Graph levels cannot be empty.")
+            raise ValueError("Graph levels cannot be empty.")
+
+        catalogs = {level.contract.entity.catalog for level in levels}
+        if len(catalogs) > 1:
+            logs.error("Graph levels must share the same catalog.", catalogs=sorted(catalogs))
+            raise ValueError(f"Graph levels must share the same catalog: {sorted(catalogs)}")
+
+        seen: list[str] = []
+        for i, level in enumerate(levels):
+            if i > 0 and level.parent is None:
+                level.parent = seen[-1]
+
+            if level.parent is not None and level.parent not in seen:
+                logs.error("Parent level must come before its children.", entity=level.contract.entity.name)
+                raise ValueError(f"Parent {level.parent} must come before {level.contract.entity.name}.")
+
+            seen.append(level.contract.entity.name)
+
+        self._levels: list[ContractGraphLevel] = levels
+
+    @staticmethod
+    def _get_children(document: dict, document_path: str) -> list[dict]:
+        """Get the child documents found at a path of a parent document."""
+
+        value = glom(document, document_path, default=None) if document_path else document
+        if isinstance(value, dict):
+            return [value]
+
+        if isinstance(value, list):
+            return [v for v in value if isinstance(v, dict)]
+
+        return []
+
+    @staticmethod
+    def _get_keys(record: Any, entity: PolyglotEntity) -> dict[str, Any]:
+        """Get the keys a record hands to its children, named as in hydrate_return."""
+
+        keys: dict[str, Any] = {}
+        for column in entity.columns:
+            if column.primary_key:
+                value = getattr(record, column.name, None)
+                keys[f"{entity.name}_{column.name}"] = None if value in (None, "None", "") else value
+
+        return keys
+
+    @property
+    def levels(self) -> list[ContractGraphLevel]:
+        """Get the graph levels, parents first."""
+        return list(self._levels)
+
+    def validate(self, document: dict) -> tuple[list[ContractGraphLevelReport], list[list[Any]]]:
+        """Validate every level and resolve the parent keys, returning the valid records of each level."""
+
+        nodes: dict[str, list[tuple[dict, dict[str, Any]]]] = {}
+        reports: list[ContractGraphLevelReport] = []
+        level_records: list[list[Any]] = []
+
+        for level in self._levels:
+            start = time.perf_counter()
+            entity: PolyglotEntity = level.contract.entity
+            parents = nodes.get(level.parent, []) if level.parent else [(document, {})]
+
+            children: list[dict] = []
+            ancestor_keys: list[dict[str, Any]] = []
+            for parent_document, parent_keys in parents:
+                for child in self._get_children(parent_document, level.document_path):
+                    children.append(child)
+                    ancestor_keys.append(parent_keys)
+
+            result = level.contract.model.inflate_many(children) if children else None
+            failed = {e.index for e in result.errors} if result else set()
+            valid = [i for i in range(len(children)) if i not in failed]
+
+            nodes[entity.name] = []
+            records = result.records if result else []
+            for i, record in zip(valid, records):
+                record._model_hydrate(ancestor_keys[i], trusted=True)
+                nodes[entity.name].append((children[i], {**ancestor_keys[i], **self._get_keys(record, entity)}))
+
+            level_records.append(records)
+            reports.append(
+                ContractGraphLevelReport(
+                    entity=entity.name,
+                    rows=len(records),
+                    errors=result.errors if result else [],
+                    timings={"validate": time.perf_counter() - start},
+                )
+            )
+
+        return reports, level_records
+
+    def _plan(self, document: dict) -> tuple[list[ContractGraphLevelReport], list[list[dict[str, Any]]]]:
+        """Validate every level and resolve the parent keys, returning the first layer inserts of each level."""
+
+        reports, level_records = self.validate(document)
+        statements: list[list[dict[str, Any]]] = []
+        for records in level_records:
+            level_statements, _ = PolyglotContract.get_first_layer_write_instructions(records)
+            statements.append(level_statements)
+
+        return reports, statements
+
+    @property
+    def setup_instructions(self) -> list[Any]:
+        """Get the instructions preparing a session for the writes, first layer entities and DuckLake catalog."""
+
+        setup: list[Any] = []
+        for level in self._levels:
+            setup += level.contract.first_layer_instructions
+        setup += self._levels[0].contract.catalog_instructions
+        return setup
+
+    def write(
+        self, document: dict, upsert: bool = True, session: duckdb.DuckDBPyConnection | None = None
+    ) -> list[ContractGraphLevelReport]:
+        """Write a nested contract document, every level as one batch, in dependency order.
+
+        A session prepared with setup_instructions is reused as is, so several documents skip the catalog attach.
+        """
+
+        if not document:
+            logs.error("Contract document cannot be empty.")
+            raise ValueError("Contract document cannot be empty.")
+
+        reports, statements = self._plan(document)
+
+        with contextlib.ExitStack() as stack:
+            con = session or stack.enter_context(QuackConnector.session(instructions=self.setup_instructions))
+            if session is not None:
+                # Rows staged by the previous document would be merged again.
+                for level in self._levels:
+                    con.execute(f"DELETE FROM {level.contract.entity.schema_}.{level.contract.entity.name}")
+
+            for report, level_statements in zip(reports, statements):
+                start = time.perf_counter()
+                if level_statements:
+                    QuackConnector.run_instructions(con, level_statements)
+                report.timings["stage"] = time.perf_counter() - start
+
+            # A transaction can only write to one attached database, the in-memory first layer stays out of it.
+            commit_start = time.perf_counter()
+            con.execute("BEGIN TRANSACTION")
+            try:
+                for level, report in zip(self._levels, reports):
+                    start = time.perf_counter()
+                    if report.rows:
+                        QuackConnector.run_instructions(
+                            con, [level.contract.get_second_layer_write_instruction(upsert)]
+                        )
+                    report.timings["write"] = time.perf_counter() - start
+
+                con.execute("COMMIT")
+                metrics.observe("ducklake.commit", time.perf_counter() - commit_start)
+
+            except Exception:
+                QuackConnector.rollback(con)
+                logs.error("Contract graph write rolled back.")
+                raise
+
+        for report in reports:
+            logs.info(
+                "Graph Level Written.",
+                entity=report.entity,
+                rows=report.rows,
+                errors=len(report.errors),
+                timings={k: round(v, 4) for k, v in report.timings.items()},
+            )
+
+        return reports
@@ -0,0 +1,154 @@
+"""Streaming ingestion of contract files through a bounded parse, validate, stage and commit pipeline."""
+
+import threading
+from pathlib import Path
+from typing import Any, Iterable
+
+from glom import glom
+from pydantic import Field
+
+import ygg.utils.commons as cm
+from ygg.core.polyglot_contract import PolyglotContract
+from ygg.helpers.logical_data_models import RecordValidationError, YggBaseModel
+from ygg.utils.pipeline import Pipeline, PipelineStage, PipelineStageMetrics
+from ygg.utils.ygg_logs import get_logger
+
+logs = get_logger(logger_name="ContractPipeline")
+
+
+class ContractIngestionReport(YggBaseModel):
+    """Contract Ingestion Report."""
+
+    entity: str = Field(..., description="Entity name")
+    documents: int = Field(default=0, description="Number of documents committed")
+    records: int = Field(default=0, description="Number of records committed")
+    commits: int = Field(default=0, description="Number of DuckLake writes")
+    errors: dict[str, list[RecordValidationError]] = Field(
+        default_factory=dict, description="Records that failed validation, by document"
+    )
+    stages: list[PipelineStageMetrics] = Field(default_factory=list, description="Metrics of every pipeline stage")
+
+
+class ContractIngestionPipeline:
+    """Contract Ingestion Pipeline.
+
+    Parses contract files, validates the records found at the document path, builds their first layer inserts and
+    writes them into DuckLake, every step as a pipeline stage. Parsing waits on disk and the commit waits on
+    DuckDb, both release the GIL, so they overlap with validation. The commit stage groups several documents in
+    one write, later documents replacing the records of earlier ones with the same keys.
+    """
+
+    def __init__(
+        self,
+        contract: PolyglotContract,
+        document_path: str = "",
+        parse_workers: int = 2,
+        validate_workers: int = 1,
+        stage_workers: int = 1,
+        commit_batch_size: int = 16,
+        queue_size: int = 16,
+    ):
+        """Initialize the Contract Ingestion Pipeline."""
+
+        if not contract:
+            logs.error("Polyglot Contract cannot be empty.")
+            raise ValueError("Polyglot Contract cannot be empty.")
+
+        self._contract: PolyglotContract = contract
+        self._document_path: str = document_path
+        self._parse_workers: int = parse_workers
+        self._validate_workers: int = validate_workers
+        self._stage_workers: int = stage_workers
+        self._commit_batch_size: int = commit_batch_size
+        self._queue_size: int = queue_size
+
+        self._lock = threading.Lock()
+        self._report: ContractIngestionReport | None = None
+
+    @staticmethod
+    def _parse(path: str | Path) -> tuple[str, Any]:
+        """Parse a contract file."""
+
+        path = str(path)
+        content = cm.get_json_file_content(path) if path.endswith(".json") else cm.get_yaml_content(path)
+        return path, content
+
+    def _validate(self, item: tuple[str, Any]) -> tuple[str, list[Any]] | None:
+        """Validate the records of a document, keeping the failed ones in the report."""
+
+        path, document = item
+        records = glom(document, self._document_path, default=None) if self._document_path else document
+        records = [records] if isinstance(records, dict) else [r for r in records or [] if isinstance(r, dict)]
+        if not records:
+            logs.warning("Document has no records.", document=path, document_path=self._document_path)
+            return None
+
+        result = self._contract.model.inflate_many(records)
+        if result.errors:
+            with self._lock:
+                self._report.errors[path] = result.errors
+
+        return (path, result.records) if result.records else None
+
+    def _stage(self, item: tuple[str, list[Any]]) -> tuple[str, list[dict[str, Any]], int]:
+        """Sign the records of a document and build their first layer inserts."""
+
+        path, records = item
+        statements, _ = PolyglotContract.get_first_layer_write_instructions(records)
+        return path, statements, len(records)
+
+    def _commit(self, items: list[tuple[str, list[dict[str, Any]], int]], upsert: bool) -> list[str]:
+        """Write a group of staged documents, in arrival order, returning their paths."""
+
+        statements = [s for _, document_statements, _ in items for s in document_statements]
+        self._contract.write_staged(statements, upsert, replace_duplicates=True)
+
+        with self._lock:
+            self._report.commits += 1
+            self._report.documents += len(items)
+            self._report.records += sum(rows for _, _, rows in items)
+
+        return [path for path, _, _ in items]
+
+    def run(self, files: Iterable[str | Path], upsert: bool = True) -> ContractIngestionReport:
+        """Ingest the contract files, streaming them through the pipeline."""
+
+        self._report = ContractIngestionReport(entity=self._contract.entity.name)
+        pipeline = Pipeline(
+            stages=[
+                PipelineStage(
+                    name="parse", function=self._parse, workers=self._parse_workers, queue_size=self._queue_size
+                ),
+                PipelineStage(
+                    name="validate",
+                    function=self._validate,
+                    workers=self._validate_workers,
+                    queue_size=self._queue_size,
+                ),
+                PipelineStage(
+                    name="stage", function=self._stage, workers=self._stage_workers, queue_size=self._queue_size
+                ),
+                PipelineStage(
+                    name="commit",
+                    function=lambda items: self._commit(items, upsert),
+                    batch_size=self._commit_batch_size,
+                    queue_size=self._queue_size,
+                    fan_out=True,
+                ),
+            ],
+            name=f"{self._contract.entity.name}-ingestion",
+        )
+
+        for path in pipeline.run(files):
+            logs.debug("Document committed.", document=path)
+
+        self._report.stages = pipeline.metrics
+        logs.info(
+            "Contract Files Ingested.",
+            entity=self._report.entity,
+            documents=self._report.documents,
+            records=self._report.records,
+            commits=self._report.commits,
+            failed_documents=len(self._report.errors),
+        )
+        return self._report
@@ -0,0 +1,233 @@
+"""Incremental registration of data contracts, only the nodes whose signature changed are written."""
+
+import time
+from datetime import datetime, timezone
+from typing import Any
+
+from pydantic import ConfigDict, Field
+
+from ygg.core.contract_graph_writer import ContractGraphWriter
+from ygg.core.polyglot_contract import PolyglotContract
+from ygg.helpers.logical_data_models import PolyglotEntity, YggBaseModel
+from ygg.polyglot.quack_connector import QuackConnector
+from ygg.polyglot.quack_meta_class import QuackMetaClass
+from ygg.polyglot.quack_signature import RECORD_HASH_COLUMN
+from ygg.utils.signature_engine import SignatureEngine
+from ygg.utils.ygg_logs import get_logger
+
+logs = get_logger(logger_name="ContractRegistration")
+
+
+class RegistrationLevel(YggBaseModel):
+    """Registration Level, the validated records of one entity of the contract tree."""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    contract: PolyglotContract = Field(..., description="Polyglot contract of the level entity")
+    records: list[Any] = Field(default_factory=list, description="Validated records of the level")
+    scope: dict[str, Any] = Field(
+        ..., description="Columns selecting the stored records of the contract, e.g. contract_id"
+    )
+
+
+class RegistrationDiff(YggBaseModel):
+    """Registration Diff."""
+
+    entity: str = Field(..., description="Entity name")
+    inserted: list[tuple] = Field(default_factory=list, description="Keys of the records not stored yet")
+    changed: list[tuple] = Field(default_factory=list, description="Keys of the records whose signature changed")
+    removed: list[tuple] = Field(default_factory=list, description="Keys of stored records missing from the input")
+    kept: list[tuple] = Field(
+        default_factory=list, description="Keys of removed records left stored, the entity does not allow deletes"
+    )
+    unchanged: int = Field(default=0, description="Number of records already stored with the same signature")
+    timings: dict[str, float] = Field(default_factory=dict, description="Phase timings in seconds")
+
+
+class ContractRegistration:
+    """Incremental Contract Registration.
+
+    The incoming tree is the authority for its scope: inserted and changed nodes are replaced by key whatever the
+    update settings of their entity are, removed nodes are deleted when their entity allows deletes.
+    """
+
+    def __init__(self, levels: list[RegistrationLevel]):
+        """Initialize the Contract Registration, levels are expected parents first."""
+
+        if not levels:
+            logs.error("Registration levels cannot be empty.")
+            raise ValueError("Registration levels cannot be empty.")
+
+        for level in levels:
+            entity: PolyglotEntity = level.contract.entity
+            column_names = [c.name for c in entity.columns]
+            if RECORD_HASH_COLUMN not in column_names:
+                logs.error("Entity has no record signature column.", entity=entity.name)
+                raise ValueError(f"Entity {entity.name} has no {RECORD_HASH_COLUMN} column.")
+
+            # Stored records outside the scope would be planned as removed, every other contract's rows with them.
+            if not level.scope:
+                logs.error("Registration levels must be scoped.", entity=entity.name)
+                raise ValueError(f"Registration level {entity.name} must be scoped, e.g. by contract_id.")
+
+            unknown_scope = [k for k in level.scope if k not in column_names]
+            if unknown_scope:
+                logs.error("Scope must be entity columns.", entity=entity.name, scope=unknown_scope)
+                raise ValueError(f"Scope must be entity columns: {unknown_scope}")
+
+        self._levels: list[RegistrationLevel] = levels
+
+    @classmethod
+    def from_graph(cls, writer: ContractGraphWriter, document: dict) -> "ContractRegistration":
+        """Get the registration of a contract document, every level scoped by the keys of its root record.
+
+        The root keys reach the levels below as hydrated columns, e.g. contract_id for the id of a contract.
+        """
+
+        reports, level_records = writer.validate(document)
+        invalid = {r.entity: len(r.errors) for r in reports if r.errors}
+        # Records that failed validation would be planned as removed.
+        if invalid:
+            logs.error("Contract document has invalid records.", invalid=invalid)
+            raise ValueError(f"Contract document has invalid records: {invalid}")
+
+        root: PolyglotEntity = writer.levels[0].contract.entity
+        if len(level_records[0]) != 1:
+            logs.error("Contract document must hold one root record.", entity=root.name, records=len(level_records[0]))
+            raise ValueError(f"Contract document must hold one {root.name} record, found {len(level_records[0])}.")
+
+        root_keys: dict[str, Any] = {
+            c.name: getattr(level_records[0][0], c.name, None) for c in root.columns if c.primary_key
+        }
+        levels: list[RegistrationLevel] = []
+        for i, (level, records) in enumerate(zip(writer.levels, level_records)):
+            scope = root_keys if i == 0 else {f"{root.name}_{k}": v for k, v in root_keys.items()}
+            levels.append(RegistrationLevel(contract=level.contract, records=records, scope=scope))
+
+        return cls(levels)
+
+    @staticmethod
+    def _key(values: tuple | list) -> tuple:
+        """Normalize primary key values, the incoming and the stored ones alike."""
+
+        # Keys are compared as typed values, an aware timestamp reads back in the session time zone.
+        return tuple(v.astimezone(timezone.utc) if isinstance(v, datetime) and v.tzinfo else v for v in values)
+
+    @staticmethod
+    def _matches_previous_algorithm(record: Any, stored_signature: str | None, entity: PolyglotEntity) -> bool:
+        """Whether a signature stored before the entity switched algorithm still matches the record."""
+
+        if not stored_signature:
+            return False
+
+        algorithm = SignatureEngine.get_signature_algorithm(stored_signature)
+        if algorithm.value == entity.signature_algorithm:
+            return False
+
+        return record.matches_record_signature(stored_signature)
+
+    def _get_stored_signatures(self) -> list[dict[tuple, str]]:
+        """Fetch the stored signatures of every level in a single query."""
+
+        selects: list[str] = []
+        values: list[Any] = []
+        key_columns: list[list[str]] = []
+        for i, level in enumerate(self._levels):
+            entity: PolyglotEntity = level.contract.entity
+            primary_key = [QuackMetaClass.physical_column_name(c.name) for c in entity.columns if c.primary_key]
+            # Each level reads its key into its own columns, so key values keep their catalog types.
+            key_columns.append([f"level_{i}_key_{j}" for j in range(len(primary_key))])
+            record_key = "".join(f", {pk} AS {k}" for pk, k in zip(primary_key, key_columns[i]))
+            where = " AND ".join(f"{QuackMetaClass.physical_column_name(k)} = ?" for k in level.scope)
+            selects.append(
+                f"SELECT {i} AS level, {RECORD_HASH_COLUMN} AS record_hash{record_key} "
+                f"FROM {entity.catalog}.{entity.schema_}.{entity.name} WHERE {where}"
+            )
+            values.extend(level.scope.values())
+
+        rows = QuackConnector.fetch_records(
+            statement=" UNION ALL BY NAME ".join(selects),
+            values=values,
+            instructions=self._levels[0].contract.catalog_instructions,
+        )
+
+        stored: list[dict[tuple, str]] = [{} for _ in self._levels]
+        for row in rows:
+            level = row["level"]
+            stored[level][self._key([row[k] for k in key_columns[level]])] = row["record_hash"]
+
+        return stored
+
+    def _plan(self) -> list[tuple[RegistrationDiff, list[tuple[Any, str]]]]:
+        """Compare the incoming tree with the stored signatures."""
+
+        start = time.perf_counter()
+        incoming: list[dict[tuple, tuple[Any, str]]] = []
+        for level in self._levels:
+            incoming.append({self._key(r.record_key): (r, r.record_signature) for r in level.records})
+        signature_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        stored = self._get_stored_signatures()
+        query_time = time.perf_counter() - start
+
+        plans: list[tuple[RegistrationDiff, list[tuple[Any, str]]]] = []
+        for level, level_incoming, level_stored in zip(self._levels, incoming, stored):
+            diff = RegistrationDiff(entity=level.contract.entity.name)
+            staged: list[tuple[Any, str]] = []
+            for key, (record, signature) in level_incoming.items():
+                if key not in level_stored:
+                    diff.inserted.append(key)
+                    staged.append((record, signature))
+                elif level_stored[key] == signature or self._matches_previous_algorithm(
+                    record, level_stored[key], level.contract.entity
+                ):
+                    diff.unchanged += 1
+                else:
+                    diff.changed.append(key)
+                    staged.append((record, signature))
+
+            diff.removed = [k for k in level_stored if k not in level_incoming]
+            diff.timings = {"signatures": signature_time, "stored_signatures_query": query_time}
+            plans.append((diff, staged))
+
+        return plans
+
+    def diff(self) -> list[RegistrationDiff]:
+        """Compute the diff between the incoming tree and the catalog without writing."""
+        return [diff for diff, _ in self._plan()]
+
+    def register(self) -> list[RegistrationDiff]:
+        """Write only the inserted, changed and removed nodes of the tree."""
+
+        plans = self._plan()
+        for level, (diff, staged) in zip(self._levels, plans):
+            entity: PolyglotEntity = level.contract.entity
+
+            start = time.perf_counter()
+            if staged:
+                # The signatures computed for the plan are the ones written.
+                records, signatures = zip(*staged)
+                level.contract.replace_contracts(list(records), list(signatures))
+
+            if diff.removed:
+                if entity.delete_allowed:
+                    level.contract.delete_contracts(diff.removed)
+                else:
+                    diff.kept = list(diff.removed)
+                    logs.warning("Entity does not allow deletes, removed records are kept.", entity=entity.name)
+
+            diff.timings["write"] = time.perf_counter() - start
+
+            logs.info(
+                "Entity Registered.",
+                entity=entity.name,
+                inserted=len(diff.inserted),
+                changed=len(diff.changed),
+                removed=len(diff.removed),
+                kept=len(diff.kept),
+                unchanged=diff.unchanged,
+                timings={k: round(v, 4) for k, v in diff.timings.items()},
+            )
+
+        return [diff for diff, _ in plans]
@@ -0,0 +1,209 @@
+"""Resident watcher registering the contracts of a folder as they change."""
+
+import threading
+import time
+from pathlib import Path
+
+from ygg.core.folder_registration import FolderRegistration
+from ygg.helpers.logical_data_models import WatchStatus
+from ygg.utils.commons import get_json_signature
+from ygg.utils.ygg_logs import get_logger
+
+logs = get_logger(logger_name="ContractWatcher")
+
+
+class ContractWatcher:
+    """Contract Watcher.
+
+    Polls the contracts folder and registers the files that changed once they stay untouched for the debounce
+    interval, so an editor saving in several writes triggers one registration. A touched file is registered only
+    when the signature of its content changed. The registration keeps its session between polls, models and the
+    DuckLake catalog stay warm and a change reaches the catalog within a poll interval and a debounce.
+    """
+
+    def __init__(
+        self,
+        registration: FolderRegistration,
+        folder: Path | str,
+        include: list[str] | None = None,
+        exclude: list[str] | None = None,
+        poll_interval: float = 0.5,
+        debounce: float = 0.25,
+        initial_sync: bool = True,
+        upsert: bool = True,
+        status_file: Path | str | None = None,
+    ):
+        """Initialize the Contract Watcher, initial_sync registers the files found on the first poll."""
+
+        if not registration:
+            logs.error("Folder Registration cannot be empty.")
+            raise ValueError("Folder Registration cannot be empty.")
+
+        if poll_interval <= 0 or debounce < 0:
+            logs.error("Poll interval must be positive.", poll_interval=poll_interval, debounce=debounce)
+            raise ValueError("Poll interval must be positive and debounce cannot be negative.")
+
+        self._registration: FolderRegistration = registration
+        self._folder: Path = Path(folder)
+        self._include: list[str] | None = include
+        self._exclude: list[str] | None = exclude
+        self._poll_interval: float = poll_interval
+        self._debounce: float = debounce
+        self._initial_sync: bool = initial_sync
+        self._upsert: bool = upsert
+        self._status_file: Path | None = Path(status_file) if status_file else None
+
+        self._stats: dict[Path, tuple[int, int]] = {}
+        self._signatures: dict[Path, str] = {}
+        self._pending: dict[Path, tuple[tuple[int, int], float]] = {}
+        self._first_poll: bool = True
+        self._latency_total: float = 0.0
+        self._latency_count: int = 0
+
+        self._lock = threading.Lock()
+        self._status: WatchStatus = WatchStatus(folder=str(self._folder))
+
+    @property
+    def status(self) -> WatchStatus:
+        """Get a snapshot of the watcher status."""
+
+        with self._lock:
+            return self._status.model_copy()
+
+    def _scan(self) -> dict[Path, tuple[int, int]]:
+        """Get the modification time and size of every contract file."""
+
+        stats: dict[Path, tuple[int, int]] = {}
+        for file in FolderRegistration.discover(self._folder, self._include, self._exclude):
+            try:
+                stat = file.stat()
+            except FileNotFoundError:
+                continue
+
+            stats[file] = (stat.st_mtime_ns, stat.st_size)
+
+        return stats
+
+    def _record_latency(self, latency: float) -> None:
+        """Add a change to commit latency to the status."""
+
+        self._latency_total += latency
+        self._latency_count += 1
+        self._status.last_latency_seconds = latency
+        self._status.max_latency_seconds = max(self._status.max_latency_seconds, latency)
+        self._status.mean_latency_seconds = self._latency_total / self._latency_count
+
+    def _process(self, file: Path, stat: tuple[int, int], baseline: bool) -> bool:
+        """Register a settled file when its content signature changed, returning whether it was registered."""
+
+        try:
+            document = FolderRegistration.load_document(file)
+            signature = get_json_signature(document or {})
+        except Exception as e:
+            with self._lock:
+                self._status.failed += 1
+                self._status.last_error = str(e)
+            logs.error("Contract file could not be read.", file=str(file), error=str(e))
+            return False
+
+        if self._signatures.get(file) == signature:
+            with self._lock:
+                self._status.unchanged += 1
+            logs.debug("Contract file content unchanged.", file=str(file))
+            return False
+
+        if baseline and not self._initial_sync:
+            self._signatures[file] = signature
+            return False
+
+        report = self._registration.register_file(file, upsert=self._upsert, document=document)
+        with self._lock:
+            if report.error is not None:
+                # The signature is not kept, the next change of the file tries again.
+                self._status.failed += 1
+                self._status.last_error = report.error
+                return False
+
+            self._signatures[file] = signature
+            self._status.registered += 1
+            if not baseline:
+                self._record_latency(max(0.0, time.time() - stat[0] / 1e9))
+
+        logs.info("Contract file registered.", file=str(file), rows=report.rows, seconds=round(report.seconds, 3))
+        return True
+
+    def _write_status(self) -> None:
+        """Write the status to the status file, when informed, for probes outside the process."""
+
+        if self._status_file is not None:
+            self._status_file.write_text(self.status.model_dump_json(indent=2))
+
+    def poll_once(self) -> int:
+        """Poll the folder once and register the settled changes, returning how many files were registered."""
+
+        now = time.monotonic()
+        stats = self._scan()
+
+        for file in self._stats.keys() - stats.keys():
+            self._signatures.pop(file, None)
+            self._pending.pop(file, None)
+            logs.info("Contract file removed, its records stay in the catalog.", file=str(file))
+
+        for file, stat in stats.items():
+            if self._stats.get(file) != stat:
+                self._pending[file] = (stat, now)
+
+        self._stats = stats
+
+        # Files found on the first poll are settled already.
+        baseline = self._first_poll
+        ready = [f for f, (_, seen) in self._pending.items() if baseline or now - seen >= self._debounce]
+        self._first_poll = False
+
+        registered = 0
+        for file in sorted(ready):
+            stat, _ = self._pending.pop(file)
+            registered += self._process(file, stat, baseline)
+
+        with self._lock:
+            self._status.cycles += 1
+            self._status.files = len(stats)
+            self._status.pending = len(self._pending)
+
+        if ready:
+            logs.info("Watch Status.", **self.status.model_dump())
+
+        self._write_status()
+        return registered
+
+    def run(self, stop_event: threading.Event | None = None) -> WatchStatus:
+        """Poll the folder until the stop event is set or the process is interrupted, returning the final status."""
+
+        stop_event = stop_event or threading.Event()
+        with self._lock:
+            self._status.running = True
+
+        logs.info(
+            "Contract Watcher Started.",
+            folder=str(self._folder),
+            poll_interval=self._poll_interval,
+            debounce=self._debounce,
+        )
+        try:
+            while not stop_event.is_set():
+                start = time.perf_counter()
+                self.poll_once()
+                stop_event.wait(max(0.0, self._poll_interval - (time.perf_counter() - start)))
+
+        except KeyboardInterrupt:
+            logs.info("Contract Watcher interrupted.")
+
+        finally:
+            with self._lock:
+                self._status.running = False
+            self._registration.close()
+            self._write_status()
+
+        status = self.status
+        logs.info("Contract Watcher Stopped.", **status.model_dump())
+        return status
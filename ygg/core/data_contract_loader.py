@@ -3,21 +3,23 @@
 from collections import defaultdict
 from typing import Annotated, Any, Literal, Optional, Type
 
-from glom import glom
 from pydantic import ConfigDict, Field, create_model
 
 import ygg.utils.ygg_logs as log_utils
+from ygg.core.odcs_schema_index import OdcsSchemaIndex
 from ygg.core.shared_model_mixin import SharedModelMixin
 from ygg.helpers.data_types import get_data_type
 from ygg.helpers.enums import Model
 from ygg.helpers.logical_data_models import (
     ModelSettings,
+    OdcsPropertySpec,
     PolyglotEntity,
     PolyglotEntityColumn,
     PolyglotEntityColumnDataType,
     YggBaseModel,
     YggConfig,
 )
+from ygg.utils.ygg_metrics import metrics
 
 logs = log_utils.get_logger(logger_name="DynamicModelFactory")
 
@@ -25,6 +27,7 @@ logs = log_utils.get_logger(logger_name="DynamicModelFactory")
 class DataContractLoader:
     """Dynamic Models Factory."""
 
+    @metrics.timed("data_contract_loader.init")
     def __init__(
         self,
         model: Model,
@@ -32,8 +35,9 @@ class DataContractLoader:
         odcs_schema_reference: dict,
         data_contract_schema: dict,
         catalog_name: str | None = None,
+        odcs_schema_signature: str | None = None,
     ):
-        """Initialize the Dynamic Models Factory."""
+        """Initialize the Dynamic Models Factory, odcs_schema_signature identifies the ODCS schema content."""
 
         if not model:
             raise ValueError("Model not provided.")
@@ -42,7 +46,12 @@ class DataContractLoader:
         logs.debug("Initializing Dynamic Models Factory.", model=self._model.value)
 
         data_contract_schema_config: YggConfig = YggConfig(**data_contract_schema_config)
-        self._odcs_schema: dict = odcs_schema_reference
+        self._odcs_schema_index: OdcsSchemaIndex = OdcsSchemaIndex.for_schema(
+            odcs_schema=odcs_schema_reference,
+            odcs_version=data_contract_schema_config.odcs_version,
+            odcs_schema_file=data_contract_schema_config.odcs_schema_file,
+            odcs_schema_signature=odcs_schema_signature,
+        )
         self._catalog_name: str = catalog_name
         self._model_commons: dict | None = data_contract_schema_config.commons if data_contract_schema_config else None
         self._data_contract_schema: dict | None = data_contract_schema
@@ -54,6 +63,8 @@ class DataContractLoader:
         self._create_model_instance()
 
         self._polyglot_entity: PolyglotEntity = self.cast_dynamic_model_to_polyglot_entity()
+        self._model_instance.bind_polyglot_entity(self._polyglot_entity)
+        self._model_read_instance.bind_polyglot_entity(self._polyglot_entity)
         logs.debug("Polyglot Instance Created.", instance=self.polyglot_entity.name)
 
     @property
@@ -90,16 +101,14 @@ class DataContractLoader:
 
         for prop in self._model_settings.properties:
             if prop.odcs_schema:
-                odcs_: dict = glom(self._odcs_schema, prop.odcs_schema)
+                odcs_: OdcsPropertySpec = self._odcs_schema_index.get_property_spec(prop.odcs_schema)
                 prop.alias = prop.odcs_schema.split(".")[-1] if not prop.alias else prop.alias
-                prop.type = odcs_.get("type", None) if not prop.type else prop.type
-                prop.default = odcs_.get("default", None) if not prop.default else prop.default
-                prop.enum = odcs_.get("enum", None) if not prop.enum else prop.enum
-                prop.description = odcs_.get("description", None) if not prop.description else prop.description
-                prop.examples = odcs_.get("examples", None) if not prop.examples else prop.examples
-
-                odcs_: dict = glom(self._odcs_schema, prop.odcs_schema)
-                prop.required = odcs_.get("required", None) if not prop.required else prop.required
+                prop.type = odcs_.type if not prop.type else prop.type
+                prop.default = odcs_.default if not prop.default else prop.default
+                prop.enum = odcs_.enum if not prop.enum else prop.enum
+                prop.description = odcs_.description if not prop.description else prop.description
+                prop.examples = odcs_.examples if not prop.examples else prop.examples
+                prop.required = odcs_.required if not prop.required else prop.required
 
             if prop.enum and isinstance(prop.enum, list):
                 dtype = Literal[tuple(prop.enum)]  # type: ignore
@@ -170,6 +179,7 @@ class DataContractLoader:
                 default_value=prop.default if prop.default and prop.default != ... else None,
                 default_value_function=prop.physical_default_function,
                 examples=prop.examples,
+                renamed_from=prop.renamed_from,
             )
             columns.append(entity_column)
 
@@ -181,6 +191,7 @@ class DataContractLoader:
                 comment=model.description,
                 update_allowed=False,
                 delete_allowed=False,
+                signature_algorithm=model.signature_algorithm,
             )
 
         return polyglot_entity
@@ -0,0 +1,199 @@
+"""Folder wide registration of contract files over a bounded pool of workers sharing warm sessions."""
+
+import fnmatch
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from pathlib import Path
+
+import duckdb
+
+from ygg.core.contract_graph_writer import ContractGraphWriter
+from ygg.helpers.logical_data_models import FileRegistrationReport, FolderRegistrationReport
+from ygg.polyglot.quack_connector import QuackConnector
+from ygg.utils.commons import get_json_file_content, get_yaml_content
+from ygg.utils.ygg_logs import get_logger
+
+logs = get_logger(logger_name="FolderRegistration")
+
+DEFAULT_CONTRACT_PATTERNS: list[str] = ["**/*.yaml", "**/*.yml", "**/*.json"]
+
+
+class FolderRegistration:
+    """Folder Registration.
+
+    Registers every contract file of a folder in one process. The writer, and the schema config behind it, is built
+    once, and each worker thread keeps its own session with the first layer and DuckLake catalog attached, so a file
+    costs its validation and commit only. DuckDb releases the GIL while it runs, the workers overlap on the catalog
+    round trips. A failed file is reported and the run goes on, commit conflicts between workers are retried.
+    """
+
+    def __init__(
+        self,
+        writer: ContractGraphWriter,
+        workers: int = 4,
+        max_attempts: int = 3,
+        retry_backoff: float = 0.5,
+        slowest_files: int = 10,
+    ):
+        """Initialize the Folder Registration."""
+
+        if not writer:
+            logs.error("Contract Graph Writer cannot be empty.")
+            raise ValueError("Contract Graph Writer cannot be empty.")
+
+        if workers < 1:
+            logs.error("Workers must be positive.", workers=workers)
+            raise ValueError("Workers must be positive.")
+
+        self._writer: ContractGraphWriter = writer
+        self._workers: int = workers
+        self._max_attempts: int = max_attempts
+        self._retry_backoff: float = retry_backoff
+        self._slowest_files: int = slowest_files
+
+        self._local = threading.local()
+        self._sessions = ExitStack()
+        self._sessions_lock = threading.Lock()
+
+    @staticmethod
+    def discover(folder: Path | str, include: list[str] | None = None, exclude: list[str] | None = None) -> list[Path]:
+        """Find the contract files of a folder matching any include pattern and no exclude pattern."""
+
+        folder = Path(folder)
+        if not folder.is_dir():
+            logs.error("Contracts folder not found.", folder=str(folder))
+            raise ValueError(f"Contracts folder {folder} not found.")
+
+        files: set[Path] = set()
+        for pattern in include or DEFAULT_CONTRACT_PATTERNS:
+            files.update(f for f in folder.glob(pattern) if f.is_file())
+
+        if exclude:
+            files = {f for f in files if not any(fnmatch.fnmatch(f.relative_to(folder).as_posix(), p) for p in exclude)}
+
+        return sorted(files)
+
+    def _get_session(self) -> duckdb.DuckDBPyConnection:
+        """Get the session of the current worker, opening it on its first file."""
+
+        session = getattr(self._local, "session", None)
+        if session is None:
+            with self._sessions_lock:
+                session = self._sessions.enter_context(
+                    QuackConnector.session(instructions=self._writer.setup_instructions)
+                )
+            self._local.session = session
+
+        return session
+
+    def _drop_session(self) -> None:
+        """Drop the session of the current worker after a failure, the next file opens a new one."""
+
+        session = getattr(self._local, "session", None)
+        self._local.session = None
+        if session is not None:
+            session.close()
+
+    def close(self) -> None:
+        """Close the sessions of every worker."""
+        self._sessions.close()
+
+    @staticmethod
+    def load_document(file: Path | str) -> dict:
+        """Load a contract document, JSON or YAML after the file suffix."""
+        return get_json_file_content(str(file)) if Path(file).suffix.lower() == ".json" else get_yaml_content(str(file))
+
+    def register_file(
+        self, file: Path | str, upsert: bool = True, document: dict | None = None
+    ) -> FileRegistrationReport:
+        """Register a contract file on the session of the current worker, reporting instead of raising."""
+
+        report = FileRegistrationReport(file=str(file))
+        start = time.perf_counter()
+        try:
+            if document is None:
+                document = self.load_document(file)
+
+            while True:
+                report.attempts += 1
+                try:
+                    level_reports = self._writer.write(document, upsert=upsert, session=self._get_session())
+                    break
+
+                except Exception as e:
+                    if not QuackConnector.is_commit_conflict(e) or report.attempts >= self._max_attempts:
+                        raise
+
+                    backoff = self._retry_backoff * 2 ** (report.attempts - 1) * (0.5 + random.random() / 2)
+                    logs.warning("Commit conflict, retrying file.", file=str(file), backoff=round(backoff, 3))
+                    time.sleep(backoff)
+
+            report.rows = sum(r.rows for r in level_reports)
+            report.errors = sum(len(r.errors) for r in level_reports)
+
+        except Exception as e:
+            self._drop_session()
+            report.error = str(e)
+            logs.error("Contract file failed.", file=str(file), error=str(e))
+
+        report.seconds = time.perf_counter() - start
+        return report
+
+    def register(
+        self,
+        folder: Path | str,
+        include: list[str] | None = None,
+        exclude: list[str] | None = None,
+        upsert: bool = True,
+    ) -> FolderRegistrationReport:
+        """Register every contract file of a folder, summarizing throughput, failures and the slowest files."""
+
+        files = self.discover(folder, include, exclude)
+        logs.info("Folder Registration Started.", folder=str(folder), files=len(files), workers=self._workers)
+
+        start = time.perf_counter()
+        try:
+            with ThreadPoolExecutor(max_workers=self._workers, thread_name_prefix="ygg-register") as pool:
+                reports = list(pool.map(lambda f: self.register_file(f, upsert=upsert), files))
+
+        finally:
+            # The pool threads are gone, their sessions with them.
+            self.close()
+
+        elapsed = time.perf_counter() - start
+        registered = [r for r in reports if r.error is None]
+        rows = sum(r.rows for r in registered)
+
+        summary = FolderRegistrationReport(
+            folder=str(folder),
+            files=len(files),
+            registered=len(registered),
+            rows=rows,
+            seconds=elapsed,
+            files_per_second=len(registered) / elapsed if elapsed else 0.0,
+            rows_per_second=rows / elapsed if elapsed else 0.0,
+            failures=[r for r in reports if r.error is not None],
+            slowest=sorted(reports, key=lambda r: r.seconds, reverse=True)[: self._slowest_files],
+        )
+
+        logs.info(
+            "Folder Registration Finished.",
+            folder=summary.folder,
+            files=summary.files,
+            registered=summary.registered,
+            failed=len(summary.failures),
+            rows=summary.rows,
+            seconds=round(summary.seconds, 3),
+            files_per_second=round(summary.files_per_second, 2),
+            rows_per_second=round(summary.rows_per_second, 2),
+        )
+        for report in summary.slowest:
+            logs.info("Slow Contract File.", file=report.file, seconds=round(report.seconds, 3), rows=report.rows)
+
+        for report in summary.failures:
+            logs.warning("Failed Contract File.", file=report.file, error=report.error)
+
+        return summary
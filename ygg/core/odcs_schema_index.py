@@ -0,0 +1,175 @@
+"""ODCS schema index, flattens and resolves the ODCS JSON schema once per schema file."""
+
+import threading
+from typing import Any
+
+from ygg.helpers.logical_data_models import OdcsPropertySpec
+from ygg.utils.ygg_logs import get_logger
+
+logs = get_logger(logger_name="OdcsSchemaIndex")
+
+_INDEXES: dict[tuple[str, str], tuple[str | None, "OdcsSchemaIndex"]] = {}
+_INDEXES_LOCK = threading.Lock()
+
+
+class OdcsSchemaIndex:
+    """ODCS Schema Index."""
+
+    def __init__(self, odcs_schema: dict):
+        """Initialize the ODCS Schema Index."""
+
+        if not odcs_schema:
+            logs.error("ODCS schema cannot be empty.")
+            raise ValueError("ODCS schema cannot be empty.")
+
+        self._odcs_schema: dict = odcs_schema
+        self._nodes: dict[str, Any] = {}
+        self._specs: dict[str, OdcsPropertySpec] = {}
+
+        self._build_index()
+        logs.debug("ODCS Schema Index Built.", paths=len(self._nodes))
+
+    @classmethod
+    def for_schema(
+        cls, odcs_schema: dict, odcs_version: str, odcs_schema_file: str, odcs_schema_signature: str | None = None
+    ) -> "OdcsSchemaIndex":
+        """Get the shared index for an ODCS schema, building it again when the schema signature or object changes."""
+
+        key = (odcs_version, odcs_schema_file)
+        with _INDEXES_LOCK:
+            signature, index = _INDEXES.get(key, (None, None))
+            # Hashing a large schema costs more than the lookups the index saves, without a signature the very
+            # same schema object must be handed over again.
+            if odcs_schema_signature:
+                is_current = signature == odcs_schema_signature
+            else:
+                is_current = signature is None and index is not None and index._odcs_schema is odcs_schema
+
+            if is_current:
+                return index
+
+            logs.info("Building ODCS Schema Index.", odcs_version=odcs_version, schema_file=odcs_schema_file)
+            index = cls(odcs_schema)
+            _INDEXES[key] = (odcs_schema_signature, index)
+
+        return index
+
+    @staticmethod
+    def clear() -> None:
+        """Drop every shared index."""
+
+        with _INDEXES_LOCK:
+            _INDEXES.clear()
+
+    def _lookup_pointer(self, ref: str) -> Any:
+        """Return the raw node a local JSON pointer ($ref) targets."""
+
+        if not ref.startswith("#"):
+            logs.error("Only local $ref pointers are supported.", ref=ref)
+            raise ValueError(f"Only local $ref pointers are supported: {ref}")
+
+        node: Any = self._odcs_schema
+        for token in [t for t in ref[1:].split("/") if t]:
+            token = token.replace("~1", "/").replace("~0", "~")
+            node = node[int(token)] if isinstance(node, list) else node[token]
+
+        return node
+
+    def _resolve(self, node: Any) -> Any:
+        """Resolve a node's $ref chain; sibling keys override the referenced definition."""
+
+        seen: set[str] = set()
+        while isinstance(node, dict) and "$ref" in node:
+            ref = node["$ref"]
+            if ref in seen:
+                logs.error("Circular $ref found in ODCS schema.", ref=ref)
+                raise ValueError(f"Circular $ref found in ODCS schema: {ref}")
+
+            seen.add(ref)
+            siblings = {k: v for k, v in node.items() if k != "$ref"}
+            node = {**self._lookup_pointer(ref), **siblings}
+
+        return node
+
+    @staticmethod
+    def _to_spec(node: Any) -> OdcsPropertySpec:
+        """Precompute the attributes the loader reads from an ODCS node."""
+
+        if not isinstance(node, dict):
+            return OdcsPropertySpec()
+
+        return OdcsPropertySpec(
+            type=node.get("type", None),
+            default=node.get("default", None),
+            enum=node.get("enum", None),
+            description=node.get("description", None),
+            examples=node.get("examples", None),
+            required=node.get("required", None),
+        )
+
+    def _build_index(self) -> None:
+        """Flatten every addressable path of the schema into the index."""
+
+        stack: list[tuple[str, Any]] = [("", self._odcs_schema)]
+        while stack:
+            path, node = stack.pop()
+            is_reference = isinstance(node, dict) and "$ref" in node
+            node = self._resolve(node)
+
+            if path:
+                self._nodes[path] = node
+                self._specs[path] = self._to_spec(node)
+
+            # Paths below a $ref are walked lazily, this keeps recursive definitions finite.
+            if is_reference:
+                continue
+
+            prefix = f"{path}." if path else ""
+            if isinstance(node, dict):
+                children = node.items()
+            elif isinstance(node, list):
+                children = enumerate(node)
+            else:
+                continue
+
+            for key, child in children:
+                if isinstance(child, (dict, list)):
+                    stack.append((f"{prefix}{key}", child))
+
+    def _walk(self, path: str) -> Any:
+        """Walk a path through $ref boundaries and memoize the result."""
+
+        node: Any = self._odcs_schema
+        walked: list[str] = []
+        for segment in path.split("."):
+            node = self._resolve(node)
+            walked.append(segment)
+            try:
+                node = node[int(segment)] if isinstance(node, list) else node[segment]
+            except (KeyError, IndexError, ValueError, TypeError):
+                logs.error("ODCS schema path not found.", path=path, at=".".join(walked))
+                raise KeyError(f"ODCS schema path not found: {path}")
+
+        node = self._resolve(node)
+        self._nodes[path] = node
+        self._specs[path] = self._to_spec(node)
+
+        return node
+
+    def get_node(self, path: str) -> Any:
+        """Get the resolved ODCS node for a glom-style dotted path."""
+
+        if path in self._nodes:
+            return self._nodes[path]
+
+        return self._walk(path)
+
+    def get_property_spec(self, path: str) -> OdcsPropertySpec:
+        """Get the precomputed property spec for a glom-style dotted path."""
+
+        spec = self._specs.get(path)
+        if spec is None:
+            self._walk(path)
+            spec = self._specs[path]
+
+        return spec
@@ -0,0 +1,147 @@
+"""Parallel validation and signing of large record sets across a process pool."""
+
+import os
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from typing import Iterable, Type
+
+import ygg.utils.commons as cm
+from ygg.core.polyglot_contract import PolyglotContract
+from ygg.core.shared_model_mixin import SharedModelMixin
+from ygg.helpers.logical_data_models import ColumnarValidationResult, PolyglotEntity, RecordValidationError
+from ygg.polyglot.columnar_buffer import ColumnarBuffer
+from ygg.polyglot.polyglot import build_dynamic_model
+from ygg.utils.ygg_logs import get_logger
+
+logs = get_logger(logger_name="ParallelIngestion")
+
+# Dynamic models rebuilt by a worker process, keyed by the signature of their entity.
+_WORKER_MODELS: dict[str, Type[SharedModelMixin]] = {}
+
+
+def _get_worker_model(entity: PolyglotEntity, entity_signature: str) -> Type[SharedModelMixin]:
+    """Get the dynamic model of an entity inside a worker, built once per process."""
+
+    model = _WORKER_MODELS.get(entity_signature)
+    if model is None:
+        model = build_dynamic_model(entity)
+        _WORKER_MODELS[entity_signature] = model
+
+    return model
+
+
+def _inflate_chunk(
+    entity: PolyglotEntity, entity_signature: str, offset: int, chunk: list[dict]
+) -> tuple[ColumnarBuffer, list[RecordValidationError]]:
+    """Validate and sign a chunk of records in a worker, returning its columnar buffer and failed records."""
+
+    model = _get_worker_model(entity, entity_signature)
+    result = model.inflate_many(chunk)
+
+    buffer = ColumnarBuffer(entity)
+    buffer.extend(result.records)
+
+    errors = [RecordValidationError(index=offset + e.index, errors=e.errors) for e in result.errors]
+    return buffer, errors
+
+
+class ParallelIngestion:
+    """Parallel Ingestion.
+
+    Shards the input records in chunks across a process pool. Dynamic models cannot be pickled, so each worker
+    rebuilds the model from the entity, once per entity signature, then validates, signs and buffers its chunks.
+    The parent only concatenates the compact columnar buffers, in input order, for a single staged write.
+    """
+
+    def __init__(
+        self,
+        entity: PolyglotEntity,
+        workers: int | None = None,
+        chunk_size: int = 5_000,
+        max_chunks_in_flight: int | None = None,
+    ):
+        """Initialize the Parallel Ingestion, one worker per CPU when not informed."""
+
+        if not entity:
+            logs.error("Polyglot Entity cannot be empty.")
+            raise ValueError("Polyglot Entity cannot be empty.")
+
+        if chunk_size < 1:
+            logs.error("Chunk size must be positive.", chunk_size=chunk_size)
+            raise ValueError("Chunk size must be positive.")
+
+        self._entity: PolyglotEntity = entity
+        self._entity_signature: str = cm.get_json_signature(entity.model_dump(mode="json"))
+        self._workers: int = max(1, workers or os.cpu_count() or 1)
+        self._chunk_size: int = chunk_size
+        self._max_chunks_in_flight: int = max_chunks_in_flight or self._workers * 2
+
+    @property
+    def workers(self) -> int:
+        """Get the number of worker processes."""
+        return self._workers
+
+    def _get_chunks(self, records: Iterable[dict]) -> Iterable[tuple[int, list[dict]]]:
+        """Split the records in chunks, with the position of their first record."""
+
+        iterator = iter(records)
+        offset = 0
+        while chunk := list(islice(iterator, self._chunk_size)):
+            yield offset, chunk
+            offset += len(chunk)
+
+    def inflate(self, records: Iterable[dict]) -> ColumnarValidationResult:
+        """Validate and sign the records across the pool, error indexes are positions in the input."""
+
+        start = time.perf_counter()
+        buffers: list[ColumnarBuffer] = []
+        errors: list[RecordValidationError] = []
+
+        with ProcessPoolExecutor(max_workers=self._workers) as executor:
+            # Chunks are submitted as results come back, so a streamed input is never fully held in memory.
+            in_flight: deque[Future] = deque()
+            for offset, chunk in self._get_chunks(records):
+                in_flight.append(executor.submit(_inflate_chunk, self._entity, self._entity_signature, offset, chunk))
+                if len(in_flight) >= self._max_chunks_in_flight:
+                    buffer, chunk_errors = in_flight.popleft().result()
+                    buffers.append(buffer)
+                    errors += chunk_errors
+
+            while in_flight:
+                buffer, chunk_errors = in_flight.popleft().result()
+                buffers.append(buffer)
+                errors += chunk_errors
+
+        validated = time.perf_counter()
+        buffer = ColumnarBuffer.concat(self._entity, buffers)
+        timings = {"validate": validated - start, "concat": time.perf_counter() - validated}
+
+        logs.info(
+            "Records Inflated In Parallel.",
+            entity=self._entity.name,
+            records=len(buffer),
+            errors=len(errors),
+            workers=self._workers,
+            chunks=len(buffers),
+            timings={k: round(v, 4) for k, v in timings.items()},
+        )
+        return ColumnarValidationResult(buffer=buffer, errors=errors, timings=timings)
+
+    def write(
+        self, contract: PolyglotContract, records: Iterable[dict], upsert: bool = True
+    ) -> ColumnarValidationResult:
+        """Validate the records across the pool and write them with one staged write."""
+
+        if contract.entity.name != self._entity.name:
+            logs.error("Contract entity does not match.", entity=self._entity.name, contract=contract.entity.name)
+            raise ValueError(f"Contract entity {contract.entity.name} does not match {self._entity.name}.")
+
+        result = self.inflate(records)
+
+        start = time.perf_counter()
+        contract.write_buffer(result.buffer, upsert)
+        result.timings["write"] = time.perf_counter() - start
+
+        return result
@@ -1,13 +1,31 @@
 """Core services to handle data contracts"""
 
-from typing import Any, Self, Type, Union
+import json
+from typing import Any, Callable, Self, Type, Union
 
 from ygg.core.shared_model_mixin import SharedModelMixin
 from ygg.helpers.enums import DuckLakeDbEntityType
-from ygg.helpers.logical_data_models import PolyglotEntity, YggBaseModel
+from ygg.helpers.logical_data_models import (
+    BulkWriteResult,
+    CatalogRecords,
+    PolyglotEntity,
+    PolyglotEntityColumn,
+    RecordValidationError,
+    RejectedRecord,
+    StreamPosition,
+    StreamWriteReport,
+    YggBaseModel,
+)
+from ygg.polyglot.columnar_buffer import ColumnarBuffer
 from ygg.polyglot.polyglot import Polyglot
+from ygg.polyglot.quack_bulk_validator import REJECTED_RECORD_COLUMN, REJECTION_REASONS_COLUMN, QuackBulkValidator
 from ygg.polyglot.quack_connector import QuackConnector
+from ygg.polyglot.quack_meta_class import QuackMetaClass
+from ygg.polyglot.quack_signature import RECORD_HASH_COLUMN, QuackSignature
+from ygg.polyglot.write_ahead_queue import WriteAheadQueue
+from ygg.utils.record_stream import RecordStreamReader
 from ygg.utils.ygg_logs import get_logger
+from ygg.utils.ygg_metrics import metrics
 
 logs = get_logger(logger_name="DataContract")
 
@@ -25,20 +43,39 @@ class PolyglotContract:
         instance = None
         if isinstance(entity, YggBaseModel):
             instance = entity
+            model = type(entity)
             entity = entity.polyglot_entity
         else:
-            entity = entity.instance.polyglot_entity
+            model = entity.instance
+            entity = entity.instance.get_polyglot_entity()
 
         self._entity: Union[Polyglot, PolyglotEntity] = entity
         self._instance: Union[Polyglot, PolyglotEntity] = instance
+        self._model: Type[SharedModelMixin] = model
 
         self._second_layer_db_connector: QuackConnector | None = None
+        self._reports_snapshots: bool = True
 
         self.__first_layer_instructions: list[str] = []
         self.__second_layer_instructions: list[str] = []
 
         self._load_instructions()
 
+    @property
+    def entity(self) -> PolyglotEntity:
+        """Get the polyglot entity."""
+        return self._entity
+
+    @property
+    def model(self) -> Type[SharedModelMixin]:
+        """Get the dynamic model of the entity."""
+        return self._model
+
+    @property
+    def catalog_instructions(self) -> list[str]:
+        """Get the instructions that attach the DuckLake catalog."""
+        return list(self.__second_layer_instructions)
+
     def _load_instructions(self, recreate_existing_entity: bool | None = False) -> Self:
         """Build the data contract."""
 
@@ -78,8 +115,11 @@ class PolyglotContract:
 
         return self
 
-    def setup(self) -> Self:
-        """Execute the instructions."""
+    def setup(self, evolve: bool = False, drop_columns: bool = False) -> Self:
+        """Execute the instructions, evolving an existing DuckLake table to the entity columns when asked to.
+
+        Evolution reads the catalog columns of the table, so it is opt-in and left to the runs that changed the schema.
+        """
 
         logs.info("Executing Instructions")
         instructions = self.__first_layer_instructions + self.__second_layer_instructions
@@ -88,9 +128,59 @@ class PolyglotContract:
 
         QuackConnector.execute_instructions(instructions=instructions)
 
+        if evolve:
+            self.evolve(drop_columns=drop_columns)
+
         logs.info("Instructions Executed Successfully.")
         return self
 
+    def evolve(self, drop_columns: bool = False) -> list[str]:
+        """Alter the DuckLake table to the entity columns in place, instead of recreating it.
+
+        Columns holding values only take widening type changes, columns without values are added back with their new
+        type. Any other change raises a ValueError, the entity must then be recreated, which drops its rows.
+        """
+
+        entity: PolyglotEntity = self._entity
+        rows = QuackConnector.fetch_records(
+            statement="SELECT column_name, data_type FROM information_schema.columns "
+            "WHERE table_catalog = ? AND table_schema = ? AND table_name = ? ORDER BY ordinal_position",
+            values=[entity.catalog, entity.schema_.lower(), entity.name.lower()],
+            instructions=self.__second_layer_instructions,
+        )
+        if not rows:
+            logs.warning("Entity table not found, nothing to evolve.", entity=entity.name)
+            return []
+
+        existing_columns: dict[str, str] = {r["column_name"]: r["data_type"] for r in rows}
+        retyped_columns: list[str] = self._second_layer_db_connector.get_retyped_columns(
+            existing_columns, DuckLakeDbEntityType.DUCKLAKE
+        )
+
+        # A column that never held a value, as CustomProperties before it became a list, can take any type.
+        empty_columns: set[str] = set()
+        if retyped_columns:
+            counts = QuackConnector.fetch_records(
+                statement=f"SELECT {', '.join(f'count({c}) AS {c}' for c in retyped_columns)} "
+                f"FROM {entity.catalog}.{entity.schema_.lower()}.{entity.name.lower()}",
+                instructions=self.__second_layer_instructions,
+            )
+            empty_columns = {c for c, count in counts[0].items() if not count}
+
+        steps: list[str] = self._second_layer_db_connector.get_entity_evolution_instructions(
+            existing_columns=existing_columns,
+            entity_type=DuckLakeDbEntityType.DUCKLAKE,
+            drop_columns=drop_columns,
+            empty_columns=empty_columns,
+        )
+        if steps:
+            QuackConnector.execute_instructions(
+                instructions=self.__second_layer_instructions + ["BEGIN TRANSACTION", *steps, "COMMIT"]
+            )
+
+        logs.info("Entity Evolved.", entity=entity.name, steps=len(steps))
+        return steps
+
     def write_contract(self, upsert: bool = True) -> dict[str, Any]:
         """Write the data document."""
 
@@ -106,6 +196,465 @@ class PolyglotContract:
 
         instructions.append({"statement": first_layer_statement, "values": first_layer_values})
         instructions.append(second_layer_statement)
-        QuackConnector.execute_instructions(instructions=instructions)
+        with metrics.span("ducklake.write", entity=self._entity.name):
+            QuackConnector.execute_instructions(instructions=instructions)
 
         return statement_map.get("hydrate_return", {})
+
+    def write_contracts(
+        self,
+        records: list[SharedModelMixin],
+        upsert: bool = True,
+        sql_signatures: bool = False,
+        signatures: list[str] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Write a batch of data documents in a single execution, reusing the signatures already computed for it."""
+
+        if not records:
+            logs.warning("No records to write.")
+            return []
+
+        if sql_signatures:
+            quack_signature = QuackSignature(self._entity)
+            if quack_signature.is_supported:
+                return self._write_contracts_signed_by_db(records, quack_signature, upsert)
+
+            logs.warning("Entity cannot be signed by DuckDb, using Python signatures.", entity=self._entity.name)
+
+        first_layer_statements, hydrate_returns = self.get_first_layer_write_instructions(records, signatures)
+        self.write_staged(first_layer_statements, upsert)
+        metrics.increment("records.written", len(records), entity=self._entity.name)
+
+        logs.info(
+            "Batch Written.", entity=self._entity.name, records=len(records), statements=len(first_layer_statements)
+        )
+        return hydrate_returns
+
+    def write_staged(
+        self,
+        first_layer_statements: list[dict[str, Any]],
+        upsert: bool = True,
+        replace_duplicates: bool = False,
+        session: Any | None = None,
+    ) -> int | None:
+        """Write first layer inserts built by get_first_layer_write_instructions, in a single execution.
+
+        A session prepared with the first layer and catalog instructions is reused as is, instead of opening one.
+        Returns the DuckLake snapshot the write ended at, None when the catalog does not report snapshots.
+        """
+
+        if replace_duplicates:
+            first_layer_statements = [self.get_replacing_instruction(s) for s in first_layer_statements]
+
+        metrics.increment("batches.written", entity=self._entity.name)
+        write_instructions = [*first_layer_statements, self.get_second_layer_write_instruction(upsert)]
+        if session is not None:
+            # Rows staged by the previous write would be merged again.
+            with metrics.span("ducklake.write", entity=self._entity.name):
+                QuackConnector.run_instructions(
+                    session, [f"DELETE FROM {self._entity.schema_}.{self._entity.name}", *write_instructions]
+                )
+            return self._get_current_snapshot(session)
+
+        instructions = self.__first_layer_instructions + self.__second_layer_instructions + write_instructions
+        with metrics.span("ducklake.write", entity=self._entity.name):
+            with QuackConnector.session(instructions=instructions) as con:
+                return self._get_current_snapshot(con)
+
+    def _get_current_snapshot(self, con: Any) -> int | None:
+        """Get the current DuckLake snapshot of the entity catalog on an open connection."""
+
+        # A catalog that does not report snapshots is not asked again, the failed lookup costs more than the write.
+        if not self._reports_snapshots:
+            return None
+
+        try:
+            row = con.execute(f"SELECT max(snapshot_id) FROM ducklake_snapshots('{self._entity.catalog}')").fetchone()
+        except Exception as e:
+            self._reports_snapshots = False
+            logs.debug("DuckLake snapshot not available.", catalog=self._entity.catalog, error=str(e))
+            return None
+
+        return row[0] if row else None
+
+    @staticmethod
+    def get_replacing_instruction(instruction: dict[str, Any]) -> dict[str, Any]:
+        """Get a first layer insert where later rows replace earlier ones with the same keys."""
+
+        # Inserts of several batches share the first layer table, a plain insert would fail on keys written twice.
+        if "ON CONFLICT" in instruction["statement"]:
+            return instruction
+
+        return {
+            **instruction,
+            "statement": instruction["statement"].replace("INSERT INTO", "INSERT OR REPLACE INTO", 1),
+        }
+
+    def write_stream(
+        self,
+        reader: RecordStreamReader,
+        start: StreamPosition | None = None,
+        upsert: bool = True,
+        on_chunk: Callable[[StreamWriteReport], None] | None = None,
+    ) -> StreamWriteReport:
+        """Validate and write a record stream chunk by chunk, at constant memory.
+
+        on_chunk gets the report after every written chunk, with its position and DuckLake snapshot, to checkpoint
+        where a stopped run resumes.
+        """
+
+        report = StreamWriteReport(entity=self._entity.name, position=start or StreamPosition())
+        for chunk in reader.chunks(start):
+            result = self._model.inflate_many(chunk.records)
+            report.errors += [
+                RecordValidationError(index=chunk.first_record + e.index, errors=e.errors) for e in result.errors
+            ]
+
+            if result.records:
+                first_layer_statements, _ = self.get_first_layer_write_instructions(result.records)
+                report.snapshot_id = self.write_staged(first_layer_statements, upsert)
+
+            metrics.increment("stream.bytes", chunk.position.offset - report.position.offset, entity=self._entity.name)
+            metrics.increment("records.written", len(result.records), entity=self._entity.name)
+            report.chunks += 1
+            report.records += len(result.records)
+            report.position = chunk.position
+            if on_chunk:
+                on_chunk(report)
+
+        logs.info(
+            "Stream Written.",
+            entity=self._entity.name,
+            file=str(reader.file_path),
+            chunks=report.chunks,
+            records=report.records,
+            errors=len(report.errors),
+        )
+        return report
+
+    def enqueue_contracts(
+        self, records: list[SharedModelMixin], queue: WriteAheadQueue, upsert: bool = True, timeout: float | None = None
+    ) -> list[dict[str, Any]]:
+        """Enqueue a batch of data documents for the commit coordinator, instead of writing it to DuckLake."""
+
+        if not records:
+            logs.warning("No records to enqueue.")
+            return []
+
+        first_layer_statements, hydrate_returns = self.get_first_layer_write_instructions(records)
+        batch_id = queue.enqueue(self._entity.name, first_layer_statements, len(records), upsert, timeout)
+
+        logs.info("Batch Enqueued.", entity=self._entity.name, records=len(records), batch_id=batch_id)
+        return hydrate_returns
+
+    @property
+    def first_layer_instructions(self) -> list[str]:
+        """Get the instructions creating the first layer entity."""
+        return list(self.__first_layer_instructions)
+
+    @staticmethod
+    def get_first_layer_write_instructions(
+        records: list[SharedModelMixin], signatures: list[str] | None = None
+    ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+        """Get the grouped first layer inserts of a batch, and the hydrate returns of its records.
+
+        Signatures already computed for the records, in the same order, are written instead of signing them again.
+        """
+
+        hydrate_returns: list[dict[str, Any]] = []
+        first_layer_batches: dict[str, list[list[Any]]] = {}
+        for record, signature in zip(records, signatures or [None] * len(records)):
+            statement_map: dict[str, Any] = record.get_statement_map(signature)
+            first_layer_statement: str = statement_map.get("first_layer_db_write_statement", "")
+            first_layer_batches.setdefault(first_layer_statement, []).append(
+                statement_map.get("first_layer_db_write_values", [])
+            )
+            hydrate_returns.append(statement_map.get("hydrate_return", {}))
+
+        first_layer_statements = [
+            {"statement": statement, "values": values, "many": True}
+            for statement, values in first_layer_batches.items()
+        ]
+        return first_layer_statements, hydrate_returns
+
+    def get_second_layer_write_instruction(self, upsert: bool = True) -> str:
+        """Get the statement moving the first layer rows into DuckLake."""
+
+        second_layer_insert, second_layer_merge = SharedModelMixin.get_second_layer_statements(self._entity)
+        return second_layer_merge if upsert else second_layer_insert
+
+    @staticmethod
+    def _get_move_columns(columns: list[PolyglotEntityColumn], expressions: dict[str, str] | None = None) -> list[str]:
+        """Get the expressions moving staged columns into the entity table."""
+
+        # Empty values fall back to the column defaults, as they do when left out of the per-record statements.
+        move_columns: list[str] = []
+        for column in columns:
+            physical_name = QuackMetaClass.physical_column_name(column.name)
+            value = (expressions or {}).get(column.name, physical_name)
+            if not column.enum and column.data_type.duck_db_type.upper() == "VARCHAR":
+                value = f"NULLIF({value}, 'None')"
+
+            default_value = QuackMetaClass.get_db_column_default_expression(column)
+            move_columns.append(f"COALESCE({value}, {default_value})" if default_value else value)
+
+        return move_columns
+
+    def write_buffer(self, buffer: ColumnarBuffer, upsert: bool = True) -> list[dict[str, Any]]:
+        """Write a columnar buffer of data documents, DuckDb scans the buffer frame for the first layer insert."""
+
+        if not len(buffer):
+            logs.warning("No records to write.")
+            return []
+
+        if buffer.entity.name != self._entity.name:
+            logs.error("Buffer entity does not match the contract entity.", buffer_entity=buffer.entity.name)
+            raise ValueError(f"Buffer entity {buffer.entity.name} does not match {self._entity.name}.")
+
+        entity: PolyglotEntity = self._entity
+        columns: list[PolyglotEntityColumn] = [c for c in entity.columns if not c.skip_from_physical_model]
+        physical_header: str = ", ".join(QuackMetaClass.physical_column_name(c.name) for c in columns)
+        move_columns: list[str] = self._get_move_columns(
+            columns, {c.name: buffer.get_select_expression(c) for c in columns}
+        )
+
+        relation: str = f"{entity.name}_buffer"
+        on_conflict: str = " ON CONFLICT DO NOTHING" if not entity.update_allowed else ""
+        second_layer_insert, second_layer_merge = SharedModelMixin.get_second_layer_statements(entity)
+
+        instructions = self.__first_layer_instructions + self.__second_layer_instructions
+        instructions += [
+            f"INSERT INTO {entity.schema_}.{entity.name} ({physical_header}) "
+            f"SELECT {', '.join(move_columns)} FROM {relation}{on_conflict}",
+            second_layer_merge if upsert else second_layer_insert,
+        ]
+        with metrics.span("ducklake.write", entity=entity.name):
+            QuackConnector.execute_instructions(instructions=instructions, relations={relation: buffer.to_frame()})
+
+        logs.info("Buffer Written.", entity=entity.name, records=len(buffer))
+        return buffer.hydrate_returns
+
+    def write_frame(self, frame: Any, upsert: bool = True) -> BulkWriteResult:
+        """Validate and write a DataFrame or Arrow table of data documents in DuckDb, without Python validation."""
+
+        entity: PolyglotEntity = self._entity
+        column_names: list[str] = [c.name for c in entity.columns]
+        quack_signature = QuackSignature(entity)
+        signed: bool = RECORD_HASH_COLUMN in column_names
+        # Frame rows have no Python values to sign STRUCT fields that are not plain strings with.
+        if signed and not quack_signature.is_exact:
+            logs.error("Entity cannot be signed by DuckDb, bulk writes are not available.", entity=entity.name)
+            raise ValueError(f"Entity {entity.name} cannot be signed by DuckDb, bulk writes are not available.")
+
+        source_columns: list[str] = list(getattr(frame, "column_names", None) or frame.columns)
+        validator = QuackBulkValidator(entity, source_columns)
+
+        columns: list[PolyglotEntityColumn] = [c for c in entity.columns if not c.skip_from_physical_model]
+        physical_header: str = ", ".join(QuackMetaClass.physical_column_name(c.name) for c in columns)
+        move_columns: list[str] = self._get_move_columns(columns)
+
+        relation: str = f"{entity.name}_frame"
+        stage: str = f"{entity.name}_bulk_stage"
+        rejected_table: str = f"{entity.catalog}.{entity.schema_}.{entity.name}_rejected"
+        valid: str = f"len({REJECTION_REASONS_COLUMN}) = 0"
+        on_conflict: str = " ON CONFLICT DO NOTHING" if not entity.update_allowed else ""
+        second_layer_insert, second_layer_merge = SharedModelMixin.get_second_layer_statements(entity)
+
+        instructions = self.__first_layer_instructions + self.__second_layer_instructions
+        instructions.append(validator.get_stage_statement(relation, stage))
+        if signed:
+            instructions.append(
+                f"UPDATE {stage} SET {RECORD_HASH_COLUMN} = {quack_signature.signature_expression} WHERE {valid}"
+            )
+
+        instructions += [
+            f"INSERT INTO {entity.schema_}.{entity.name} ({physical_header}) "
+            f"SELECT {', '.join(move_columns)} FROM {stage} WHERE {valid}{on_conflict}",
+            second_layer_merge if upsert else second_layer_insert,
+            f"CREATE TABLE IF NOT EXISTS {rejected_table} "
+            f"({REJECTED_RECORD_COLUMN} VARCHAR, {REJECTION_REASONS_COLUMN} VARCHAR[], rejected_ets TIMESTAMPTZ)",
+            f"INSERT INTO {rejected_table} SELECT {REJECTED_RECORD_COLUMN}, {REJECTION_REASONS_COLUMN}, now() "
+            f"FROM {stage} WHERE NOT {valid}",
+        ]
+
+        # The first layer holds the rows actually inserted, valid rows skipped by ON CONFLICT DO NOTHING are not.
+        with metrics.span("ducklake.write", entity=entity.name):
+            [row] = QuackConnector.fetch_records(
+                statement=f"SELECT (SELECT count(*) FROM {entity.schema_}.{entity.name}) AS written, "
+                f"list({{'record': {REJECTED_RECORD_COLUMN}, 'reasons': {REJECTION_REASONS_COLUMN}}}) "
+                f"FILTER (WHERE NOT {valid}) AS rejected FROM {stage}",
+                instructions=instructions,
+                relations={relation: frame},
+            )
+        result = BulkWriteResult(
+            entity=entity.name,
+            written=row["written"],
+            rejected=[
+                RejectedRecord(record=json.loads(r["record"]), reasons=r["reasons"]) for r in row["rejected"] or []
+            ],
+        )
+
+        logs.info("Frame Written.", entity=entity.name, written=result.written, rejected=len(result.rejected))
+        return result
+
+    def _write_contracts_signed_by_db(
+        self, records: list[SharedModelMixin], quack_signature: QuackSignature, upsert: bool
+    ) -> list[dict[str, Any]]:
+        """Write a batch of data documents, computing their signatures in DuckDb over the staged batch.
+
+        Rows DuckDb cannot sign as Python does, see QuackSignature.is_signable, are staged with their Python signature.
+        """
+
+        entity: PolyglotEntity = self._entity
+        instructions = self.__first_layer_instructions + self.__second_layer_instructions
+
+        column_names: list[str] = [c.name for c in entity.columns]
+        physical_names: list[str] = [QuackMetaClass.physical_column_name(c) for c in column_names]
+        primary_key_columns: list[str] = [c.name for c in entity.columns if c.primary_key]
+        record_hash_index: int = column_names.index(RECORD_HASH_COLUMN)
+
+        rows: list[list[Any]] = []
+        hydrate_returns: list[dict[str, Any]] = []
+        for record in records:
+            values_map: dict[str, Any] = record.model_dump()
+
+            # Same values the per-record statements write, except "None" strings that the signature still covers.
+            row = [None if c.skip_from_physical_model else values_map.get(c.name) for c in entity.columns]
+            row = [None if v in ("", ...) else v for v in row]
+            row[record_hash_index] = (
+                None
+                if quack_signature.is_signable(values_map)
+                else SharedModelMixin._get_record_signature(values_map, entity)
+            )
+
+            rows.append(row)
+            hydrate_returns.append(
+                {
+                    f"{entity.name}_{pk}": None if values_map.get(pk) in (None, "None", "") else values_map.get(pk)
+                    for pk in primary_key_columns
+                }
+            )
+
+        move_columns: list[str] = self._get_move_columns(entity.columns)
+
+        stage: str = f"{entity.name}_signature_stage"
+        entity_table: str = f"{entity.schema_}.{entity.name}"
+        physical_header: str = ", ".join(physical_names)
+        on_conflict: str = " ON CONFLICT DO NOTHING" if not entity.update_allowed else ""
+
+        second_layer_insert, second_layer_merge = SharedModelMixin.get_second_layer_statements(entity)
+
+        instructions += [
+            f"CREATE OR REPLACE TEMP TABLE {stage} AS SELECT {physical_header} FROM {entity_table} LIMIT 0",
+            {
+                "statement": f"INSERT INTO {stage} ({physical_header}) VALUES ({', '.join('?' for _ in physical_names)})",
+                "values": rows,
+                "many": True,
+            },
+            f"UPDATE {stage} SET {RECORD_HASH_COLUMN} = {quack_signature.signature_expression} "
+            f"WHERE {RECORD_HASH_COLUMN} IS NULL",
+            f"INSERT INTO {entity_table} ({physical_header}) SELECT {', '.join(move_columns)} FROM {stage}{on_conflict}",
+            second_layer_merge if upsert else second_layer_insert,
+        ]
+        with metrics.span("ducklake.write", entity=entity.name):
+            QuackConnector.execute_instructions(instructions=instructions)
+
+        logs.info(
+            "Batch Written.",
+            entity=entity.name,
+            records=len(records),
+            sql_signatures=True,
+        )
+        return hydrate_returns
+
+    def replace_contracts(
+        self, records: list[SharedModelMixin], signatures: list[str] | None = None
+    ) -> list[dict[str, Any]]:
+        """Replace data documents in DuckLake by primary key, whatever the update and conflict settings are.
+
+        Stored rows sharing a key with the batch are deleted and the batch inserted in one DuckLake transaction.
+        """
+
+        if not records:
+            logs.warning("No records to write.")
+            return []
+
+        entity: PolyglotEntity = self._entity
+        entity_table: str = f"{entity.catalog}.{entity.schema_}.{entity.name}"
+        stage: str = f"{entity.schema_}.{entity.name}"
+        primary_key_columns: list[str] = [
+            QuackMetaClass.physical_column_name(c.name) for c in entity.columns if c.primary_key
+        ]
+        header: str = ", ".join(QuackMetaClass.physical_column_name(c.name) for c in entity.columns)
+        constraints: str = " AND ".join(f"t.{pk} = s.{pk}" for pk in primary_key_columns)
+
+        first_layer_statements, hydrate_returns = self.get_first_layer_write_instructions(records, signatures)
+        instructions = self.__first_layer_instructions + self.__second_layer_instructions + first_layer_statements
+        with metrics.span("ducklake.write", entity=entity.name):
+            with QuackConnector.session(instructions=instructions) as con:
+                con.execute("BEGIN TRANSACTION")
+                try:
+                    con.execute(
+                        f"DELETE FROM {entity_table} t WHERE EXISTS (SELECT 1 FROM {stage} s WHERE {constraints})"
+                    )
+                    con.execute(f"INSERT INTO {entity_table} ({header}) SELECT {header} FROM {stage}")
+                    con.execute("COMMIT")
+
+                except Exception as e:
+                    QuackConnector.rollback(con)
+                    logs.error("Error replacing records.", entity=entity.name, error=str(e))
+                    raise e
+
+        metrics.increment("records.written", len(records), entity=entity.name)
+        logs.info("Records Replaced.", entity=entity.name, records=len(records))
+        return hydrate_returns
+
+    def delete_contracts(self, keys: list[tuple]) -> int:
+        """Delete data documents from DuckLake by primary key."""
+
+        if not keys:
+            return 0
+
+        if not self._entity.delete_allowed:
+            logs.error("Entity does not allow deletes.", entity=self._entity.name)
+            raise ValueError(f"Entity {self._entity.name} does not allow deletes.")
+
+        primary_key_columns: list[str] = [c.name for c in self._entity.columns if c.primary_key]
+        constraints: str = " AND ".join(f"{QuackMetaClass.physical_column_name(pk)} = ?" for pk in primary_key_columns)
+        statement: str = (
+            f"DELETE FROM {self._entity.catalog}.{self._entity.schema_}.{self._entity.name} WHERE {constraints}"
+        )
+
+        instructions = self.__second_layer_instructions + [
+            {"statement": statement, "values": [list(k) for k in keys], "many": True}
+        ]
+        QuackConnector.execute_instructions(instructions=instructions)
+
+        logs.info("Records Deleted.", entity=self._entity.name, records=len(keys))
+        return len(keys)
+
+    def read_contract(self, filters: dict[str, Any] | None = None, limit: int | None = None) -> list[SharedModelMixin]:
+        """Read data documents back from DuckLake, building them on the trusted path."""
+
+        column_names: list[str] = [c.name for c in self._entity.columns if not c.skip_from_physical_model]
+        unknown_filters = [k for k in (filters or {}) if k not in column_names]
+        if unknown_filters:
+            logs.error("Filters must be entity columns.", filters=unknown_filters)
+            raise ValueError(f"Filters must be entity columns: {unknown_filters}")
+
+        select_columns: str = ", ".join(f"{QuackMetaClass.physical_column_name(c)} AS {c}" for c in column_names)
+        where: str = " AND ".join(f"{QuackMetaClass.physical_column_name(k)} = ?" for k in filters or {})
+        statement: str = (
+            f"SELECT {select_columns} FROM {self._entity.catalog}.{self._entity.schema_}.{self._entity.name}"
+            f"{' WHERE ' + where if where else ''}{f' LIMIT {int(limit)}' if limit else ''}"
+        )
+
+        rows = QuackConnector.fetch_records(
+            statement=statement,
+            values=list((filters or {}).values()),
+            instructions=self.__second_layer_instructions,
+        )
+        records = CatalogRecords(entity=self._entity.name, source=DuckLakeDbEntityType.DUCKLAKE.value, rows=rows)
+
+        logs.info("Records Read.", entity=self._entity.name, records=len(rows))
+        return self._model.from_catalog(records)
@@ -1,6 +1,5 @@
 """Set of tools to release Ygg."""
 
-import hashlib
 import time
 import uuid
 from enum import Enum
@@ -8,12 +7,14 @@ from typing import Any, Self
 
 from pydantic import Field
 
+import ygg.utils.commons as cm
 from ygg.core.shared_model_mixin import SharedModelMixin
 from ygg.helpers.enums import Model
 from ygg.helpers.logical_data_models import (
     PolyglotEntity,
     YggBaseModel,
 )
+from ygg.utils.signature_engine import SignatureEngine
 from ygg.utils.ygg_logs import get_logger
 
 logs = get_logger(logger_name="YggRelease")
@@ -32,7 +33,7 @@ class ReleaseItem(YggBaseModel):
     """Release Item."""
 
     name: str = Field(..., description="Blueprint name")
-    signature: str = Field(..., description="Blueprint sha256 signature")
+    signature: str = Field(..., description="Blueprint signature")
     content: str = Field(..., description="Blueprint content as a string")
     release_signature: str = Field(..., description="Release UUID5-NAMESPACE_DNS signature")
 
@@ -52,6 +53,7 @@ class ReleaseDocument(YggBaseModel, SharedModelMixin):
 
 
 YGG_NAMESPACE = uuid.uuid5(uuid.NAMESPACE_DNS, "ygg-blueprints-release")
+RELEASE_SIGNATURE_ENGINE = SignatureEngine(streaming=True)
 
 
 class Release:
@@ -142,7 +144,7 @@ class Release:
             logs.error("Blueprint config must be informed.")
             raise ValueError("Blueprint config must be informed.")
 
-        content_signature = cm.get_json_signature(content)
+        content_signature = RELEASE_SIGNATURE_ENGINE.sign(content)
         content: ReleaseItem = ReleaseItem(
             name=blueprint_name.value, content=cm.pack_json_content_as_base64(content), signature=content_signature
         )
@@ -176,12 +178,10 @@ class Release:
         """Build the release object."""
 
         blueprint_config_base64 = cm.pack_json_content_as_base64(self._blueprint_config)
-        blueprint_config_base64_hash = hashlib.md5(blueprint_config_base64.encode()).hexdigest()
-        blueprint_config_base64_hash = str(blueprint_config_base64_hash)
+        blueprint_config_base64_hash = RELEASE_SIGNATURE_ENGINE.sign_bytes(blueprint_config_base64.encode())
 
         odcs_schema_base_64 = cm.pack_json_content_as_base64(self._odcs_blueprint_schema)
-        odcs_schema_base_64_hash = hashlib.md5(odcs_schema_base_64.encode()).hexdigest()
-        odcs_schema_base_64_hash = str(odcs_schema_base_64_hash)
+        odcs_schema_base_64_hash = RELEASE_SIGNATURE_ENGINE.sign_bytes(odcs_schema_base_64.encode())
 
         sorted_contents = sorted(self._blueprint_content, key=lambda x: x.name)
         content_map = [p.signature for p in sorted_contents]
@@ -229,7 +229,6 @@ class Release:
 
 
 if __name__ == "__main__":
-    import ygg.utils.commons as cm
     # import ygg.config as yc
 
     release_spec = cm.get_yaml_content("/ygg/assets/entities/release.yaml")
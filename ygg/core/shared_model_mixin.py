@@ -1,55 +1,186 @@
 """Shared Model Mixin."""
 
-from typing import Any, Self
+from functools import lru_cache
+from typing import Annotated, Any, Iterable, Self
 
 from glom import glom
 from jinja2 import Template
+from pydantic import TypeAdapter, ValidationError, ValidatorFunctionWrapHandler, WrapValidator
 from tabulate import tabulate
 
 import ygg.utils.commons as cm
-from ygg.helpers.logical_data_models import PolyglotEntity, YggBaseModel
+from ygg.helpers.enums import DuckLakeDbEntityType
+from ygg.helpers.logical_data_models import (
+    BatchValidationResult,
+    CatalogRecords,
+    PolyglotEntity,
+    RecordValidationError,
+    YggBaseModel,
+)
+from ygg.utils.signature_engine import SignatureEngine
 from ygg.utils.ygg_logs import get_logger
+from ygg.utils.ygg_metrics import metrics
 
 logs = get_logger(logger_name="SharedModelMixin")
 
 
+class _InvalidRecord:
+    """Validation errors of a batch record, kept in its place so the batch is validated once."""
+
+    __slots__ = ("errors",)
+
+    def __init__(self, errors: list[dict]):
+        self.errors = errors
+
+
+def _keep_invalid_record(value: Any, handler: ValidatorFunctionWrapHandler) -> Any:
+    """Validate a batch record, returning its errors instead of failing the whole batch."""
+
+    try:
+        return handler(value)
+    except ValidationError as e:
+        return _InvalidRecord(e.errors(include_url=False))
+
+
+@lru_cache(maxsize=128)
+def _get_batch_adapter(model: type) -> TypeAdapter:
+    """Get the cached list adapter used to validate batches of a model."""
+    return TypeAdapter(list[Annotated[model, WrapValidator(_keep_invalid_record)]])
+
+
 class SharedModelMixin:
     """Shared Model Mixin."""
 
-    def _model_hydrate(self, hydrate_data: dict) -> None:
-        """Hydrate the model."""
+    __polyglot_entity__: PolyglotEntity | None = None
+
+    @classmethod
+    def bind_polyglot_entity(cls, polyglot_entity: PolyglotEntity) -> None:
+        """Bind the model class to its polyglot entity."""
+
+        if not polyglot_entity:
+            logs.error("Polyglot Entity cannot be empty.")
+            raise ValueError("Polyglot Entity cannot be empty.")
+
+        cls.__polyglot_entity__ = polyglot_entity
+        logs.debug("Polyglot Entity bound to model.", name=cls.__name__, entity=polyglot_entity.name)
+
+    @classmethod
+    def get_polyglot_entity(cls) -> PolyglotEntity | None:
+        """Get the polyglot entity bound to the model class."""
+        return cls.__polyglot_entity__
+
+    @property
+    def polyglot_entity(self) -> PolyglotEntity | None:
+        """Get the polyglot entity bound to the model class."""
+        return type(self).get_polyglot_entity()
+
+    def _model_hydrate(self, hydrate_data: dict, trusted: bool = False) -> None:
+        """Hydrate the model, trusted data is set without going through the model's attribute handlers."""
 
         if not hydrate_data:
             return
 
         me = self
-        dct = {k: v for k, v in hydrate_data.items() if k in me.model_fields}  #  type: ignore
+        dct = {k: v for k, v in hydrate_data.items() if k in type(me).model_fields}  #  type: ignore
+        if trusted:
+            me.__dict__.update(dct)
+            me.__pydantic_fields_set__.update(dct)  #  type: ignore
+            return
+
         for k, v in dct.items():
             setattr(self, k, v)
 
+    @staticmethod
+    def _get_signature_dictionary(values_map: dict[str, Any], entity: PolyglotEntity) -> dict[str, Any]:
+        """Get the part of a dumped record covered by its signature."""
+
+        signature_skip_columns = [c.name for c in entity.columns if c.skip_from_signature]
+        return {k: v for k, v in values_map.items() if v and k not in signature_skip_columns}
+
+    @staticmethod
+    def _get_record_signature(values_map: dict[str, Any], entity: PolyglotEntity) -> str:
+        """Get the signature of a dumped record."""
+
+        signature_dictionary = SharedModelMixin._get_signature_dictionary(values_map, entity)
+        return cm.get_json_signature(signature_dictionary, algorithm=entity.signature_algorithm)
+
+    @property
+    def record_signature(self) -> str | None:
+        """Get the record signature."""
+
+        entity: PolyglotEntity | None = type(self).get_polyglot_entity()
+        if not entity:
+            return None
+
+        return self._get_record_signature(self.model_dump(), entity)
+
+    def matches_record_signature(self, signature: str) -> bool:
+        """Whether a stored signature matches the record, whatever algorithm it was computed with."""
+
+        entity: PolyglotEntity | None = type(self).get_polyglot_entity()
+        if not entity:
+            return False
+
+        return SignatureEngine.matches(self._get_signature_dictionary(self.model_dump(), entity), signature)
+
+    @property
+    def record_key(self) -> tuple | None:
+        """Get the record primary key values."""
+
+        entity: PolyglotEntity | None = type(self).get_polyglot_entity()
+        if not entity:
+            return None
+
+        return tuple(getattr(self, c.name, None) for c in entity.columns if c.primary_key)
+
+    @staticmethod
+    def get_second_layer_statements(entity: PolyglotEntity) -> tuple[str, str]:
+        """Get the statements moving the first layer rows into DuckLake, as insert and merge."""
+
+        entity_catalog: str = entity.catalog
+        entity_schema: str = entity.schema_
+        entity_name: str = entity.name
+
+        primary_key_columns: list[str] = [c.name for c in entity.columns if c.primary_key]
+        second_layer_db_header: list[str] = [c.name for c in entity.columns]
+        second_layer_db_header_string: str = ", ".join(second_layer_db_header)
+
+        second_layer_db_insert_statement: str = f"""INSERT INTO {entity_catalog}.{entity_schema}.{entity_name} ({second_layer_db_header_string})SELECT {second_layer_db_header_string} FROM {entity_schema}.{entity_name}"""
+        second_layer_merge_constraints = "".join([f" and t.{pk} = s.{pk}" for pk in primary_key_columns])
+        second_layer_db_merge_statement: str = f"""
+            MERGE INTO {entity_catalog}.{entity_schema}.{entity_name} t
+            USING (SELECT {second_layer_db_header_string} FROM {entity_schema}.{entity_name}) s
+            ON (1=1 {second_layer_merge_constraints}) 
+            {"WHEN MATCHED THEN UPDATE BY NAME" if entity.update_allowed else ""}
+            WHEN NOT MATCHED THEN INSERT BY NAME
+        """
+
+        logs.debug("Second Layer Database Insert Statement Created.")
+        return second_layer_db_insert_statement, second_layer_db_merge_statement
+
     @property
     def statement_map(self) -> dict[str, Any]:
         """Get the insert statement."""
+        return self.get_statement_map()
 
-        from ygg.helpers.logical_data_models import PolyglotEntity
+    @metrics.timed("statement_map")
+    def get_statement_map(self, record_signature: str | None = None) -> dict[str, Any]:
+        """Get the insert statement, with the record signature when it was already computed."""
 
         entity: PolyglotEntity = None
         me: YggBaseModel = self
 
         if isinstance(me, YggBaseModel):
-            if polyglot_entity := getattr(me, "polyglot_entity", None):
+            if polyglot_entity := type(me).get_polyglot_entity():
                 entity = polyglot_entity
             else:
                 return None
 
         values_map = me.model_dump()
-        entity_catalog: str = entity.catalog
         entity_schema: str = entity.schema_
         entity_name: str = entity.name
 
-        signature_skip_columns = [c.name for c in entity.columns if c.skip_from_signature]
-        signature_dictionary = {k: v for k, v in values_map.items() if v and k not in signature_skip_columns}
-        record_signature = cm.get_json_signature(signature_dictionary)
+        record_signature = record_signature or self._get_record_signature(values_map, entity)
 
         values_map["record_hash"] = record_signature
         logs.debug("Record signature", signature=record_signature)
@@ -82,9 +213,6 @@ class SharedModelMixin:
         params: list[str] = ", ".join(["?" for f in first_layer_db_header])
         first_layer_db_header_string: str = ", ".join(first_layer_db_header)
 
-        second_layer_db_header: list[str] = [c.name for c in entity.columns]
-        second_layer_db_header_string: str = ", ".join(second_layer_db_header)
-
         values_list = list(values_map.values())
         values_list = [None if v in ("None", ...) else v for v in values_list]
 
@@ -93,17 +221,7 @@ class SharedModelMixin:
 
         logs.debug("First Layer Database Insert Statement Created.")
 
-        second_layer_db_insert_statement: str = f"""INSERT INTO {entity_catalog}.{entity_schema}.{entity_name} ({second_layer_db_header_string})SELECT {second_layer_db_header_string} FROM {entity_schema}.{entity_name}"""
-        second_layer_merge_constraints = "".join([f" and t.{pk} = s.{pk}" for pk in primary_key_columns])
-        second_layer_db_merge_statement: str = f"""
-            MERGE INTO {entity_catalog}.{entity_schema}.{entity_name} t
-            USING (SELECT {second_layer_db_header_string} FROM {entity_schema}.{entity_name}) s
-            ON (1=1 {second_layer_merge_constraints}) 
-            {"WHEN MATCHED THEN UPDATE" if entity.update_allowed else ""}
-            WHEN NOT MATCHED THEN INSERT
-        """
-
-        logs.debug("Second Layer Database Insert Statement Created.")
+        second_layer_db_insert_statement, second_layer_db_merge_statement = self.get_second_layer_statements(entity)
         statement_map = {
             "hydrate_return": hydrate_return,
             "first_layer_db_write_statement": first_layer_db_insert_statement,
@@ -116,18 +234,107 @@ class SharedModelMixin:
         return statement_map
 
     @classmethod
-    def inflate(cls, data: dict, polyglot_entity: PolyglotEntity, model_hydrate: dict | None = None) -> Self:
+    def inflate(
+        cls, data: dict, polyglot_entity: PolyglotEntity | None = None, model_hydrate: dict | None = None
+    ) -> Self:
         """Inflate the model."""
 
         logs.debug("Inflating Model.", name=cls.__name__)
 
-        data.update({"polyglot_entity": polyglot_entity})
+        if polyglot_entity and not cls.get_polyglot_entity():
+            cls.bind_polyglot_entity(polyglot_entity)
+
         model = cls(**data)
         if model_hydrate:
             model._model_hydrate(model_hydrate)
 
         return model
 
+    @classmethod
+    @metrics.timed("inflate_many")
+    def inflate_many(
+        cls,
+        data: Iterable[dict],
+        polyglot_entity: PolyglotEntity | None = None,
+        model_hydrate: dict | None = None,
+    ) -> BatchValidationResult:
+        """Inflate a batch of models in a single validation call, collecting per-record errors."""
+
+        if polyglot_entity and not cls.get_polyglot_entity():
+            cls.bind_polyglot_entity(polyglot_entity)
+
+        records: list[dict] = data if isinstance(data, list) else list(data)
+        logs.debug("Inflating Models.", name=cls.__name__, records=len(records))
+
+        models: list[Self] = []
+        errors: list[RecordValidationError] = []
+        for i, model in enumerate(_get_batch_adapter(cls).validate_python(records)):
+            if isinstance(model, _InvalidRecord):
+                # Locations start with the record index, as when the batch is validated as a plain list.
+                errors.append(
+                    RecordValidationError(index=i, errors=[{**e, "loc": (i, *e["loc"])} for e in model.errors])
+                )
+            else:
+                models.append(model)
+
+        if errors:
+            logs.warning("Records failed validation.", name=cls.__name__, invalid=len(errors), valid=len(models))
+
+        if model_hydrate:
+            for model in models:
+                model._model_hydrate(model_hydrate)
+
+        metrics.increment("records.validated", len(models), model=cls.__name__)
+        if errors:
+            metrics.increment("records.rejected", len(errors), model=cls.__name__)
+
+        return BatchValidationResult(records=models, errors=errors)
+
+    @classmethod
+    def from_catalog(cls, records: CatalogRecords, model_hydrate: dict | None = None) -> list[Self]:
+        """Build models from rows read back from the catalog without running validation."""
+
+        if not isinstance(records, CatalogRecords):
+            logs.error("Trusted construction is only allowed for catalog records.", name=cls.__name__)
+            raise TypeError("Trusted construction is only allowed for catalog records.")
+
+        if records.source not in [e.value for e in DuckLakeDbEntityType]:
+            logs.error("Unknown catalog records source.", source=records.source)
+            raise ValueError(f"Unknown catalog records source: {records.source}")
+
+        entity: PolyglotEntity | None = cls.get_polyglot_entity()
+        if entity and entity.name != records.entity:
+            logs.error("Catalog records belong to another entity.", entity=entity.name, records=records.entity)
+            raise ValueError(f"Catalog records belong to {records.entity}, expected {entity.name}.")
+
+        logs.debug("Constructing Trusted Models.", name=cls.__name__, records=len(records.rows))
+
+        fields = cls.model_fields
+        defaults = {n: f.default for n, f in fields.items() if not f.is_required() and f.default_factory is None}
+        factories = {n: f.default_factory for n, f in fields.items() if f.default_factory is not None}
+
+        models = []
+        for row in records.rows:
+            # Rows selected by column name carry every field, anything else is completed with the defaults.
+            if row.keys() != fields.keys():
+                fields_set = {k for k in row if k in fields}
+                row = {**defaults, **{n: f() for n, f in factories.items()}, **{k: row[k] for k in fields_set}}
+            else:
+                fields_set = set(row)
+
+            # Same end state as model_construct, without its per-field loop.
+            model = cls.__new__(cls)
+            object.__setattr__(model, "__dict__", row)
+            object.__setattr__(model, "__pydantic_fields_set__", fields_set)
+            object.__setattr__(model, "__pydantic_extra__", None)
+            object.__setattr__(model, "__pydantic_private__", None)
+
+            if model_hydrate:
+                model._model_hydrate(model_hydrate, trusted=True)
+            models.append(model)
+
+        return models
+
     @property
     def content_report(self) -> str:
         """Build a content report in Markdown format."""
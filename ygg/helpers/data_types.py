@@ -84,7 +84,7 @@ DATA_TYPES: dict = {
     "CustomProperties": {
         "logical": {"type": CustomProperties},
         "physical": {
-            "type": "STRUCT(id VARCHAR, property VARCHAR, value VARCHAR, description VARCHAR)",
+            "type": "STRUCT(id VARCHAR, property VARCHAR, value VARCHAR, description VARCHAR)[]",
         },
     },
     "AuthoritativeDefinitions": {
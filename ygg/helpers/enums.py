@@ -17,3 +17,26 @@ class DuckLakeDbEntityType(Enum):
 
     DUCKDB = "duckdb"
     DUCKLAKE = "ducklake"
+
+
+class SignatureAlgorithm(Enum):
+    """Record Signature Algorithms."""
+
+    SHA256 = "sha256"
+    BLAKE2B = "blake2b"
+    XXHASH = "xxh3_128"
+
+
+class WriteAheadBatchStatus(Enum):
+    """Write Ahead Queue Batch Status."""
+
+    PENDING = "pending"
+    COMMITTING = "committing"
+    FAILED = "failed"
+
+
+class RecordStreamFormat(Enum):
+    """Record Stream Formats."""
+
+    NDJSON = "ndjson"
+    YAML = "yaml"
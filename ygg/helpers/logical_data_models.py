@@ -5,6 +5,8 @@ from typing import Any
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from ygg.helpers.enums import SignatureAlgorithm
+
 
 class YggBaseModel(BaseModel):
     """Dynamic Models Factory Base Model."""
@@ -40,6 +42,18 @@ class ModelProperty(YggBaseModel):
     skip_from_signature: bool = Field(default=False)
     skip_from_physical_model: bool = Field(default=False)
     examples: list[str] | None = Field(default=None)
+    renamed_from: str | None = Field(default=None)
+
+
+class OdcsPropertySpec(YggBaseModel):
+    """ODCS Property Spec."""
+
+    type: Any | None = Field(default=None, description="ODCS property type")
+    default: Any | None = Field(default=None, description="ODCS property default value")
+    enum: list | None = Field(default=None, description="ODCS property enum values")
+    description: str | None = Field(default=None, description="ODCS property description")
+    examples: list | None = Field(default=None, description="ODCS property examples")
+    required: Any | None = Field(default=None, description="ODCS property required flag or list")
 
 
 class ModelSettings(YggBaseModel):
@@ -55,6 +69,7 @@ class ModelSettings(YggBaseModel):
     description: str
     odcs_reference: str
     properties: list[ModelProperty]
+    signature_algorithm: SignatureAlgorithm = Field(default=SignatureAlgorithm.SHA256, validate_default=True)
 
 
 class PolyglotDatabaseConfig(YggBaseModel):
@@ -94,6 +109,7 @@ class PolyglotEntityColumn(YggBaseModel):
     default_value: str | Any | None = Field(default=None, description="Default value")
     default_value_function: str | None = Field(default=None, description="Database function for default value")
     examples: list[Any] | None = Field(default=None)
+    renamed_from: str | None = Field(default=None, description="Previous column name, renamed on schema evolution")
 
     skip_from_signature: bool | None = Field(default=False, description="Whether to skip the column from signature")
     skip_from_physical_model: bool | None = Field(
@@ -111,6 +127,230 @@ class PolyglotEntity(YggBaseModel):
     update_allowed: bool | None = Field(default=True, description="Whether the entity can be updated")
     delete_allowed: bool | None = Field(default=True, description="Whether the entity can be deleted")
     columns: list[PolyglotEntityColumn] | None = Field(default=None, description="Entity list of columns")
+    signature_algorithm: SignatureAlgorithm = Field(
+        default=SignatureAlgorithm.SHA256,
+        validate_default=True,
+        description="Algorithm of the entity record signatures",
+    )
+
+
+class RecordValidationError(YggBaseModel):
+    """Record Validation Error."""
+
+    index: int = Field(..., description="Position of the record in the validated batch")
+    errors: list[dict[str, Any]] = Field(default_factory=list, description="Pydantic errors for the record")
+
+
+class BatchValidationResult(YggBaseModel):
+    """Batch Validation Result."""
+
+    records: list[Any] = Field(default_factory=list, description="Validated model instances")
+    errors: list[RecordValidationError] = Field(default_factory=list, description="Records that failed validation")
+
+
+class ColumnarValidationResult(YggBaseModel):
+    """Columnar Validation Result."""
+
+    buffer: Any = Field(default=None, description="Columnar buffer of the validated and signed records")
+    errors: list[RecordValidationError] = Field(default_factory=list, description="Records that failed validation")
+    timings: dict[str, float] = Field(default_factory=dict, description="Phase timings in seconds")
+
+
+class StreamPosition(YggBaseModel):
+    """Stream Position, where reading a record stream resumes."""
+
+    offset: int = Field(default=0, description="Byte offset of the document reading resumes at")
+    index: int = Field(default=0, description="Records of that document already read")
+
+
+class RecordChunk(YggBaseModel):
+    """Record Chunk read from a record stream."""
+
+    records: list[dict[str, Any]] = Field(default_factory=list, description="Records of the chunk")
+    first_record: int = Field(default=0, description="Number of records read from the start position before the chunk")
+    position: StreamPosition = Field(default_factory=StreamPosition, description="Position after the chunk")
+
+
+class StreamWriteReport(YggBaseModel):
+    """Stream Write Report."""
+
+    entity: str = Field(..., description="Entity name")
+    chunks: int = Field(default=0, description="Number of chunks written")
+    records: int = Field(default=0, description="Number of records written")
+    errors: list[RecordValidationError] = Field(
+        default_factory=list, description="Records that failed validation, indexed from the start position"
+    )
+    position: StreamPosition = Field(default_factory=StreamPosition, description="Position after the last chunk")
+    snapshot_id: int | None = Field(default=None, description="DuckLake snapshot of the last write")
+
+
+class RunCheckpoint(YggBaseModel):
+    """Run Checkpoint, the progress of a bulk run over one input file."""
+
+    run_name: str = Field(..., description="Name of the bulk run")
+    file: str = Field(..., description="Resolved path of the input file")
+    entity: str = Field(..., description="Entity the file is written to")
+    file_signature: str = Field(..., description="Size and modification time of the file when it was read")
+    position: StreamPosition = Field(default_factory=StreamPosition, description="Position after the last commit")
+    records: int = Field(default=0, description="Records committed so far")
+    snapshot_id: int | None = Field(default=None, description="DuckLake snapshot of the last commit")
+    completed: bool = Field(default=False, description="Whether the whole file is committed")
+
+
+class RejectedRecord(YggBaseModel):
+    """Rejected Record."""
+
+    record: dict[str, Any] = Field(default_factory=dict, description="Original values of the rejected row")
+    reasons: list[str] = Field(default_factory=list, description="Broken rules, as column: reason")
+
+
+class BulkWriteResult(YggBaseModel):
+    """Bulk Write Result."""
+
+    entity: str = Field(..., description="Entity name")
+    written: int = Field(default=0, description="Number of valid rows written")
+    rejected: list[RejectedRecord] = Field(default_factory=list, description="Rows that failed validation")
+
+
+class WriteAheadBatch(YggBaseModel):
+    """Write Ahead Batch, a staged batch waiting to be committed into DuckLake."""
+
+    batch_id: int = Field(..., description="Queue sequence of the batch, batches commit in this order")
+    entity: str = Field(..., description="Entity name")
+    upsert: bool = Field(default=True, description="Whether the batch is merged or inserted")
+    statements: list[dict[str, Any]] = Field(default_factory=list, description="Grouped first layer inserts")
+    rows: int = Field(default=0, description="Number of records in the batch")
+    attempts: int = Field(default=0, description="Number of failed commit attempts")
+
+
+class CommitReport(YggBaseModel):
+    """Commit Report of a grouped commit."""
+
+    batches: int = Field(default=0, description="Number of batches committed")
+    rows: int = Field(default=0, description="Number of records committed")
+    entities: list[str] = Field(default_factory=list, description="Entities written by the commit")
+    attempts: int = Field(default=0, description="Commit attempts, conflicts included")
+    timings: dict[str, float] = Field(default_factory=dict, description="Phase timings in seconds")
+
+
+class FileRegistrationReport(YggBaseModel):
+    """File Registration Report of one contract file of a folder run."""
+
+    file: str = Field(..., description="Contract file path")
+    rows: int = Field(default=0, description="Number of records written over every level")
+    errors: int = Field(default=0, description="Number of records that failed validation")
+    seconds: float = Field(default=0.0, description="Time spent registering the file")
+    attempts: int = Field(default=0, description="Write attempts, commit conflicts included")
+    error: str | None = Field(default=None, description="Error that stopped the file, None when it was registered")
+
+
+class FolderRegistrationReport(YggBaseModel):
+    """Folder Registration Report."""
+
+    folder: str = Field(..., description="Contracts folder")
+    files: int = Field(default=0, description="Number of contract files found")
+    registered: int = Field(default=0, description="Number of contract files registered")
+    rows: int = Field(default=0, description="Number of records written")
+    seconds: float = Field(default=0.0, description="Wall time of the run")
+    files_per_second: float = Field(default=0.0, description="Files registered per second of wall time")
+    rows_per_second: float = Field(default=0.0, description="Records written per second of wall time")
+    failures: list[FileRegistrationReport] = Field(default_factory=list, description="Files that failed")
+    slowest: list[FileRegistrationReport] = Field(default_factory=list, description="Slowest files, slowest first")
+
+
+class WatchStatus(YggBaseModel):
+    """Watch Status of a resident contract folder watcher."""
+
+    folder: str = Field(..., description="Watched contracts folder")
+    running: bool = Field(default=False, description="Whether the watcher is polling")
+    cycles: int = Field(default=0, description="Number of polls of the folder")
+    files: int = Field(default=0, description="Number of contract files watched")
+    pending: int = Field(default=0, description="Changed files waiting for the debounce to settle")
+    registered: int = Field(default=0, description="Files registered since the watcher started")
+    unchanged: int = Field(default=0, description="Touched files skipped as their content signature did not change")
+    failed: int = Field(default=0, description="File registrations that failed")
+    last_latency_seconds: float | None = Field(
+        default=None, description="Time from the last registered change on disk to its commit"
+    )
+    max_latency_seconds: float = Field(default=0.0, description="Highest change to commit latency seen")
+    mean_latency_seconds: float = Field(default=0.0, description="Mean change to commit latency")
+    last_error: str | None = Field(default=None, description="Error of the last failed registration")
+
+
+class IngestionAck(YggBaseModel):
+    """Ingestion Acknowledgement of one request of the ingestion service."""
+
+    entity: str = Field(..., description="Entity name")
+    accepted: int = Field(default=0, description="Number of records written")
+    rejected: int = Field(default=0, description="Number of records that failed validation")
+    hydrate_returns: list[dict[str, Any]] = Field(
+        default_factory=list, description="Keys of the written records, in request order"
+    )
+    errors: list[RecordValidationError] = Field(default_factory=list, description="Records that failed validation")
+    batch_records: int = Field(default=0, description="Records of the micro-batch the request was committed with")
+    snapshot_id: int | None = Field(default=None, description="DuckLake snapshot of the commit")
+
+
+class IngestionEntityStats(YggBaseModel):
+    """Ingestion Entity Stats of the ingestion service."""
+
+    entity: str = Field(..., description="Entity name")
+    requests: int = Field(default=0, description="Requests committed")
+    records: int = Field(default=0, description="Records committed")
+    batches: int = Field(default=0, description="Micro-batches committed")
+    failed_batches: int = Field(default=0, description="Micro-batches that failed to commit")
+    mean_batch_records: float = Field(default=0.0, description="Mean records per micro-batch")
+    mean_commit_seconds: float = Field(default=0.0, description="Mean time spent committing a micro-batch")
+    pending_requests: int = Field(default=0, description="Requests waiting for the next micro-batch")
+
+
+class TimerMetric(YggBaseModel):
+    """Timer Metric, the spans of a phase."""
+
+    name: str = Field(..., description="Phase name")
+    labels: dict[str, str] = Field(default_factory=dict, description="Labels of the timer, e.g. the entity")
+    count: int = Field(default=0, description="Number of spans")
+    total_seconds: float = Field(default=0.0, description="Time spent in the spans")
+    min_seconds: float = Field(default=0.0, description="Shortest span")
+    max_seconds: float = Field(default=0.0, description="Longest span")
+
+
+class CounterMetric(YggBaseModel):
+    """Counter Metric."""
+
+    name: str = Field(..., description="Counter name")
+    labels: dict[str, str] = Field(default_factory=dict, description="Labels of the counter, e.g. the entity")
+    value: float = Field(default=0, description="Counter value")
+
+
+class MetricsSnapshot(YggBaseModel):
+    """Metrics Snapshot of every timer and counter at a point in time."""
+
+    timestamp: float = Field(..., description="Unix time of the snapshot")
+    timers: list[TimerMetric] = Field(default_factory=list, description="Phase timers")
+    counters: list[CounterMetric] = Field(default_factory=list, description="Counters")
+
+
+class StatementProfile(YggBaseModel):
+    """Statement Profile of one DuckDb statement run with profiling enabled."""
+
+    timestamp: float = Field(..., description="Unix time the statement finished")
+    statement: str = Field(..., description="Statement text")
+    seconds: float = Field(..., description="Wall time of the statement")
+    rows: int | None = Field(default=None, description="Rows affected, None when the statement does not report them")
+    slow: bool = Field(default=False, description="Whether the statement crossed the slow statement threshold")
+    top_operators: list[dict[str, Any]] = Field(
+        default_factory=list, description="Operators that took the longest, with their timing and cardinality"
+    )
+    profile: dict[str, Any] = Field(default_factory=dict, description="DuckDb JSON profile with the operator tree")
+
+
+class CatalogRecords(YggBaseModel):
+    """Rows read back from Ygg's own DuckDb or DuckLake entities, already validated on write."""
+
+    entity: str = Field(..., description="Entity the rows were read from")
+    source: str = Field(..., description="Entity type the rows were read from, duckdb or ducklake")
+    rows: list[Any] = Field(default_factory=list, description="Rows as dictionaries keyed by column name")
 
 
 class DuckLakeSetup(YggBaseModel):
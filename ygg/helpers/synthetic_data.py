@@ -0,0 +1,455 @@
+"""Seeded synthetic contract schemas, records and documents for scale testing."""
+
+import datetime
+import json
+import random
+import re
+import string
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator
+
+import duckdb
+import yaml
+
+from ygg.core.odcs_schema_index import OdcsSchemaIndex
+from ygg.helpers.data_types import DATA_TYPES
+from ygg.helpers.enums import RecordStreamFormat
+from ygg.helpers.logical_data_models import ModelProperty, ModelSettings
+from ygg.utils.record_stream import RECORD_STREAM_SUFFIXES
+from ygg.utils.ygg_logs import get_logger
+
+logs = get_logger(logger_name="SyntheticData")
+
+# timestamp is left out by default, record signatures do not encode datetime values yet.
+FIELD_TYPES: tuple[str, ...] = (
+    "string",
+    "integer",
+    "boolean",
+    "Tags",
+    "SemanticalVersion",
+    "StructuredName",
+    "list_of_strings",
+    "CustomProperties",
+    "StructuredDescription",
+)
+ENUM_EVERY: int = 7
+EXAMPLES_EVERY: int = 11
+CHILDREN_KEY: str = "children"
+PARQUET_SUFFIX: str = ".parquet"
+EPOCH = datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc)
+WORD_CHARACTERS: str = string.ascii_lowercase + string.digits
+
+_ValueFactory = Callable[[random.Random, int], Any]
+
+
+def _word(rng: random.Random, size: int) -> str:
+    """Get a random word of up to size characters."""
+    return "".join(rng.choices(string.ascii_lowercase, k=rng.randint(max(1, size // 2), max(1, size))))
+
+
+def _text(rng: random.Random, size: int) -> str:
+    """Get random text of about size characters."""
+    return " ".join(_word(rng, 8) for _ in range(max(1, size // 9)))
+
+
+def _stable_id(rng: random.Random, size: int) -> str:
+    """Get a random id matching the StableId pattern."""
+    return "".join(rng.choices(WORD_CHARACTERS + "_-", k=max(1, size)))
+
+
+VALUE_FACTORIES: dict[str, _ValueFactory] = {
+    "string": lambda rng, size: _text(rng, size),
+    "integer": lambda rng, size: rng.randint(0, 10**9),
+    "boolean": lambda rng, size: rng.random() < 0.5,
+    "timestamp": lambda rng, size: (EPOCH + datetime.timedelta(seconds=rng.randint(0, 10**8))).isoformat(),
+    "Tags": lambda rng, size: [_word(rng, 8) for _ in range(rng.randint(1, 3))],
+    "list_of_strings": lambda rng, size: [_word(rng, size) for _ in range(rng.randint(1, 3))],
+    "SemanticalVersion": lambda rng, size: f"{rng.randint(0, 9)}.{rng.randint(0, 20)}.{rng.randint(0, 99)}",
+    "StructuredName": lambda rng, size: "_".join(_word(rng, 8) for _ in range(rng.randint(1, 3))),
+    "StableId": lambda rng, size: _stable_id(rng, 12),
+    "CustomProperties": lambda rng, size: [
+        {
+            "id": _stable_id(rng, 12),
+            "property": _word(rng, 12),
+            "value": _text(rng, size),
+            "description": _text(rng, size),
+        }
+        for _ in range(rng.randint(1, 3))
+    ],
+    "AuthoritativeDefinitions": lambda rng, size: [
+        {
+            "id": _stable_id(rng, 12),
+            "url": f"https://example.com/{_word(rng, 12)}",
+            "type": _word(rng, 8),
+            "description": _text(rng, size),
+        }
+        for _ in range(rng.randint(1, 3))
+    ],
+    "StructuredDescription": lambda rng, size: {
+        "usage": _text(rng, size),
+        "purpose": _text(rng, size),
+        "limitations": _text(rng, size),
+    },
+}
+PATTERN_TYPES: tuple[str, ...] = ("StableId", "StructuredName", "SemanticalVersion")
+INVALID_VALUES: dict[str, Any] = {
+    "integer": "not a number",
+    "boolean": {"not": "a boolean"},
+    "timestamp": "not a timestamp",
+    "Tags": 42,
+    "list_of_strings": 42,
+    "CustomProperties": "not a list",
+    "AuthoritativeDefinitions": "not a list",
+    "StructuredDescription": ["not", "a", "description"],
+}
+
+
+class SyntheticDataGenerator:
+    """Synthetic Data Generator.
+
+    Builds contract schemas of any width and depth from the types of DATA_TYPES, and the records and nested
+    documents of those schemas, or of any existing contract schema, honoring the enum, examples and pattern of
+    every property. Every record is drawn from its own generator, seeded by the seed, the entity and the record
+    index, so a record is the same whatever the batch or the process it is generated in. A share of the records
+    can be broken on purpose, holding a value of the wrong type or not matching the pattern of its property.
+    """
+
+    def __init__(
+        self,
+        seed: int = 0,
+        invalid_ratio: float = 0.0,
+        value_size: int = 16,
+        odcs_reference: dict | None = None,
+    ):
+        """Initialize the Synthetic Data Generator, odcs_reference resolves the properties bound to ODCS."""
+
+        if not 0.0 <= invalid_ratio <= 1.0:
+            logs.error("Invalid ratio must be between 0 and 1.", invalid_ratio=invalid_ratio)
+            raise ValueError("Invalid ratio must be between 0 and 1.")
+
+        if value_size < 1:
+            logs.error("Value size must be positive.", value_size=value_size)
+            raise ValueError("Value size must be positive.")
+
+        self._seed: int = seed
+        self._invalid_ratio: float = invalid_ratio
+        self._value_size: int = value_size
+        self._odcs_schema_index: OdcsSchemaIndex | None = OdcsSchemaIndex(odcs_reference) if odcs_reference else None
+
+    @property
+    def seed(self) -> int:
+        """Get the seed."""
+        return self._seed
+
+    @staticmethod
+    def schema_config(models: list[str] | None = None, odcs_version: str = "3.1.0") -> dict:
+        """Get a schema config, with the record_hash common of the Ygg schemas."""
+
+        return {
+            "version_file": "version",
+            "odcs_version": odcs_version,
+            "odcs_schema_file": "synthetic.json",
+            "models": models or ["contract"],
+            "commons": [
+                {
+                    "name": "record_hash",
+                    "type": "string",
+                    "required": False,
+                    "skip_from_signature": True,
+                    "alias": "recordHash",
+                }
+            ],
+        }
+
+    @staticmethod
+    def odcs_reference() -> dict:
+        """Get the ODCS reference of the synthetic schemas, which type their properties themselves."""
+
+        return {
+            "properties": {
+                "id": {"type": "string", "description": "Synthetic record id."},
+                "version": {"type": "string", "description": "Synthetic record version."},
+            }
+        }
+
+    def contract_schema(
+        self,
+        name: str,
+        width: int,
+        entity_schema: str = "ygg",
+        document_path: str = "",
+        ancestors: list[str] | None = None,
+        field_types: tuple[str, ...] = FIELD_TYPES,
+    ) -> dict:
+        """Get a contract schema of width properties, the key included, and one optional key column per ancestor."""
+
+        if width < 1:
+            logs.error("Schema width must be positive.", width=width)
+            raise ValueError("Schema width must be positive.")
+
+        unknown_types = [t for t in field_types if t not in DATA_TYPES or t not in VALUE_FACTORIES]
+        if unknown_types:
+            logs.error("Field types must be Ygg data types.", field_types=unknown_types)
+            raise ValueError(f"Field types must be Ygg data types: {unknown_types}")
+
+        rng = random.Random(f"{self._seed}:schema:{name}")
+        properties: list[dict] = [{"name": "id", "type": "StableId", "primary_key": True, "alias": "id"}]
+        properties += [
+            {"name": f"{a}_id", "type": "StableId", "required": False, "alias": f"{a}_id"} for a in ancestors or []
+        ]
+
+        for i in range(width - 1):
+            field_type = field_types[i % len(field_types)]
+            prop: dict[str, Any] = {
+                "name": f"field_{i}",
+                "type": field_type,
+                "alias": f"field{i}",
+                "required": rng.random() < 0.5,
+                "description": f"Synthetic {field_type} property.",
+            }
+            if field_type == "string" and i % ENUM_EVERY == ENUM_EVERY - 1:
+                prop["enum"] = [_word(rng, 8) for _ in range(rng.randint(2, 6))]
+            elif field_type == "string" and i % EXAMPLES_EVERY == EXAMPLES_EVERY - 1:
+                prop["examples"] = [_text(rng, self._value_size) for _ in range(3)]
+
+            properties.append(prop)
+
+        schema = {
+            "name": "".join(p.capitalize() for p in re.split(r"[^A-Za-z0-9]+", name) if p),
+            "document_path": document_path,
+            "type": "object",
+            "required": True,
+            "entity_name": re.sub(r"[^a-z0-9_]+", "_", name.lower()),
+            "entity_type": "table",
+            "entity_schema": entity_schema,
+            "description": f"Synthetic entity with {width} properties.",
+            "odcs_reference": "synthetic",
+            "properties": properties,
+        }
+
+        ModelSettings(**schema)
+        return schema
+
+    def contract_schemas(self, name: str, width: int, depth: int, entity_schema: str = "ygg") -> list[dict]:
+        """Get the contract schemas of a document tree of depth levels, parents first.
+
+        Each level below the first is found under the children key of its parent and keeps one key column per
+        ancestor, named as ContractGraphWriter hands the keys down.
+        """
+
+        if depth < 1:
+            logs.error("Schema depth must be positive.", depth=depth)
+            raise ValueError("Schema depth must be positive.")
+
+        schemas: list[dict] = []
+        for level in range(depth):
+            schemas.append(
+                self.contract_schema(
+                    name=f"{name}_l{level}",
+                    width=width,
+                    entity_schema=entity_schema,
+                    document_path=CHILDREN_KEY if level else "",
+                    ancestors=[s["entity_name"] for s in schemas],
+                )
+            )
+
+        return schemas
+
+    def _get_properties(self, schema: dict) -> list[ModelProperty]:
+        """Get the properties of a schema, resolved through the ODCS reference as DataContractLoader does."""
+
+        properties: list[ModelProperty] = []
+        for prop in ModelSettings(**schema).properties:
+            if prop.odcs_schema:
+                if self._odcs_schema_index is None:
+                    logs.error("Properties bound to ODCS need the ODCS reference.", property=prop.name)
+                    raise ValueError(f"Property {prop.name} is bound to ODCS, an ODCS reference is needed.")
+
+                spec = self._odcs_schema_index.get_property_spec(prop.odcs_schema)
+                prop.alias = prop.alias or prop.odcs_schema.split(".")[-1]
+                prop.type = prop.type or spec.type
+                prop.enum = prop.enum or spec.enum
+                prop.examples = prop.examples or spec.examples
+                prop.required = prop.required or spec.required
+
+            # Ygg fills the properties left out of the signature, e.g. record_hash.
+            if prop.skip_from_signature:
+                continue
+
+            if not prop.enum and prop.type not in VALUE_FACTORIES:
+                logs.error("Property type cannot be generated.", property=prop.name, type=prop.type)
+                raise ValueError(f"Property {prop.name} type cannot be generated: {prop.type}")
+
+            properties.append(prop)
+
+        return properties
+
+    def _get_value(self, prop: ModelProperty, rng: random.Random, key: str) -> Any:
+        """Get a valid value of a property."""
+
+        if prop.primary_key:
+            return key if prop.type != "integer" else int(key.rsplit("-", 1)[-1])
+
+        if prop.enum:
+            return rng.choice(prop.enum)
+
+        if prop.examples:
+            return rng.choice(prop.examples)
+
+        value = VALUE_FACTORIES[prop.type](rng, self._value_size)
+        if prop.pattern and isinstance(value, str) and not re.fullmatch(prop.pattern, value):
+            logs.error("Property pattern cannot be generated, examples are needed.", property=prop.name)
+            raise ValueError(f"Property {prop.name} pattern cannot be generated, add examples to it.")
+
+        return value
+
+    @staticmethod
+    def _invalidate(record: dict, properties: list[ModelProperty], rng: random.Random) -> None:
+        """Break a record, setting a value of the wrong type or not matching its pattern."""
+
+        # Required and enum are left alone, the models built by Polyglot do not enforce them.
+        breaks: list[tuple[str, Any]] = []
+        for prop in properties:
+            field = prop.alias or prop.name
+            if prop.pattern or prop.type in PATTERN_TYPES:
+                breaks.append((field, "not matching the pattern!"))
+            elif prop.type in INVALID_VALUES:
+                breaks.append((field, INVALID_VALUES[prop.type]))
+
+        if not breaks:
+            logs.warning("Record cannot be broken, no property is typed or constrained.")
+            return
+
+        field, value = rng.choice(breaks)
+        record[field] = value
+
+    def _is_invalid(self, entity_name: str, index: int) -> bool:
+        """Whether the record of an index of an entity is broken on purpose."""
+
+        if not self._invalid_ratio:
+            return False
+
+        return random.Random(f"{self._seed}:invalid:{entity_name}:{index}").random() < self._invalid_ratio
+
+    def is_invalid(self, schema: dict, index: int) -> bool:
+        """Whether the record of an index is broken on purpose."""
+        return self._is_invalid(schema.get("entity_name"), index)
+
+    def _get_record(self, entity_name: str, properties: list[ModelProperty], index: int, prefix: str) -> dict:
+        """Get the record of an index from resolved properties."""
+
+        rng = random.Random(f"{self._seed}:record:{entity_name}:{prefix}:{index}")
+        key = f"{re.sub(r'[^A-Za-z0-9_-]+', '_', prefix)}-{index}"
+
+        record = {p.alias or p.name: self._get_value(p, rng, key) for p in properties}
+        if self._is_invalid(entity_name, index):
+            self._invalidate(record, properties, rng)
+
+        return record
+
+    def record(self, schema: dict, index: int, prefix: str = "r") -> dict:
+        """Get the record of an index, keyed by the prefix and the index."""
+        return self._get_record(schema.get("entity_name"), self._get_properties(schema), index, prefix)
+
+    def records(self, schema: dict, count: int, start: int = 0, prefix: str = "r") -> Iterator[dict]:
+        """Stream count records of a schema from the start index."""
+
+        properties = self._get_properties(schema)
+        for index in range(start, start + count):
+            yield self._get_record(schema.get("entity_name"), properties, index, prefix)
+
+    def _get_document(
+        self, levels: list[tuple[str, list[ModelProperty]]], level: int, index: int, key: str, fanout: int
+    ) -> dict:
+        """Get the document of a level, with its children documents nested below it."""
+
+        entity_name, properties = levels[level]
+        document = self._get_record(entity_name, properties, index, key)
+        if level + 1 < len(levels):
+            child_key = f"{key}-{index}"
+            document[CHILDREN_KEY] = [
+                self._get_document(levels, level + 1, i, child_key, fanout) for i in range(fanout)
+            ]
+
+        return document
+
+    def documents(
+        self, schemas: list[dict], count: int, fanout: int = 3, start: int = 0, prefix: str = "d"
+    ) -> Iterator[dict]:
+        """Stream count nested documents of the schemas of contract_schemas, fanout children per level."""
+
+        if not schemas:
+            logs.error("Schemas cannot be empty.")
+            raise ValueError("Schemas cannot be empty.")
+
+        # The ancestor key columns are handed down by the writer, they are not part of the documents.
+        levels: list[tuple[str, list[ModelProperty]]] = []
+        for level, schema in enumerate(schemas):
+            ancestors = {f"{s['entity_name']}_id" for s in schemas[:level]}
+            properties = [p for p in self._get_properties(schema) if p.name not in ancestors]
+            levels.append((schema["entity_name"], properties))
+
+        for index in range(start, start + count):
+            yield self._get_document(levels, 0, index, prefix, fanout)
+
+    @staticmethod
+    def write_ndjson(records: Iterable[dict], file_path: Path | str) -> int:
+        """Write records as NDJSON, one at a time, returning how many were written."""
+
+        written = 0
+        with open(file_path, "w") as file:
+            for record in records:
+                file.write(json.dumps(record, default=str) + "\n")
+                written += 1
+
+        return written
+
+    @staticmethod
+    def write_yaml(documents: Iterable[dict], file_path: Path | str) -> int:
+        """Write documents as a multi-document YAML stream, one at a time, returning how many were written."""
+
+        written = 0
+        with open(file_path, "w") as file:
+            for document in documents:
+                file.write("---\n")
+                yaml.safe_dump(document, file, sort_keys=False)
+                written += 1
+
+        return written
+
+    @staticmethod
+    def write_parquet(records: Iterable[dict], file_path: Path | str) -> int:
+        """Write records as Parquet through DuckDb, staged as NDJSON first, returning how many were written."""
+
+        with tempfile.TemporaryDirectory(prefix="ygg-synthetic-") as folder:
+            staged = Path(folder) / "records.ndjson"
+            written = SyntheticDataGenerator.write_ndjson(records, staged)
+            if not written:
+                logs.warning("No records to write.", file=str(file_path))
+                return 0
+
+            with duckdb.connect() as con:
+                con.execute(
+                    f"COPY (SELECT * FROM read_json('{staged}', format = 'newline_delimited', sample_size = -1)) "
+                    f"TO '{Path(file_path)}' (FORMAT parquet)"
+                )
+
+        return written
+
+    @staticmethod
+    def write(items: Iterable[dict], file_path: Path | str) -> int:
+        """Write records or documents in the format of the file suffix, NDJSON, YAML or Parquet."""
+
+        suffix = Path(file_path).suffix.lower()
+        if suffix == PARQUET_SUFFIX:
+            return SyntheticDataGenerator.write_parquet(items, file_path)
+
+        stream_format = RECORD_STREAM_SUFFIXES.get(suffix)
+        if stream_format == RecordStreamFormat.NDJSON:
+            return SyntheticDataGenerator.write_ndjson(items, file_path)
+        if stream_format == RecordStreamFormat.YAML:
+            return SyntheticDataGenerator.write_yaml(items, file_path)
+
+        logs.error("File format not supported.", file=str(file_path))
+        raise ValueError(f"File format not supported: {file_path}")
@@ -0,0 +1,119 @@
+"""Checkpoints of bulk runs, kept in the local Ygg database."""
+
+from pathlib import Path
+
+import duckdb
+
+from ygg.config import YggSetup
+from ygg.helpers.logical_data_models import RunCheckpoint, StreamPosition
+from ygg.utils.ygg_logs import get_logger
+
+logs = get_logger(logger_name="CheckpointStore")
+
+CHECKPOINTS_TABLE: str = "ygg_run_checkpoints"
+
+
+class CheckpointStore:
+    """Checkpoint Store.
+
+    Keeps one row per run, file and entity with the stream position and DuckLake snapshot of the last committed
+    chunk. Each call opens its own connection, so the Ygg database stays free between commits.
+    """
+
+    def __init__(self, database_file: Path | str | None = None):
+        """Initialize the Checkpoint Store, in the Ygg database when no file is informed."""
+
+        if database_file is None:
+            setup = YggSetup(create_ygg_folders=False, config_data=None)
+            database_file = setup.ygg_database_config.database_url
+
+        self._database_file: Path = Path(database_file)
+        self._database_file.parent.mkdir(parents=True, exist_ok=True)
+
+        with duckdb.connect(str(self._database_file)) as con:
+            con.execute(
+                f"""CREATE TABLE IF NOT EXISTS {CHECKPOINTS_TABLE} (
+                run_name VARCHAR NOT NULL,
+                file VARCHAR NOT NULL,
+                entity VARCHAR NOT NULL,
+                file_signature VARCHAR NOT NULL,
+                "offset" BIGINT NOT NULL,
+                record_index BIGINT NOT NULL,
+                records BIGINT NOT NULL,
+                snapshot_id BIGINT,
+                completed BOOLEAN NOT NULL,
+                updated_at TIMESTAMPTZ DEFAULT current_timestamp,
+                PRIMARY KEY (run_name, file, entity)
+                )"""
+            )
+
+    @staticmethod
+    def get_file_signature(file_path: Path | str) -> str:
+        """Get the size and modification time of a file, a changed file restarts from the beginning."""
+
+        stat = Path(file_path).stat()
+        return f"{stat.st_size}:{stat.st_mtime_ns}"
+
+    def get(self, run_name: str, file: Path | str, entity: str) -> RunCheckpoint | None:
+        """Get the checkpoint of a file in a run."""
+
+        with duckdb.connect(str(self._database_file)) as con:
+            row = con.execute(
+                f"""SELECT file_signature, "offset", record_index, records, snapshot_id, completed
+                FROM {CHECKPOINTS_TABLE} WHERE run_name = ? AND file = ? AND entity = ?""",
+                [run_name, str(Path(file).resolve()), entity],
+            ).fetchone()
+
+        if not row:
+            return None
+
+        file_signature, offset, record_index, records, snapshot_id, completed = row
+        return RunCheckpoint(
+            run_name=run_name,
+            file=str(Path(file).resolve()),
+            entity=entity,
+            file_signature=file_signature,
+            position=StreamPosition(offset=offset, index=record_index),
+            records=records,
+            snapshot_id=snapshot_id,
+            completed=completed,
+        )
+
+    def save(self, checkpoint: RunCheckpoint) -> None:
+        """Save the checkpoint of a file in a run."""
+
+        with duckdb.connect(str(self._database_file)) as con:
+            con.execute(
+                f"""INSERT OR REPLACE INTO {CHECKPOINTS_TABLE}
+                (run_name, file, entity, file_signature, "offset", record_index, records, snapshot_id, completed,
+                updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, current_timestamp)""",
+                [
+                    checkpoint.run_name,
+                    str(Path(checkpoint.file).resolve()),
+                    checkpoint.entity,
+                    checkpoint.file_signature,
+                    checkpoint.position.offset,
+                    checkpoint.position.index,
+                    checkpoint.records,
+                    checkpoint.snapshot_id,
+                    checkpoint.completed,
+                ],
+            )
+
+        logs.debug(
+            "Checkpoint saved.",
+            run_name=checkpoint.run_name,
+            file=checkpoint.file,
+            offset=checkpoint.position.offset,
+            completed=checkpoint.completed,
+        )
+
+    def clear(self, run_name: str) -> int:
+        """Drop the checkpoints of a run, returning how many."""
+
+        with duckdb.connect(str(self._database_file)) as con:
+            cleared = con.execute(f"DELETE FROM {CHECKPOINTS_TABLE} WHERE run_name = ?", [run_name]).fetchone()[0]
+
+        logs.info("Checkpoints cleared.", run_name=run_name, checkpoints=cleared)
+        return cleared
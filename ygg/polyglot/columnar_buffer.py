@@ -0,0 +1,247 @@
+"""Columnar buffer of validated records, handed to DuckDb as a frame for the first layer insert."""
+
+import json
+import sys
+from typing import Any, Iterable
+
+import numpy as np
+import pandas as pd
+
+from ygg.core.shared_model_mixin import SharedModelMixin
+from ygg.helpers.logical_data_models import PolyglotEntity, PolyglotEntityColumn
+from ygg.polyglot.quack_meta_class import QuackMetaClass
+from ygg.polyglot.quack_signature import RECORD_HASH_COLUMN
+from ygg.utils.ygg_logs import get_logger
+
+logs = get_logger(logger_name="ColumnarBuffer")
+
+INITIAL_CAPACITY: int = 1024
+EMPTY_VALUES: tuple = (None, "None", "", ...)
+
+
+class _NumericColumn:
+    """Growable NumPy column with a null mask."""
+
+    __slots__ = ("values", "mask", "size")
+
+    def __init__(self, dtype: type):
+        self.values: np.ndarray = np.zeros(INITIAL_CAPACITY, dtype=dtype)
+        self.mask: np.ndarray = np.ones(INITIAL_CAPACITY, dtype=bool)
+        self.size: int = 0
+
+    def __getstate__(self) -> tuple:
+        # Only the filled part is pickled, worker processes hand back compact columns.
+        return self.values[: self.size].copy(), self.mask[: self.size].copy(), self.size
+
+    def __setstate__(self, state: tuple) -> None:
+        self.values, self.mask, self.size = state
+
+    def append(self, value: Any) -> None:
+        if self.size == len(self.values):
+            grow = max(len(self.values), INITIAL_CAPACITY)
+            self.values = np.resize(self.values, len(self.values) + grow)
+            self.mask = np.concatenate([self.mask, np.ones(grow, dtype=bool)])
+
+        if value is not None:
+            self.values[self.size] = value
+            self.mask[self.size] = False
+
+        self.size += 1
+
+    def extend_columns(self, others: list["_NumericColumn"]) -> None:
+        columns = [self, *others]
+        self.values = np.concatenate([c.values[: c.size] for c in columns])
+        self.mask = np.concatenate([c.mask[: c.size] for c in columns])
+        self.size = sum(c.size for c in columns)
+
+    def get(self, index: int) -> Any:
+        return None if self.mask[index] else self.values[index].item()
+
+    def to_array(self) -> Any:
+        values, mask = self.values[: self.size], self.mask[: self.size]
+        if self.values.dtype == np.bool_:
+            return pd.arrays.BooleanArray(values, mask)
+
+        return pd.arrays.IntegerArray(values, mask)
+
+
+class _ObjectColumn:
+    """Column of Python objects, nested values are kept as compact JSON text."""
+
+    __slots__ = ("values", "nested", "intern")
+
+    def __init__(self, nested: bool, intern: bool):
+        self.values: list[Any] = []
+        self.nested: bool = nested
+        self.intern: bool = intern
+
+    def append(self, value: Any) -> None:
+        if value is not None and self.nested:
+            value = json.dumps(value, separators=(",", ":"), default=str)
+        elif self.intern and isinstance(value, str):
+            value = sys.intern(value)
+
+        self.values.append(value)
+
+    def extend_columns(self, others: list["_ObjectColumn"]) -> None:
+        for other in others:
+            self.values.extend(other.values)
+
+    def get(self, index: int) -> Any:
+        value = self.values[index]
+        return json.loads(value) if value is not None and self.nested else value
+
+    def to_array(self) -> Any:
+        array = np.empty(len(self.values), dtype=object)
+        array[:] = self.values
+        return array
+
+
+class ColumnarRow:
+    """Read-only view of a buffered row."""
+
+    __slots__ = ("_buffer", "_index")
+
+    def __init__(self, buffer: "ColumnarBuffer", index: int):
+        self._buffer = buffer
+        self._index = index
+
+    def __getitem__(self, column_name: str) -> Any:
+        return self._buffer.get_value(column_name, self._index)
+
+    def __getattr__(self, column_name: str) -> Any:
+        try:
+            return self._buffer.get_value(column_name, self._index)
+        except KeyError:
+            raise AttributeError(column_name)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Get the row as a dictionary keyed by column name."""
+        return {name: self._buffer.get_value(name, self._index) for name in self._buffer.column_names}
+
+
+class ColumnarBuffer:
+    """Columnar Buffer.
+
+    Validated records are dumped once, signed and scattered into typed columns, so neither the model instances nor
+    their dumps outlive the append. BIGINT and BOOLEAN columns are masked NumPy arrays DuckDb scans in place,
+    STRUCT columns are kept as JSON text and cast to their declared type when moved into the entity table.
+    """
+
+    def __init__(self, entity: PolyglotEntity):
+        """Initialize the Columnar Buffer."""
+
+        if not entity:
+            logs.error("Polyglot Entity cannot be empty.")
+            raise ValueError("Polyglot Entity cannot be empty.")
+
+        self._entity: PolyglotEntity = entity
+        self._columns: list[PolyglotEntityColumn] = [c for c in entity.columns if not c.skip_from_physical_model]
+        self._signed: bool = RECORD_HASH_COLUMN in [c.name for c in self._columns]
+        self._size: int = 0
+
+        self._builders: dict[str, _NumericColumn | _ObjectColumn] = {}
+        for column in self._columns:
+            data_type = self._get_duck_db_type(column)
+            if data_type == "BIGINT":
+                self._builders[column.name] = _NumericColumn(np.int64)
+            elif data_type == "BOOLEAN":
+                self._builders[column.name] = _NumericColumn(np.bool_)
+            else:
+                self._builders[column.name] = _ObjectColumn(
+                    nested="STRUCT" in data_type or "MAP" in data_type, intern=bool(column.enum)
+                )
+
+    @staticmethod
+    def _get_duck_db_type(column: PolyglotEntityColumn) -> str:
+        """Get the DuckDb type a column is buffered as."""
+        return "VARCHAR" if column.enum else column.data_type.duck_db_type.upper()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, index: int) -> ColumnarRow:
+        if not -self._size <= index < self._size:
+            raise IndexError(index)
+
+        return ColumnarRow(self, index % self._size)
+
+    @property
+    def entity(self) -> PolyglotEntity:
+        """Get the polyglot entity."""
+        return self._entity
+
+    @property
+    def column_names(self) -> list[str]:
+        """Get the buffered column names."""
+        return [c.name for c in self._columns]
+
+    def get_value(self, column_name: str, index: int) -> Any:
+        """Get a buffered value."""
+        return self._builders[column_name].get(index)
+
+    def append(self, record: SharedModelMixin | dict[str, Any]) -> None:
+        """Append a validated record, or its dump."""
+
+        values_map: dict[str, Any] = dict(record) if isinstance(record, dict) else record.model_dump()
+        if self._signed:
+            values_map[RECORD_HASH_COLUMN] = SharedModelMixin._get_record_signature(values_map, self._entity)
+
+        for name, builder in self._builders.items():
+            value = values_map.get(name)
+            builder.append(None if value in EMPTY_VALUES else value)
+
+        self._size += 1
+
+    def extend(self, records: Iterable[SharedModelMixin | dict[str, Any]]) -> None:
+        """Append a batch of validated records."""
+
+        for record in records:
+            self.append(record)
+
+        logs.debug("Records buffered.", entity=self._entity.name, records=self._size)
+
+    @classmethod
+    def concat(cls, entity: PolyglotEntity, buffers: Iterable["ColumnarBuffer"]) -> "ColumnarBuffer":
+        """Concatenate buffers of the same entity, in order, into a new buffer."""
+
+        buffers = list(buffers)
+        for buffer in buffers:
+            if buffer.entity.name != entity.name:
+                logs.error("Buffer entity does not match.", entity=entity.name, buffer_entity=buffer.entity.name)
+                raise ValueError(f"Buffer entity {buffer.entity.name} does not match {entity.name}.")
+
+        merged = cls(entity)
+        for name, builder in merged._builders.items():
+            builder.extend_columns([b._builders[name] for b in buffers])
+
+        merged._size = sum(len(b) for b in buffers)
+        return merged
+
+    def get_select_expression(self, column: PolyglotEntityColumn) -> str:
+        """Get the expression reading a buffered column as its entity type."""
+
+        physical_name = QuackMetaClass.physical_column_name(column.name)
+        builder = self._builders[column.name]
+        if isinstance(builder, _ObjectColumn) and builder.nested:
+            return f"CAST(CAST({physical_name} AS JSON) AS {column.data_type.duck_db_type})"
+
+        return physical_name
+
+    def to_frame(self) -> pd.DataFrame:
+        """Get the buffer as a frame keyed by physical column name, numeric columns are not copied."""
+
+        return pd.DataFrame(
+            {QuackMetaClass.physical_column_name(name): b.to_array() for name, b in self._builders.items()},
+            copy=False,
+        )
+
+    @property
+    def hydrate_returns(self) -> list[dict[str, Any]]:
+        """Get the primary keys of every buffered record, as returned by the record writes."""
+
+        primary_key_columns: list[str] = [c.name for c in self._columns if c.primary_key]
+        return [
+            {f"{self._entity.name}_{pk}": self.get_value(pk, i) for pk in primary_key_columns}
+            for i in range(self._size)
+        ]
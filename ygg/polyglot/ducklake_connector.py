@@ -2,7 +2,7 @@
 
 from textwrap import dedent
 
-from ygg.config import YggSetup
+from ygg.config import DuckLakeMetadataRepository, DuckLakeRepository, YggSetup
 from ygg.helpers.enums import DuckLakeDbEntityType
 from ygg.helpers.logical_data_models import (
     DuckLakeSetup,
@@ -50,6 +50,35 @@ class DuckLakeConnector(QuackMetaClass):
 
         self._duck_lake_instructions_list: list[str] | None = None
         self._setup = YggSetup(create_ygg_folders=False, config_data=None)
+        self._ducklake_config = self._setup.ygg_ducklake_config
+
+    @property
+    def local_metadata(self) -> bool:
+        """Whether the DuckLake metadata is kept in a local DuckDb file instead of Postgres."""
+        return self._ducklake_config.metadata_repository == DuckLakeMetadataRepository.DUCKDB.value
+
+    @property
+    def local_repository(self) -> bool:
+        """Whether the DuckLake data files are kept in the local data location instead of S3."""
+        return self._ducklake_config.repository == DuckLakeRepository.LOCAL.value
+
+    @property
+    def metadata_path(self) -> str:
+        """Get the DuckLake metadata path."""
+
+        if self.local_metadata:
+            return str(self._setup.ygg_database_config.database_location / f"{self._catalog_name}.ducklake")
+
+        return f"dbname={self._catalog_name}"
+
+    @property
+    def data_path(self) -> str:
+        """Get the DuckLake data path."""
+
+        if self.local_repository:
+            return f"{self._setup.ygg_database_config.data_location / self._catalog_name}/"
+
+        return f"s3://repository/{self._catalog_name}/"
 
     @property
     def schema_ddl(self) -> str:
@@ -64,12 +93,21 @@ class DuckLakeConnector(QuackMetaClass):
     @property
     def quack_modules(self) -> list[str]:
         """Get the modules to install."""
-        modules = ["postgres", "ducklake", "httpfs"]
+        modules = ["ducklake"]
+        if not self.local_metadata:
+            modules.insert(0, "postgres")
+        if not self.local_repository:
+            modules.append("httpfs")
+
         return modules
 
     @property
     def object_storage_secret(self) -> str:
-        """Get the object storage secret."""
+        """Get the object storage secret, empty when the data files are local."""
+
+        if self.local_repository:
+            return ""
+
         storage_config = self._setup.ygg_s3_config
         object_storage_secret = f"""
             CREATE OR REPLACE PERSISTENT SECRET OBJECT_STORAGE_SECRET (
@@ -86,7 +124,10 @@ class DuckLakeConnector(QuackMetaClass):
 
     @property
     def catalog_secret(self) -> str:
-        """Get the object storage secret."""
+        """Get the Postgres catalog secret, empty when the metadata is local."""
+
+        if self.local_metadata:
+            return ""
 
         catalog_config = self._setup.ygg_quack_config
         catalog_secret = f"""
@@ -105,16 +146,21 @@ class DuckLakeConnector(QuackMetaClass):
 
     @property
     def ducklake_secret(self) -> str:
-        """Get the object storage secret."""
+        """Get the DuckLake secret."""
 
         ducklake_secret = """
             CREATE OR REPLACE PERSISTENT SECRET {catalog_name}_secret (
             TYPE ducklake,
-            METADATA_PATH 'dbname={catalog_name}',
-            DATA_PATH 's3://repository/{catalog_name}/',
+            METADATA_PATH '{metadata_path}',
+            DATA_PATH '{data_path}'
         """
-        ducklake_secret = ducklake_secret.format(catalog_name=self._catalog_name)
-        ducklake_secret += "METADATA_PARAMETERS MAP {'TYPE': 'postgres', 'SECRET': 'CATALOG_POSTGRES'});"
+        ducklake_secret = ducklake_secret.format(
+            catalog_name=self._catalog_name, metadata_path=self.metadata_path, data_path=self.data_path
+        )
+        if self.local_metadata:
+            ducklake_secret += ");"
+        else:
+            ducklake_secret += ", METADATA_PARAMETERS MAP {'TYPE': 'postgres', 'SECRET': 'CATALOG_POSTGRES'});"
 
         ducklake_secret = dedent(ducklake_secret)
         return ducklake_secret
@@ -131,7 +177,15 @@ class DuckLakeConnector(QuackMetaClass):
         return attach_ducklake_catalog
 
     def create_duck_lake_catalog(self) -> None:
-        """Create the DuckLake catalog."""
+        """Create the DuckLake catalog, a local metadata file is created when the catalog is first attached."""
+
+        database_config = self._setup.ygg_database_config
+        if self.local_repository:
+            (database_config.data_location / self._catalog_name).mkdir(parents=True, exist_ok=True)
+
+        if self.local_metadata:
+            database_config.database_location.mkdir(parents=True, exist_ok=True)
+            return
 
         pg_setup = PostgresConnector(polyglot_db_config=self._setup.ygg_quack_config)
         pg_setup.create_database(target_db_name=self._catalog_name)
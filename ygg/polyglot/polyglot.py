@@ -13,10 +13,42 @@ from ygg.helpers.logical_data_models import (
     YggBaseModel,
 )
 from ygg.utils.ygg_logs import get_logger
+from ygg.utils.ygg_metrics import metrics
 
 logs = get_logger(logger_name="Polyglot")
 
 
+def build_dynamic_model(entity: PolyglotEntity) -> Type[Union[YggBaseModel, SharedModelMixin]]:
+    """Build the dynamic model of an entity, needs no Ygg setup so it can run in worker processes."""
+
+    logical_entity_name = re.sub(r"(?:^|_)(.)", lambda m: m.group(1).upper(), entity.name)
+
+    fields_map: dict[str, Any] = {}
+    for col in entity.columns:
+        field = Field(
+            default=col.default_value,
+            validation_alias=AliasChoices(col.name, col.alias),
+            description=col.comment,
+            examples=col.examples,
+            pattern=col.data_type.regex_pattern,
+        )
+
+        logical_type = get_data_type(col.data_type.data_type_name, "logical")
+        annotated_field = Annotated[logical_type["type"] if not col.nullable else Optional[logical_type["type"]], field]
+        fields_map[col.name] = annotated_field
+
+    instance = create_model(
+        logical_entity_name,
+        __config__=ConfigDict(title=entity.comment),
+        __base__=(YggBaseModel, SharedModelMixin),
+        **fields_map,
+    )
+    instance.bind_polyglot_entity(entity)
+
+    logs.debug("Dynamic Model Instance Created.", instance=instance.__name__)
+    return instance
+
+
 class Polyglot:
     """Database Polyglot Service."""
 
@@ -42,6 +74,7 @@ class Polyglot:
 
         return self._dynamic_instance
 
+    @metrics.timed("polyglot.build")
     def build(self) -> None:
         """Build the dynamic model instances."""
 
@@ -51,55 +84,25 @@ class Polyglot:
     def _build_dynamic_model_instances(self) -> None:
         """Build the dynamic model instances."""
 
-        logical_entity_name = re.sub(r"(?:^|_)(.)", lambda m: m.group(1).upper(), self._entity.name)
-
-        fields_map: dict[str, Any] = {}
-        for col in self._entity.columns:
-            field = Field(
-                default=col.default_value,
-                validation_alias=AliasChoices(col.name, col.alias),
-                description=col.comment,
-                examples=col.examples,
-                pattern=col.data_type.regex_pattern,
-            )
-
-            logical_type = get_data_type(col.data_type.data_type_name, "logical")
-            annotated_field = Annotated[
-                logical_type["type"] if not col.nullable else Optional[logical_type["type"]], field
-            ]
-            fields_map[col.name] = annotated_field
-
-        polyglot_field = Field(default=None, description="Polyglot Entity")
-        polyglot_entity = Annotated[Optional[PolyglotEntity], polyglot_field]
-        fields_map["polyglot_entity"] = polyglot_entity
-
-        instance = create_model(
-            logical_entity_name,
-            __config__=ConfigDict(title=self._entity.comment),
-            __base__=(YggBaseModel, SharedModelMixin),
-            **fields_map,
-        )
-
-        logs.debug("Dynamic Model Instance Created.", instance=instance.__name__)
-        self._dynamic_instance = instance
+        self._dynamic_instance = build_dynamic_model(self._entity)
 
 
 if __name__ == "__main__":
     from ygg.core.data_contract_loader import DataContractLoader
     from ygg.helpers.enums import Model
-    from ygg.utils.commons import get_json_file_content, get_yaml_content
+    from ygg.utils.commons import get_file_content_signature, get_json_file_content, get_yaml_content
 
     config_data = get_yaml_content("/home/thiago/projects/ygg-data-contracts/config/config.yaml")
     c = YggSetup(config_data=config_data)
 
     additional_config = get_yaml_content("/home/thiago/projects/ygg-data-contracts/ygg-schemas/0_1_0/config.yaml")
+    odcs_schema_file = "/home/thiago/projects/ygg-data-contracts/odcs-schemas/odcs-json-schema-v3.1.0.json"
     dyna = DataContractLoader(
         model=Model.CONTRACT,
         data_contract_schema_config=additional_config,
-        odcs_schema_reference=get_json_file_content(
-            "/home/thiago/projects/ygg-data-contracts/odcs-schemas/odcs-json-schema-v3.1.0.json"
-        ),
+        odcs_schema_reference=get_json_file_content(odcs_schema_file),
         data_contract_schema=get_yaml_content("/home/thiago/projects/ygg-data-contracts/ygg-schemas/0_1_0/schema.yaml"),
+        odcs_schema_signature=get_file_content_signature(odcs_schema_file),
     )
 
     entity_ = dyna.polyglot_entity
@@ -109,13 +112,12 @@ if __name__ == "__main__":
 
     contract = get_yaml_content("/home/thiago/projects/.ygg/local-dev/contract.yaml")
     contract = contract.get("schema", {})
-    for c in contract:
-        instance_ = instance_.inflate(data=c, polyglot_entity=entity_)
+    result = instance_.inflate_many(data=contract)
+    for error in result.errors:
+        print(error)
 
+    if result.records:
         from ygg.core.polyglot_contract import PolyglotContract
 
-        # DataDocument(polyglot_entity=entity_).setup()
-        w = PolyglotContract(entity=instance_).setup().write_contract()
+        w = PolyglotContract(entity=p).setup().write_contracts(result.records)
         print(w)
-        # PolyglotContract(entity=instance_).setup()
-        # PolyglotContract(entity=instance_).write_contract()
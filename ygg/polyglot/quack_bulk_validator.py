@@ -0,0 +1,131 @@
+"""Bulk validation of a batch in DuckDb, using the rules the entity DDL enforces."""
+
+from ygg.helpers.logical_data_models import PolyglotEntity, PolyglotEntityColumn
+from ygg.polyglot.quack_meta_class import QuackMetaClass
+from ygg.polyglot.quack_signature import RECORD_HASH_COLUMN
+from ygg.utils.ygg_logs import get_logger
+
+logs = get_logger(logger_name="QuackBulkValidator")
+
+REJECTION_REASONS_COLUMN: str = "rejection_reasons"
+REJECTED_RECORD_COLUMN: str = "rejected_record"
+
+
+class QuackBulkValidator:
+    """Quack Bulk Validator.
+
+    Evaluates the type cast, required, pattern and enum rules of every entity column as vectorized expressions over
+    a source relation whose columns are named after the entity columns. Each row gets the list of the rules it
+    breaks, rows with an empty list are valid.
+    """
+
+    def __init__(self, entity: PolyglotEntity, source_columns: list[str]):
+        """Initialize the Quack Bulk Validator."""
+
+        if not entity:
+            logs.error("Polyglot Entity cannot be empty.")
+            raise ValueError("Polyglot Entity cannot be empty.")
+
+        self._entity: PolyglotEntity = entity
+        self._source_columns: set[str] = set(source_columns or [])
+        self._columns: list[PolyglotEntityColumn] = [
+            c for c in entity.columns if not c.skip_from_physical_model and c.name != RECORD_HASH_COLUMN
+        ]
+
+        unknown_columns = self._source_columns - {c.name for c in entity.columns}
+        if unknown_columns:
+            logs.warning("Source columns are not entity columns and are ignored.", columns=sorted(unknown_columns))
+
+    @staticmethod
+    def _get_target_type(column: PolyglotEntityColumn) -> str:
+        """Get the DuckDb type a column is validated against."""
+        return "VARCHAR" if column.enum else column.data_type.duck_db_type
+
+    @staticmethod
+    def _quote(value: str) -> str:
+        """Quote a SQL string literal."""
+        return "'" + str(value).replace("'", "''") + "'"
+
+    def _source(self, column: PolyglotEntityColumn) -> str:
+        """Get the source expression of a column, NULL when the source does not carry it."""
+        return f'"{column.name}"' if column.name in self._source_columns else "NULL"
+
+    def _is_empty(self, column: PolyglotEntityColumn) -> str:
+        """Get the condition of an empty value, as the record writes treat them."""
+
+        source = self._source(column)
+        if self._get_target_type(column).upper() == "VARCHAR":
+            return f"NULLIF(NULLIF(CAST({source} AS VARCHAR), ''), 'None') IS NULL"
+
+        return f"{source} IS NULL"
+
+    def _get_column_rules(self, column: PolyglotEntityColumn) -> list[tuple[str, str]]:
+        """Get the (condition, reason) rules of a column."""
+
+        source = self._source(column)
+        target_type = self._get_target_type(column)
+        is_empty = self._is_empty(column)
+        rules: list[tuple[str, str]] = []
+
+        if column.nullable and not QuackMetaClass.get_db_column_default_expression(column):
+            rules.append((is_empty, "required"))
+
+        if target_type.upper() != "VARCHAR":
+            rules.append((f"NOT ({is_empty}) AND TRY_CAST({source} AS {target_type}) IS NULL", f"not a {target_type}"))
+
+        if column.enum:
+            enum_values = ", ".join(self._quote(e) for e in column.enum)
+            rules.append(
+                (f"NOT ({is_empty}) AND CAST({source} AS VARCHAR) NOT IN ({enum_values})", "not an enum value")
+            )
+
+        elif column.data_type.regex_pattern:
+            pattern = self._quote(column.data_type.regex_pattern)
+            rules.append(
+                (f"NOT ({is_empty}) AND NOT regexp_matches(CAST({source} AS VARCHAR), {pattern})", "pattern mismatch")
+            )
+
+        return rules
+
+    @property
+    def rejection_reasons_expression(self) -> str:
+        """Get the expression listing the broken rules of a row as `column: reason`."""
+
+        reasons = [
+            f"CASE WHEN {condition} THEN {self._quote(f'{column.name}: {reason}')} END"
+            for column in self._columns
+            for condition, reason in self._get_column_rules(column)
+        ]
+        if not reasons:
+            return "[]::VARCHAR[]"
+
+        return f"list_filter([{', '.join(reasons)}], r -> r IS NOT NULL)"
+
+    def get_select_expression(self, column: PolyglotEntityColumn) -> str:
+        """Get the expression reading a source column as its entity type."""
+
+        if column.name == RECORD_HASH_COLUMN:
+            return "NULL::VARCHAR"
+
+        source = self._source(column)
+        if column.name not in self._source_columns and column.default_value is not None:
+            # Missing columns get the model default, as validation would have filled it in.
+            source = QuackMetaClass.get_db_column_default_expression(column) or source
+
+        return f"TRY_CAST({source} AS {self._get_target_type(column)})"
+
+    def get_stage_statement(self, relation: str, stage: str) -> str:
+        """Get the statement staging a source relation with its rejection reasons and original row."""
+
+        select_columns = ", ".join(
+            f"{self.get_select_expression(c)} AS {QuackMetaClass.physical_column_name(c.name)}"
+            for c in self._entity.columns
+            if not c.skip_from_physical_model
+        )
+        # Only rejected rows keep their original values, serialized as JSON.
+        return (
+            f"CREATE OR REPLACE TEMP TABLE {stage} AS SELECT * EXCLUDE (source_row), "
+            f"CASE WHEN len({REJECTION_REASONS_COLUMN}) > 0 THEN CAST(to_json(source_row) AS VARCHAR) END "
+            f"AS {REJECTED_RECORD_COLUMN} FROM (SELECT {select_columns}, "
+            f"{self.rejection_reasons_expression} AS {REJECTION_REASONS_COLUMN}, source_row FROM {relation} source_row)"
+        )
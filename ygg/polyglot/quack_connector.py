@@ -1,12 +1,18 @@
 """Set of tools to interact with DuckDb and DuckLake."""
 
+import time
+from contextlib import contextmanager
+from typing import Any, Iterator
+
 import duckdb
 
 from ygg.helpers.enums import DuckLakeDbEntityType
 from ygg.helpers.logical_data_models import PolyglotEntity
 from ygg.polyglot.duckdb_connector import DuckDbConnector
 from ygg.polyglot.ducklake_connector import DuckLakeConnector
+from ygg.polyglot.quack_profiler import profiler
 from ygg.utils.ygg_logs import get_logger
+from ygg.utils.ygg_metrics import metrics
 
 logs = get_logger(logger_name="QuackConnector")
 
@@ -58,8 +64,74 @@ class QuackConnector:
         return self._connector
 
     @staticmethod
-    def execute_instructions(instructions: list[str] | str, duckdb_file: str | None = ":memory:") -> None:
-        """Execute a list of SQL statements against the database."""
+    def run_instructions(con: duckdb.DuckDBPyConnection, instructions: list[str | dict | list]) -> None:
+        """Run a list of SQL statements on an open connection."""
+
+        statement = None
+        metrics.increment("duckdb.statements", len(instructions))
+        with metrics.span("duckdb.execute"):
+            try:
+                if profiler.enabled:
+                    profiler.prepare(con)
+
+                for statement in instructions:
+                    logs.debug("Executing SQL statement.")
+                    start = time.perf_counter()
+                    rows = None
+                    if isinstance(statement, dict):
+                        sql = statement["statement"]
+                        if statement.get("many", False):
+                            con.executemany(sql, statement["values"])
+                            rows = len(statement["values"])
+                        else:
+                            con.execute(sql, statement["values"])
+                    else:
+                        sql = " ".join(statement) if isinstance(statement, list) else statement
+                        con.execute(sql)
+
+                    if profiler.enabled:
+                        profiler.capture(con, str(sql), time.perf_counter() - start, rows)
+
+                    short_statement = str(sql).replace("\n", " ").replace("\t", " ").strip().lower()[:30]
+                    logs.debug("SQL statement executed successfully.", statement=short_statement)
+
+            except Exception as e:
+                logs.error("Error executing SQL statement.", error=str(e), statement=str(statement))
+                raise e
+
+    @staticmethod
+    def rollback(con: duckdb.DuckDBPyConnection) -> None:
+        """Roll back the open transaction, if any, so the error that stopped it is the one raised."""
+
+        # A failed COMMIT has already ended the transaction, its ROLLBACK would raise and hide the commit error.
+        try:
+            con.execute("ROLLBACK")
+        except duckdb.Error as e:
+            logs.debug("Nothing to roll back.", error=str(e))
+
+    @staticmethod
+    def is_commit_conflict(error: Exception) -> bool:
+        """Whether an error is a commit conflict that is worth retrying."""
+        return isinstance(error, duckdb.TransactionException) or "conflict" in str(error).lower()
+
+    @staticmethod
+    @contextmanager
+    def session(
+        instructions: list[str] | None = None, duckdb_file: str | None = ":memory:"
+    ) -> Iterator[duckdb.DuckDBPyConnection]:
+        """Open a connection and run the setup instructions, keeping it open for several steps."""
+
+        with duckdb.connect(duckdb_file, read_only=False) as con:
+            if instructions:
+                QuackConnector.run_instructions(con, instructions)
+
+            yield con
+
+    @staticmethod
+    def execute_instructions(
+        instructions: list[str] | str, duckdb_file: str | None = ":memory:", relations: dict[str, Any] | None = None
+    ) -> None:
+        """Execute a list of SQL statements against the database, relations are frames registered as views."""
 
         if not instructions:
             raise ValueError("Instructions cannot be empty.")
@@ -68,23 +140,41 @@ class QuackConnector:
             instructions = [instructions]
 
         with duckdb.connect(duckdb_file, read_only=False) as con:
+            for name, relation in (relations or {}).items():
+                con.register(name, relation)
+                logs.debug("Relation registered.", relation=name)
+
+            QuackConnector.run_instructions(con, instructions)
+
+    @staticmethod
+    def fetch_records(
+        statement: str,
+        values: list[Any] | None = None,
+        instructions: list[str] | None = None,
+        duckdb_file: str | None = ":memory:",
+        relations: dict[str, Any] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Run the setup instructions and fetch the rows of a query as dictionaries."""
+
+        if not statement:
+            raise ValueError("Statement cannot be empty.")
+
+        with duckdb.connect(duckdb_file, read_only=False) as con:
+            for name, relation in (relations or {}).items():
+                con.register(name, relation)
+                logs.debug("Relation registered.", relation=name)
+
+            if instructions:
+                QuackConnector.run_instructions(con, instructions)
+
             try:
-                for statement in instructions:
-                    logs.debug("Executing SQL statement.")
-                    if isinstance(statement, dict):
-                        con.execute(statement["statement"], statement["values"])
-                        short_statement = (
-                            str(statement["statement"]).replace("\n", " ").replace("\t", " ").strip().lower()[:30]
-                        )
-                        logs.debug("SQL statement executed successfully.", statement=short_statement)
-                        continue
-                    elif isinstance(statement, list):
-                        statement = " ".join(statement)
-
-                    con.execute(statement)
-                    short_statement = str(statement).replace("\n", " ").replace("\t", " ").strip().lower()[:30]
-                    logs.debug("SQL statement executed successfully.", statement=short_statement)
+                cursor = con.execute(statement, values or [])
+                columns = [c[0] for c in cursor.description]
+                rows = [dict(zip(columns, row)) for row in cursor.fetchall()]
 
             except Exception as e:
-                logs.error("Error executing SQL statement.", error=str(e), statement=str(statement))
+                logs.error("Error fetching records.", error=str(e), statement=str(statement))
                 raise e
+
+        logs.debug("Records fetched.", rows=len(rows))
+        return rows
@@ -15,6 +15,29 @@ logs = get_logger(logger_name="QuackMetaClass")
 class QuackMetaClass:
     """Quack Service."""
 
+    RESERVED_NAMES_TRANSLATION: dict[str, str] = {"date": "date_", "timestamp": "timestamp_"}
+    TYPE_ALIASES: dict[str, str] = {
+        "TIMESTAMP WITH TIME ZONE": "TIMESTAMPTZ",
+        "BOOL": "BOOLEAN",
+        "INT": "INTEGER",
+        "INT4": "INTEGER",
+        "INT8": "BIGINT",
+        "LONG": "BIGINT",
+        "TEXT": "VARCHAR",
+        "STRING": "VARCHAR",
+        "FLOAT4": "FLOAT",
+        "FLOAT8": "DOUBLE",
+    }
+    WIDENING_TYPES: dict[str, tuple[str, ...]] = {
+        "TINYINT": ("SMALLINT", "INTEGER", "BIGINT"),
+        "SMALLINT": ("INTEGER", "BIGINT"),
+        "INTEGER": ("BIGINT",),
+        "UTINYINT": ("USMALLINT", "UINTEGER", "UBIGINT", "SMALLINT", "INTEGER", "BIGINT"),
+        "USMALLINT": ("UINTEGER", "UBIGINT", "INTEGER", "BIGINT"),
+        "UINTEGER": ("UBIGINT", "BIGINT"),
+        "FLOAT": ("DOUBLE",),
+    }
+
     def __init__(
         self,
         model: PolyglotEntity,
@@ -56,33 +79,81 @@ class QuackMetaClass:
         stmt: str = f"{header} (\n{columns}\n);"
         return stmt
 
+    def _get_entity_reference(self, entity_type: DuckLakeDbEntityType) -> str:
+        """Return the qualified name of the entity table."""
+
+        ducklake_catalog = ""
+        if entity_type == DuckLakeDbEntityType.DUCKLAKE:
+            ducklake_catalog: str = f"{self._catalog_name}."
+
+        return f"{ducklake_catalog}{self._entity_schema_name.lower()}.{self._model.name.lower()}"
+
     def _get_create_entity_header(self, entity_type: DuckLakeDbEntityType) -> str:
         """Return the creation statement of the entity header."""
 
         create_or_replace: str = "CREATE OR REPLACE TABLE"
         create_if_not_exists: str = "CREATE TABLE IF NOT EXISTS"
 
-        ducklake_catalog = ""
-        if entity_type == DuckLakeDbEntityType.DUCKLAKE:
-            ducklake_catalog: str = f"{self._catalog_name}."
-
         create_table_header: str = create_if_not_exists if not self._recreate_existing_entity else create_or_replace
-        entity_header = (
-            f"{create_table_header} {ducklake_catalog}{self._entity_schema_name.lower()}.{self._model.name.lower()}"
-        )
+        entity_header = f"{create_table_header} {self._get_entity_reference(entity_type)}"
 
         return entity_header
 
+    @classmethod
+    def physical_column_name(cls, column_name: str) -> str:
+        """Return the physical name of a column, translating reserved names."""
+        return cls.RESERVED_NAMES_TRANSLATION.get(column_name, column_name)
+
     @staticmethod
-    def _get_db_column_ddl_definition(column: PolyglotEntityColumn, entity_type: DuckLakeDbEntityType) -> str:
+    def _get_db_column_default(column: PolyglotEntityColumn, data_type: str) -> str:
+        """Return the column default clause."""
+
+        default_value: str = ""
+        if column.default_value or column.default_value_function:
+            if data_type.upper() in (
+                "TIMESTAMP",
+                "TIMESTAMPTZ",
+                "TIMESTAMP_LTZ",
+                "BIGINT",
+                "INTEGER",
+            ):
+                if column.default_value_function:
+                    default_value = f" DEFAULT {column.default_value_function}"
+                else:
+                    default_value = f" DEFAULT {column.default_value}"
+
+            elif data_type.upper() not in ("BOOL", "BOOLEAN"):
+                default_value = f" DEFAULT '{column.default_value}'"
+
+            elif data_type.upper() in ("BOOL", "BOOLEAN"):
+                default_value = f" DEFAULT {1 if column.default_value else 0}"
+
+            elif default_value == ...:
+                default_value = ""
+
+            else:
+                default_value = f" DEFAULT {column.default_value}"
+
+        return default_value
+
+    @classmethod
+    def get_db_column_default_expression(cls, column: PolyglotEntityColumn) -> str | None:
+        """Return the DuckDb expression of the column default value, if any."""
+
+        data_type: str = "ENUM" if column.enum else column.data_type.duck_lake_type
+        default_value = cls._get_db_column_default(column, data_type)
+
+        return default_value.removeprefix(" DEFAULT ") if default_value else None
+
+    @classmethod
+    def _get_db_column_ddl_definition(cls, column: PolyglotEntityColumn, entity_type: DuckLakeDbEntityType) -> str:
         """Return the column ddl definition."""
 
         duck_lake_column_spec: str = "{name} {type}"
         duck_db_column_spec: str = duck_lake_column_spec + "{default_value}{nullable}{check_constraint}"
         column_ddl_definition: str = ""
 
-        reserved_names_translation = {"date": "date_", "timestamp": "timestamp_"}
-        column_name = reserved_names_translation.get(column.name, column.name)
+        column_name = cls.physical_column_name(column.name)
 
         if entity_type == DuckLakeDbEntityType.DUCKLAKE:
             column_ddl_definition = duck_lake_column_spec.format(
@@ -95,7 +166,7 @@ class QuackMetaClass:
             nullable: str = "" if not column.nullable else " NOT NULL"
 
             if column.enum:
-                data_type: str = f""" ENUM({", ".join(["'" + enum_ + "'" for enum_ in column.enum])}) """
+                data_type: str = f" {cls._get_db_column_type(column, entity_type)} "
                 check_constraint: str | None = None
             else:
                 data_type: str = column.data_type.duck_lake_type
@@ -107,30 +178,7 @@ class QuackMetaClass:
                     )
                     check_constraint = f" CHECK ({column_check_constraint})"
 
-            if column.default_value or column.default_value_function:
-                if data_type.upper() in (
-                    "TIMESTAMP",
-                    "TIMESTAMPTZ",
-                    "TIMESTAMP_LTZ",
-                    "BIGINT",
-                    "INTEGER",
-                ):
-                    if column.default_value_function:
-                        default_value = f" DEFAULT {column.default_value_function}"
-                    else:
-                        default_value = f" DEFAULT {column.default_value}"
-
-                elif data_type.upper() not in ("BOOL", "BOOLEAN"):
-                    default_value = f" DEFAULT '{column.default_value}'"
-
-                elif data_type.upper() in ("BOOL", "BOOLEAN"):
-                    default_value = f" DEFAULT {1 if column.default_value else 0}"
-
-                elif default_value == ...:
-                    default_value = ""
-
-                else:
-                    default_value = f" DEFAULT {column.default_value}"
+            default_value = cls._get_db_column_default(column, data_type)
 
             column_ddl_definition = duck_db_column_spec.format(
                 default_value=default_value or "",
@@ -142,6 +190,139 @@ class QuackMetaClass:
 
         return column_ddl_definition
 
+    @staticmethod
+    def _get_db_column_type(column: PolyglotEntityColumn, entity_type: DuckLakeDbEntityType) -> str:
+        """Return the physical type of a column."""
+
+        if column.enum and entity_type == DuckLakeDbEntityType.DUCKDB:
+            return f"""ENUM({", ".join(["'" + enum_ + "'" for enum_ in column.enum])})"""
+
+        return column.data_type.duck_lake_type
+
+    @classmethod
+    def _normalize_db_type(cls, data_type: str) -> str:
+        """Normalize a type as reported by the catalog, for comparison."""
+
+        normalized = " ".join(str(data_type).replace('"', "").upper().split())
+        return cls.TYPE_ALIASES.get(normalized, normalized)
+
+    def get_retyped_columns(self, existing_columns: dict[str, str], entity_type: DuckLakeDbEntityType) -> list[str]:
+        """Return the existing columns whose type change is not a widening, as named in the existing table."""
+
+        existing: dict[str, str] = {k.lower(): self._normalize_db_type(v) for k, v in existing_columns.items()}
+        retyped_columns: list[str] = []
+        for column in self._model.columns:
+            if column.skip_from_physical_model:
+                continue
+
+            column_name = self.physical_column_name(column.name).lower()
+            if column_name not in existing and column.renamed_from:
+                column_name = self.physical_column_name(column.renamed_from).lower()
+
+            data_type = self._normalize_db_type(self._get_db_column_type(column, entity_type))
+            existing_type = existing.get(column_name)
+            if (
+                existing_type
+                and existing_type != data_type
+                and data_type not in self.WIDENING_TYPES.get(existing_type, ())
+            ):
+                retyped_columns.append(column_name)
+
+        return retyped_columns
+
+    def get_entity_evolution_instructions(
+        self,
+        existing_columns: dict[str, str],
+        entity_type: DuckLakeDbEntityType,
+        drop_columns: bool = False,
+        empty_columns: set[str] | None = None,
+    ) -> list[str]:
+        """Return the ALTER TABLE steps evolving an existing table, given as column name and type, to the entity.
+
+        A type change that is not a widening needs the entity recreated, unless the column is in empty_columns, then
+        it holds no values and is dropped and added back with its new type.
+        """
+
+        entity_reference = self._get_entity_reference(entity_type)
+        existing: dict[str, str] = {k.lower(): self._normalize_db_type(v) for k, v in existing_columns.items()}
+        empty_columns = {c.lower() for c in empty_columns or ()}
+        matched: set[str] = set()
+        instructions: list[str] = []
+
+        for column in self._model.columns:
+            if column.skip_from_physical_model:
+                continue
+
+            column_name = self.physical_column_name(column.name).lower()
+            data_type = self._get_db_column_type(column, entity_type)
+            previous_name = self.physical_column_name(column.renamed_from).lower() if column.renamed_from else None
+
+            if column_name not in existing and previous_name in existing:
+                instructions.append(f"ALTER TABLE {entity_reference} RENAME COLUMN {previous_name} TO {column_name}")
+                existing[column_name] = existing.pop(previous_name)
+                if previous_name in empty_columns:
+                    empty_columns.add(column_name)
+
+            existing_type = existing.get(column_name)
+            normalized_type = self._normalize_db_type(data_type)
+            if (
+                column_name in empty_columns
+                and existing_type not in (None, normalized_type)
+                and normalized_type not in self.WIDENING_TYPES.get(existing_type, ())
+            ):
+                logs.info(
+                    "Column holds no values, it is added back with its new type.",
+                    entity=self._model.name,
+                    column=column_name,
+                    existing_type=existing_type,
+                    data_type=data_type,
+                )
+                instructions.append(f"ALTER TABLE {entity_reference} DROP COLUMN {column_name}")
+                del existing[column_name]
+
+            if column_name not in existing:
+                default_value = ""
+                if entity_type == DuckLakeDbEntityType.DUCKDB:
+                    default_value = self._get_db_column_default(column, "ENUM" if column.enum else data_type)
+
+                instructions.append(
+                    f"ALTER TABLE {entity_reference} ADD COLUMN {column_name} {data_type}{default_value}"
+                )
+                matched.add(column_name)
+                continue
+
+            matched.add(column_name)
+            existing_type = existing[column_name]
+            if existing_type == normalized_type:
+                continue
+
+            if normalized_type not in self.WIDENING_TYPES.get(existing_type, ()):
+                logs.error(
+                    "Column type change is not a widening, the entity must be recreated.",
+                    entity=self._model.name,
+                    column=column_name,
+                    existing_type=existing_type,
+                    data_type=data_type,
+                )
+                raise ValueError(
+                    f"Column {column_name} of {self._model.name} cannot change from {existing_type} to {data_type}, "
+                    "the entity must be recreated."
+                )
+
+            instructions.append(f"ALTER TABLE {entity_reference} ALTER COLUMN {column_name} SET DATA TYPE {data_type}")
+
+        removed_columns = [c for c in existing if c not in matched]
+        if removed_columns and not drop_columns:
+            logs.warning(
+                "Columns are no longer in the entity and are kept.", entity=self._model.name, columns=removed_columns
+            )
+
+        if drop_columns:
+            instructions += [f"ALTER TABLE {entity_reference} DROP COLUMN {c}" for c in removed_columns]
+
+        logs.debug("Entity evolution instructions created.", entity=self._model.name, steps=len(instructions))
+        return instructions
+
     def _get_entity_columns_definition(self, entity_type: DuckLakeDbEntityType) -> str:
         """Return the entity definition."""
 
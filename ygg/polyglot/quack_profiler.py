@@ -0,0 +1,173 @@
+"""Opt-in DuckDb statement profiling, with a slow statement log."""
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+import duckdb
+
+from ygg.config import YggSetup
+from ygg.helpers.logical_data_models import StatementProfile
+from ygg.utils.ygg_logs import get_logger
+
+logs = get_logger(logger_name="QuackProfiler")
+
+PROFILES_FOLDER: str = "profiles"
+DML_PREFIXES: tuple[str, ...] = ("INSERT", "UPDATE", "DELETE", "MERGE")
+SLOW_STATEMENT_LOG_LENGTH: int = 2_000
+TOP_OPERATORS: int = 5
+
+
+class QuackProfiler:
+    """Quack Profiler.
+
+    While enabled every statement run through QuackConnector is profiled by DuckDb. Its wall time, rows affected
+    and operator tree are appended as one JSON line to a file per process in the profiles folder, readable back
+    with read_json, and statements slower than the threshold are logged with the operators that took the longest.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = False,
+        profiles_folder: Path | str | None = None,
+        slow_statement_seconds: float = 1.0,
+        min_statement_seconds: float = 0.0,
+    ):
+        """Initialize the Quack Profiler, statements faster than min_statement_seconds are not persisted."""
+
+        self._enabled: bool = enabled
+        self._profiles_folder: Path | None = Path(profiles_folder) if profiles_folder else None
+        self._slow_statement_seconds: float = slow_statement_seconds
+        self._min_statement_seconds: float = min_statement_seconds
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether statements are profiled."""
+        return self._enabled
+
+    @property
+    def profiles_file(self) -> Path:
+        """Get the profiles file of the process, in the Ygg database folder when no folder is informed."""
+
+        if self._profiles_folder is None:
+            setup = YggSetup(create_ygg_folders=False, config_data=None)
+            self._profiles_folder = setup.ygg_database_config.database_location / PROFILES_FOLDER
+
+        return self._profiles_folder / f"statements-{os.getpid()}.jsonl"
+
+    def enable(
+        self,
+        profiles_folder: Path | str | None = None,
+        slow_statement_seconds: float | None = None,
+        min_statement_seconds: float | None = None,
+    ) -> None:
+        """Start profiling, keeping the settings not informed."""
+
+        if profiles_folder is not None:
+            self._profiles_folder = Path(profiles_folder)
+        if slow_statement_seconds is not None:
+            self._slow_statement_seconds = slow_statement_seconds
+        if min_statement_seconds is not None:
+            self._min_statement_seconds = min_statement_seconds
+
+        self._enabled = True
+
+    def disable(self) -> None:
+        """Stop profiling."""
+        self._enabled = False
+
+    @staticmethod
+    def prepare(con: duckdb.DuckDBPyConnection) -> None:
+        """Turn on DuckDb profiling of a connection, keeping the profiles in memory."""
+        con.execute("SET enable_profiling = 'no_output'")
+
+    @staticmethod
+    def _get_operators(node: dict[str, Any]) -> list[dict[str, Any]]:
+        """Flatten the operator tree of a profile."""
+
+        operators: list[dict[str, Any]] = []
+        for child in node.get("children", []):
+            operators.append(
+                {
+                    "operator": child.get("operator_name") or child.get("operator_type"),
+                    "seconds": child.get("operator_timing", 0.0),
+                    "rows": child.get("operator_cardinality"),
+                }
+            )
+            operators += QuackProfiler._get_operators(child)
+
+        return operators
+
+    def capture(
+        self, con: duckdb.DuckDBPyConnection, statement: str, seconds: float, rows: int | None = None
+    ) -> StatementProfile | None:
+        """Capture the profile of the statement the connection just ran, None when it is not kept."""
+
+        try:
+            profile = json.loads(con.get_profiling_information(format="json"))
+        except Exception as e:
+            logs.debug("DuckDb profile not available.", error=str(e))
+            profile = {}
+
+        if rows is None and statement.lstrip().upper().startswith(DML_PREFIXES):
+            row = con.fetchone()
+            rows = row[0] if row and isinstance(row[0], int) else None
+
+        slow = seconds >= self._slow_statement_seconds
+        if not slow and seconds < self._min_statement_seconds:
+            return None
+
+        operators = sorted(self._get_operators(profile), key=lambda o: o["seconds"] or 0.0, reverse=True)
+        statement_profile = StatementProfile(
+            timestamp=time.time(),
+            statement=statement,
+            seconds=seconds,
+            rows=rows,
+            slow=slow,
+            top_operators=operators[:TOP_OPERATORS],
+            profile=profile,
+        )
+
+        if slow:
+            logs.warning(
+                "Slow DuckDb statement.",
+                seconds=round(seconds, 4),
+                rows=rows,
+                top_operators=[f"{o['operator']}:{round(o['seconds'] or 0.0, 4)}s" for o in operators[:TOP_OPERATORS]],
+                statement=" ".join(statement.split())[:SLOW_STATEMENT_LOG_LENGTH],
+            )
+
+        try:
+            profiles_file = self.profiles_file
+            profiles_file.parent.mkdir(parents=True, exist_ok=True)
+            with self._lock, open(profiles_file, "a") as file:
+                file.write(statement_profile.model_dump_json() + "\n")
+
+        except Exception as e:
+            logs.error("DuckDb profile could not be persisted.", error=str(e))
+
+        return statement_profile
+
+
+def configure_profiler() -> None:
+    """Enable profiling when YGG_DUCKDB_PROFILING is set, with YGG_DUCKDB_PROFILES_FOLDER,
+    YGG_SLOW_STATEMENT_SECONDS and YGG_PROFILE_MIN_STATEMENT_SECONDS. A profiler already enabled is left as it is."""
+
+    if profiler.enabled or os.getenv("YGG_DUCKDB_PROFILING", "").strip().lower() not in ("1", "true", "yes", "on"):
+        return
+
+    slow_statement_seconds = os.getenv("YGG_SLOW_STATEMENT_SECONDS")
+    min_statement_seconds = os.getenv("YGG_PROFILE_MIN_STATEMENT_SECONDS")
+    profiler.enable(
+        profiles_folder=os.getenv("YGG_DUCKDB_PROFILES_FOLDER"),
+        slow_statement_seconds=float(slow_statement_seconds) if slow_statement_seconds else None,
+        min_statement_seconds=float(min_statement_seconds) if min_statement_seconds else None,
+    )
+
+
+profiler = QuackProfiler()
+configure_profiler()
@@ -0,0 +1,207 @@
+"""Record signatures computed by DuckDb over a staged batch."""
+
+import re
+from typing import Any, Optional, get_args
+
+from pydantic import BaseModel
+
+from ygg.helpers.data_types import get_data_type
+from ygg.helpers.enums import SignatureAlgorithm
+from ygg.helpers.logical_data_models import PolyglotEntity, PolyglotEntityColumn
+from ygg.polyglot.quack_meta_class import QuackMetaClass
+from ygg.utils.ygg_logs import get_logger
+
+logs = get_logger(logger_name="QuackSignature")
+
+RECORD_HASH_COLUMN: str = "record_hash"
+SIGNABLE_TYPES: tuple[str, ...] = ("VARCHAR", "BIGINT", "BOOLEAN", "VARCHAR[]")
+STRUCT_TYPE_PATTERN = re.compile(r"^STRUCT\((?P<fields>[^()]*)\)(?P<is_list>\[\])?$", re.IGNORECASE)
+
+
+class QuackSignature:
+    """Quack Signature.
+
+    Builds the canonical JSON of a row as a DuckDb expression, byte-for-byte equal to
+    ``json.dumps(sort_keys=True, separators=(",", ":"))`` over the truthy signature columns, and hashes it with
+    sha256, so only sha256 entities are supported. Strings outside printable ASCII are escaped character by
+    character the way Python does, including surrogate pairs. STRUCT fields that are not plain strings in the
+    logical model, as a custom property value, only keep their text in DuckDb, so rows where they hold anything
+    else keep their Python signature, see ``is_signable``.
+    """
+
+    def __init__(self, entity: PolyglotEntity):
+        """Initialize the Quack Signature."""
+
+        if not entity:
+            logs.error("Polyglot Entity cannot be empty.")
+            raise ValueError("Polyglot Entity cannot be empty.")
+
+        self._entity: PolyglotEntity = entity
+        self._columns: list[PolyglotEntityColumn] = sorted(
+            [c for c in entity.columns if not c.skip_from_signature], key=lambda c: c.name
+        )
+        self._loose_fields: dict[str, list[str]] = {
+            c.name: fields for c in self._columns if (fields := self._get_loose_fields(c))
+        }
+
+    @property
+    def is_supported(self) -> bool:
+        """Whether every signature column can be serialized by DuckDb."""
+
+        if SignatureAlgorithm(self._entity.signature_algorithm) != SignatureAlgorithm.SHA256:
+            return False
+
+        column_names = [c.name for c in self._entity.columns]
+        if RECORD_HASH_COLUMN not in column_names:
+            return False
+
+        return all(
+            not c.skip_from_physical_model
+            and (
+                c.enum
+                or c.data_type.duck_db_type.upper() in SIGNABLE_TYPES
+                or self._get_struct_fields(c.data_type.duck_db_type) is not None
+            )
+            for c in self._columns
+        )
+
+    @property
+    def is_exact(self) -> bool:
+        """Whether DuckDb produces the Python signature of every row, whatever its STRUCT field values."""
+        return self.is_supported and not self._loose_fields
+
+    def is_signable(self, values_map: dict[str, Any]) -> bool:
+        """Whether DuckDb produces the same signature as Python for a dumped record."""
+
+        for name, fields in self._loose_fields.items():
+            value = values_map.get(name)
+            for struct in value if isinstance(value, list) else [value]:
+                if not isinstance(struct, dict):
+                    continue
+
+                if any(struct.get(f) is not None and not isinstance(struct.get(f), str) for f in fields):
+                    return False
+
+        return True
+
+    @staticmethod
+    def _get_struct_model(logical_type: Any) -> type[BaseModel] | None:
+        """Get the model of a STRUCT or STRUCT list logical type, unwrapping Annotated, Optional and list."""
+
+        if isinstance(logical_type, type) and issubclass(logical_type, BaseModel):
+            return logical_type
+
+        for argument in get_args(logical_type):
+            if model := QuackSignature._get_struct_model(argument):
+                return model
+
+        return None
+
+    def _get_loose_fields(self, column: PolyglotEntityColumn) -> list[str]:
+        """Get the STRUCT fields of a column that are not plain strings in the logical model."""
+
+        struct_fields = None if column.enum else self._get_struct_fields(column.data_type.duck_db_type)
+        if not struct_fields:
+            return []
+
+        # Without a logical model, any field may hold something other than a string.
+        logical_type = (get_data_type(column.data_type.data_type_name, "logical") or {}).get("type")
+        model = self._get_struct_model(logical_type)
+        if model is None:
+            return struct_fields
+
+        return [
+            f
+            for f in struct_fields
+            if f not in model.model_fields or model.model_fields[f].annotation not in (str, Optional[str])
+        ]
+
+    @staticmethod
+    def _get_struct_fields(data_type: str) -> list[str] | None:
+        """Get the field names of a STRUCT or STRUCT list type of VARCHAR fields, None for any other type."""
+
+        match = STRUCT_TYPE_PATTERN.match(data_type.strip())
+        if not match:
+            return None
+
+        fields = [f.strip().rsplit(" ", 1) for f in match.group("fields").split(",")]
+        if any(len(f) != 2 or f[1].upper() != "VARCHAR" for f in fields):
+            return None
+
+        return [f[0].strip('"') for f in fields]
+
+    @staticmethod
+    def _json_string(expression: str) -> str:
+        """Quote and escape a VARCHAR expression as a JSON string."""
+
+        escaped_character = (
+            "CASE WHEN c = '\"' THEN '\\\"' WHEN c = '\\' THEN '\\\\' WHEN unicode(c) BETWEEN 32 AND 126 THEN c "
+            "WHEN c = chr(10) THEN '\\n' WHEN c = chr(13) THEN '\\r' WHEN c = chr(9) THEN '\\t' "
+            "WHEN c = chr(8) THEN '\\b' WHEN c = chr(12) THEN '\\f' "
+            "WHEN unicode(c) < 65536 THEN '\\u' || lpad(lower(hex(unicode(c))), 4, '0') "
+            "ELSE '\\u' || lower(hex(55296 + ((unicode(c) - 65536) >> 10))) "
+            "|| '\\u' || lower(hex(56320 + ((unicode(c) - 65536) & 1023))) END"
+        )
+        # Printable ASCII only needs quotes and backslashes escaped, the per character walk is kept for the rest.
+        return (
+            f"""CASE WHEN regexp_matches({expression}, '^[ -~]*$') """
+            f"""THEN '"' || replace(replace({expression}, '\\', '\\\\'), '"', '\\"') || '"' """
+            f"""ELSE '"' || array_to_string(list_transform(string_split({expression}, ''), c -> {escaped_character}), '') """
+            f"""|| '"' END"""
+        )
+
+    def _json_object(self, expression: str, fields: list[str]) -> str:
+        """Serialize a STRUCT expression as a JSON object, nested models dump every field with sorted keys."""
+
+        members = " || ',' || ".join(
+            f"""'"{f}":' || CASE WHEN {expression}."{f}" IS NULL THEN 'null' """
+            f"""ELSE {self._json_string(f'{expression}."{f}"')} END"""
+            for f in sorted(fields)
+        )
+        return f"'{{' || {members} || '}}'"
+
+    def _column_member(self, column: PolyglotEntityColumn) -> str:
+        """Return the `"name":value` member of a column, NULL when Python would skip the value."""
+
+        name = QuackMetaClass.physical_column_name(column.name)
+        key = f"'\"{column.name}\":'"
+        data_type = "VARCHAR" if column.enum else column.data_type.duck_db_type.upper()
+
+        if data_type == "BIGINT":
+            return f"CASE WHEN {name} IS NOT NULL AND {name} <> 0 THEN {key} || CAST({name} AS VARCHAR) END"
+
+        if data_type == "BOOLEAN":
+            return f"CASE WHEN {name} THEN {key} || 'true' END"
+
+        struct_fields = None if column.enum else self._get_struct_fields(column.data_type.duck_db_type)
+        if struct_fields is not None:
+            if data_type.endswith("[]"):
+                element = f"CASE WHEN s IS NULL THEN 'null' ELSE {self._json_object('s', struct_fields)} END"
+                return (
+                    f"CASE WHEN {name} IS NOT NULL AND len({name}) > 0 THEN "
+                    f"{key} || '[' || array_to_string(list_transform({name}, s -> {element}), ',') || ']' END"
+                )
+
+            return f"CASE WHEN {name} IS NOT NULL THEN {key} || {self._json_object(name, struct_fields)} END"
+
+        if data_type == "VARCHAR[]":
+            element = f"CASE WHEN x IS NULL THEN 'null' ELSE {self._json_string('x')} END"
+            return (
+                f"CASE WHEN {name} IS NOT NULL AND len({name}) > 0 THEN "
+                f"{key} || '[' || array_to_string(list_transform({name}, x -> {element}), ',') || ']' END"
+            )
+
+        value = f"CAST({name} AS VARCHAR)"
+        return f"CASE WHEN {name} IS NOT NULL AND {value} <> '' THEN {key} || {self._json_string(value)} END"
+
+    @property
+    def canonical_json_expression(self) -> str:
+        """Get the DuckDb expression building the canonical JSON of a row."""
+
+        members = ", ".join(self._column_member(c) for c in self._columns)
+        return f"'{{' || concat_ws(',', {members}) || '}}'"
+
+    @property
+    def signature_expression(self) -> str:
+        """Get the DuckDb expression computing the sha256 signature of a row."""
+        return f"sha256({self.canonical_json_expression})"
@@ -0,0 +1,269 @@
+"""Durable write ahead queue of staged batches, shared by several writer processes."""
+
+import json
+import pickle
+import sqlite3
+import time
+import uuid
+from pathlib import Path
+from typing import Any
+
+from ygg.config import YggSetup
+from ygg.helpers.enums import WriteAheadBatchStatus
+from ygg.helpers.logical_data_models import WriteAheadBatch
+from ygg.utils.ygg_logs import get_logger
+
+logs = get_logger(logger_name="WriteAheadQueue")
+
+WRITE_AHEAD_QUEUE_FILE: str = "write_ahead_queue.sqlite"
+WRITE_AHEAD_COMMITS_TABLE: str = "write_ahead_commits"
+BACKPRESSURE_MAX_WAIT: float = 1.0
+
+
+class WriteAheadQueue:
+    """Write Ahead Queue.
+
+    Batches are kept in a SQLite file in WAL mode, which takes concurrent writers from several processes where a
+    DuckDb file only takes one. Workers enqueue the first layer inserts of their batches and return, a single
+    committer claims them in queue order and removes them once they are in DuckLake. Enqueueing waits while the
+    pending rows are over the limit, so a slow committer slows the workers down instead of filling the disk.
+
+    Statements are pickled, so their values come back with their types. Every queue file gets its own id, which the
+    committer records with the batch ids it commits so a batch replayed after a crash is not written twice.
+    """
+
+    def __init__(
+        self,
+        queue_file: Path | str | None = None,
+        max_pending_rows: int = 100_000,
+        busy_timeout: float = 30.0,
+    ):
+        """Initialize the Write Ahead Queue, next to the Ygg database when no file is informed."""
+
+        if max_pending_rows < 1:
+            logs.error("Max pending rows must be positive.", max_pending_rows=max_pending_rows)
+            raise ValueError("Max pending rows must be positive.")
+
+        if queue_file is None:
+            setup = YggSetup(create_ygg_folders=False, config_data=None)
+            queue_file = setup.ygg_database_config.database_location / WRITE_AHEAD_QUEUE_FILE
+
+        self._queue_file: Path = Path(queue_file)
+        self._max_pending_rows: int = max_pending_rows
+        self._busy_timeout: float = busy_timeout
+
+        self._queue_file.parent.mkdir(parents=True, exist_ok=True)
+        con = self._connect()
+        try:
+            con.execute("PRAGMA journal_mode=WAL")
+            con.execute("BEGIN IMMEDIATE")
+            con.execute("CREATE TABLE IF NOT EXISTS write_ahead_queue (queue_id TEXT NOT NULL)")
+            row = con.execute("SELECT queue_id FROM write_ahead_queue").fetchone()
+            if row is None:
+                row = (str(uuid.uuid4()),)
+                con.execute("INSERT INTO write_ahead_queue (queue_id) VALUES (?)", row)
+            con.execute("COMMIT")
+            self._queue_id: str = row[0]
+
+            con.execute(
+                """CREATE TABLE IF NOT EXISTS write_ahead_batches (
+                batch_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                entity TEXT NOT NULL,
+                upsert INTEGER NOT NULL,
+                statements BLOB NOT NULL,
+                rows INTEGER NOT NULL,
+                status TEXT NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                error TEXT,
+                enqueued_at REAL NOT NULL
+                )"""
+            )
+            con.execute(
+                "CREATE INDEX IF NOT EXISTS write_ahead_batches_status ON write_ahead_batches (status, batch_id)"
+            )
+        finally:
+            con.close()
+
+    @property
+    def queue_file(self) -> Path:
+        """Get the queue file path."""
+        return self._queue_file
+
+    @property
+    def queue_id(self) -> str:
+        """Get the queue id, batch ids are only unique within a queue file."""
+        return self._queue_id
+
+    @staticmethod
+    def _load_statements(payload: bytes | str) -> list[dict[str, Any]]:
+        """Load the statements of a batch, batches enqueued before they were pickled are JSON text."""
+        return json.loads(payload) if isinstance(payload, str) else pickle.loads(payload)
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection, one per call so the queue can be shared by forked processes."""
+
+        con = sqlite3.connect(self._queue_file, timeout=self._busy_timeout, isolation_level=None)
+        con.execute("PRAGMA synchronous=NORMAL")
+        return con
+
+    def _count(self, status: WriteAheadBatchStatus, column: str = "rows") -> int:
+        """Sum a column over the batches of a status."""
+
+        con = self._connect()
+        try:
+            row = con.execute(
+                f"SELECT COALESCE(SUM({column}), 0) FROM write_ahead_batches WHERE status = ?", (status.value,)
+            ).fetchone()
+        finally:
+            con.close()
+
+        return int(row[0])
+
+    @property
+    def pending_rows(self) -> int:
+        """Get the number of rows waiting to be committed."""
+        return self._count(WriteAheadBatchStatus.PENDING) + self._count(WriteAheadBatchStatus.COMMITTING)
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Get the number of batches of each status."""
+
+        con = self._connect()
+        try:
+            rows = con.execute("SELECT status, COUNT(*) FROM write_ahead_batches GROUP BY status").fetchall()
+        finally:
+            con.close()
+
+        return {status.value: 0 for status in WriteAheadBatchStatus} | dict(rows)
+
+    def enqueue(
+        self,
+        entity: str,
+        statements: list[dict[str, Any]],
+        rows: int,
+        upsert: bool = True,
+        timeout: float | None = None,
+    ) -> int:
+        """Enqueue the first layer inserts of a batch, waiting while the queue is full, and return its batch id."""
+
+        if not statements:
+            logs.error("Batch statements cannot be empty.", entity=entity)
+            raise ValueError("Batch statements cannot be empty.")
+
+        start = time.monotonic()
+        wait = 0.05
+        while (pending := self.pending_rows) and pending + rows > self._max_pending_rows:
+            if timeout is not None and time.monotonic() - start >= timeout:
+                logs.error("Write ahead queue is full.", entity=entity, pending_rows=pending, timeout=timeout)
+                raise TimeoutError(f"Write ahead queue is full, {pending} rows pending after {timeout}s.")
+
+            time.sleep(wait)
+            wait = min(wait * 2, BACKPRESSURE_MAX_WAIT)
+
+        payload = pickle.dumps(statements, protocol=pickle.HIGHEST_PROTOCOL)
+        con = self._connect()
+        try:
+            cursor = con.execute(
+                "INSERT INTO write_ahead_batches (entity, upsert, statements, rows, status, enqueued_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (entity, int(upsert), payload, rows, WriteAheadBatchStatus.PENDING.value, time.time()),
+            )
+            batch_id = cursor.lastrowid
+        finally:
+            con.close()
+
+        logs.debug("Batch enqueued.", entity=entity, batch_id=batch_id, rows=rows)
+        return batch_id
+
+    def claim(self, max_batches: int, max_rows: int) -> list[WriteAheadBatch]:
+        """Claim the oldest pending batches, at least one, up to the batch and row limits."""
+
+        con = self._connect()
+        try:
+            con.execute("BEGIN IMMEDIATE")
+            candidates = con.execute(
+                "SELECT batch_id, entity, upsert, statements, rows, attempts FROM write_ahead_batches "
+                "WHERE status = ? ORDER BY batch_id LIMIT ?",
+                (WriteAheadBatchStatus.PENDING.value, max_batches),
+            ).fetchall()
+
+            batches: list[WriteAheadBatch] = []
+            claimed_rows = 0
+            for batch_id, entity, upsert, statements, rows, attempts in candidates:
+                if batches and claimed_rows + rows > max_rows:
+                    break
+
+                batches.append(
+                    WriteAheadBatch(
+                        batch_id=batch_id,
+                        entity=entity,
+                        upsert=bool(upsert),
+                        statements=self._load_statements(statements),
+                        rows=rows,
+                        attempts=attempts,
+                    )
+                )
+                claimed_rows += rows
+
+            con.executemany(
+                "UPDATE write_ahead_batches SET status = ? WHERE batch_id = ?",
+                [(WriteAheadBatchStatus.COMMITTING.value, b.batch_id) for b in batches],
+            )
+            con.execute("COMMIT")
+        except Exception:
+            con.execute("ROLLBACK")
+            raise
+        finally:
+            con.close()
+
+        return batches
+
+    def complete(self, batch_ids: list[int]) -> None:
+        """Remove batches that are committed into DuckLake."""
+
+        con = self._connect()
+        try:
+            con.executemany("DELETE FROM write_ahead_batches WHERE batch_id = ?", [(i,) for i in batch_ids])
+        finally:
+            con.close()
+
+    def release(self, batch_ids: list[int], error: str | None = None, max_attempts: int | None = None) -> None:
+        """Give claimed batches back after a failed commit, as failed once they reach the max attempts."""
+
+        con = self._connect()
+        try:
+            con.executemany(
+                "UPDATE write_ahead_batches SET attempts = attempts + 1, error = ?, "
+                "status = CASE WHEN ? IS NOT NULL AND attempts + 1 >= ? THEN ? ELSE ? END WHERE batch_id = ?",
+                [
+                    (
+                        error,
+                        max_attempts,
+                        max_attempts,
+                        WriteAheadBatchStatus.FAILED.value,
+                        WriteAheadBatchStatus.PENDING.value,
+                        i,
+                    )
+                    for i in batch_ids
+                ],
+            )
+        finally:
+            con.close()
+
+    def recover(self) -> int:
+        """Give back the batches a stopped committer had claimed, returning how many."""
+
+        con = self._connect()
+        try:
+            cursor = con.execute(
+                "UPDATE write_ahead_batches SET status = ? WHERE status = ?",
+                (WriteAheadBatchStatus.PENDING.value, WriteAheadBatchStatus.COMMITTING.value),
+            )
+            recovered = cursor.rowcount
+        finally:
+            con.close()
+
+        if recovered:
+            logs.warning("Claimed batches given back to the queue.", batches=recovered)
+
+        return recovered
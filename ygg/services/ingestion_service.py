@@ -0,0 +1,397 @@
+"""Local HTTP ingestion service, coalescing concurrent requests into micro-batches per entity."""
+
+import json
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from contextlib import ExitStack
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Self
+from urllib.parse import urlsplit
+
+from ygg.core.polyglot_contract import PolyglotContract
+from ygg.core.shared_model_mixin import SharedModelMixin
+from ygg.helpers.logical_data_models import IngestionAck, IngestionEntityStats
+from ygg.polyglot.quack_connector import QuackConnector
+from ygg.utils.commons import parse_json_bytes
+from ygg.utils.ygg_logs import get_logger
+
+logs = get_logger(logger_name="IngestionService")
+
+QUEUE_POLL_INTERVAL: float = 0.1
+
+
+class MicroBatcher:
+    """Micro Batcher.
+
+    Requests of an entity queue up for a single committer thread, which takes the first waiting request, gathers
+    the ones arriving within the wait window up to the batch size and commits them as one DuckLake write on its own
+    warm session. Later records replace earlier ones with the same keys, as separate commits would. The queue is
+    bounded, a full queue pushes back on the callers.
+    """
+
+    def __init__(
+        self,
+        contract: PolyglotContract,
+        max_batch_records: int = 5_000,
+        max_wait: float = 0.005,
+        max_pending_requests: int = 1_024,
+        upsert: bool = True,
+    ):
+        """Initialize the Micro Batcher."""
+
+        if not contract:
+            logs.error("Polyglot Contract cannot be empty.")
+            raise ValueError("Polyglot Contract cannot be empty.")
+
+        self._contract: PolyglotContract = contract
+        self._max_batch_records: int = max_batch_records
+        self._max_wait: float = max_wait
+        self._upsert: bool = upsert
+
+        self._queue: queue.Queue[tuple[list[SharedModelMixin], Future]] = queue.Queue(maxsize=max_pending_requests)
+        self._stop = threading.Event()
+        self._sessions = ExitStack()
+        self._session: Any | None = None
+        self._lock = threading.Lock()
+        self._stats: IngestionEntityStats = IngestionEntityStats(entity=contract.entity.name)
+        self._commit_seconds: float = 0.0
+        self._thread = threading.Thread(target=self._run, name=f"ygg-batcher-{contract.entity.name}", daemon=True)
+
+    @property
+    def stats(self) -> IngestionEntityStats:
+        """Get a snapshot of the entity stats."""
+
+        with self._lock:
+            stats = self._stats.model_copy()
+
+        stats.pending_requests = self._queue.qsize()
+        return stats
+
+    def start(self) -> Self:
+        """Start the committer thread."""
+
+        self._thread.start()
+        return self
+
+    def submit(self, records: list[SharedModelMixin], timeout: float | None = None) -> Future:
+        """Queue validated records for the next micro-batch, the future resolves to the hydrate returns and snapshot."""
+
+        future: Future = Future()
+        try:
+            self._queue.put((records, future), timeout=timeout)
+        except queue.Full:
+            logs.error("Ingestion queue full.", entity=self._contract.entity.name)
+            raise TimeoutError(f"Ingestion queue of {self._contract.entity.name} is full.")
+
+        return future
+
+    def _get_session(self) -> Any:
+        """Get the session of the committer, opening it on the first batch."""
+
+        if self._session is None:
+            self._session = self._sessions.enter_context(
+                QuackConnector.session(
+                    instructions=self._contract.first_layer_instructions + self._contract.catalog_instructions
+                )
+            )
+
+        return self._session
+
+    def _gather(self) -> list[tuple[list[SharedModelMixin], Future]]:
+        """Take the first waiting request and the ones arriving within the wait window."""
+
+        try:
+            batch = [self._queue.get(timeout=QUEUE_POLL_INTERVAL)]
+        except queue.Empty:
+            return []
+
+        records = len(batch[0][0])
+        deadline = time.perf_counter() + self._max_wait
+        while records < self._max_batch_records:
+            remaining = deadline - time.perf_counter()
+            try:
+                item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+
+            batch.append(item)
+            records += len(item[0])
+
+        return batch
+
+    def _commit(self, batch: list[tuple[list[SharedModelMixin], Future]]) -> None:
+        """Commit a micro-batch and resolve the future of every request in it."""
+
+        records = [record for request_records, _ in batch for record in request_records]
+        start = time.perf_counter()
+        try:
+            first_layer_statements, hydrate_returns = PolyglotContract.get_first_layer_write_instructions(records)
+            snapshot_id = self._contract.write_staged(
+                first_layer_statements, upsert=self._upsert, replace_duplicates=True, session=self._get_session()
+            )
+
+        except Exception as e:
+            # The session may be left in a failed transaction, the next batch opens a new one.
+            self._sessions.close()
+            self._session = None
+            with self._lock:
+                self._stats.failed_batches += 1
+            logs.error("Micro-batch failed.", entity=self._contract.entity.name, records=len(records), error=str(e))
+            for _, future in batch:
+                future.set_exception(e)
+            return
+
+        elapsed = time.perf_counter() - start
+        with self._lock:
+            self._stats.requests += len(batch)
+            self._stats.records += len(records)
+            self._stats.batches += 1
+            self._commit_seconds += elapsed
+            self._stats.mean_batch_records = self._stats.records / self._stats.batches
+            self._stats.mean_commit_seconds = self._commit_seconds / self._stats.batches
+
+        offset = 0
+        for request_records, future in batch:
+            future.set_result((hydrate_returns[offset : offset + len(request_records)], len(records), snapshot_id))
+            offset += len(request_records)
+
+        logs.debug(
+            "Micro-batch committed.",
+            entity=self._contract.entity.name,
+            requests=len(batch),
+            records=len(records),
+            seconds=round(elapsed, 4),
+        )
+
+    def _run(self) -> None:
+        """Commit micro-batches until stopped."""
+
+        while not self._stop.is_set():
+            batch = self._gather()
+            if batch:
+                self._commit(batch)
+
+    def stop(self) -> None:
+        """Stop the committer, failing the requests still waiting, and close its session."""
+
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join()
+
+        while True:
+            try:
+                _, future = self._queue.get_nowait()
+            except queue.Empty:
+                break
+
+            future.set_exception(RuntimeError("Ingestion service stopped."))
+
+        self._sessions.close()
+        self._session = None
+
+
+class _IngestionRequestHandler(BaseHTTPRequestHandler):
+    """Ingestion Request Handler, HTTP/1.1 so clients keep their connections alive."""
+
+    protocol_version = "HTTP/1.1"
+    service: "IngestionService"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        """Route the access log to the Ygg logger."""
+        logs.debug("Ingestion request.", client=self.client_address[0], request=format % args)
+
+    def _send(self, status: HTTPStatus, content: bytes | str) -> None:
+        """Send a JSON response with its length, as keep-alive requires."""
+
+        body = content.encode("utf-8") if isinstance(content, str) else content
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_error(self, status: HTTPStatus, error: str) -> None:
+        """Send a JSON error response."""
+
+        self._send(status, json.dumps({"error": error}))
+
+    def do_GET(self) -> None:
+        """Serve the health and status endpoints."""
+
+        path = urlsplit(self.path).path.rstrip("/")
+        if path == "/health":
+            self._send(HTTPStatus.OK, '{"status": "ok"}')
+            return
+
+        if path == "/status":
+            stats = [s.model_dump_json() for s in self.service.stats]
+            self._send(HTTPStatus.OK, f"[{', '.join(stats)}]")
+            return
+
+        self._send_error(HTTPStatus.NOT_FOUND, f"Path {path} not found.")
+
+    def do_POST(self) -> None:
+        """Validate the records of an entity and wait for the micro-batch they are committed with."""
+
+        parts = urlsplit(self.path).path.strip("/").split("/")
+        if len(parts) != 3 or parts[0] != "entities" or parts[2] != "records":
+            self._send_error(HTTPStatus.NOT_FOUND, f"Path {self.path} not found.")
+            return
+
+        length = self.headers.get("Content-Length")
+        if length is None:
+            self._send_error(HTTPStatus.LENGTH_REQUIRED, "Content-Length is required.")
+            return
+
+        try:
+            payload = parse_json_bytes(self.rfile.read(int(length)))
+        except ValueError as e:
+            self._send_error(HTTPStatus.BAD_REQUEST, f"Invalid JSON body: {e}")
+            return
+
+        status, content = self.service.ingest(parts[1], payload)
+        self._send(status, content)
+
+
+class IngestionService:
+    """Ingestion Service.
+
+    Serves the contract records of the loaded entities over HTTP with the standard library only. Each request is
+    validated against the generated model on its own thread, then its valid records join the micro-batch of their
+    entity, so concurrent requests share one DuckLake commit. The acknowledgement carries the hydrate_return keys
+    of the written records and the validation errors of the others.
+
+    POST /entities/{entity}/records takes a record, a list of records or {"records": [...]}.
+    GET /health and GET /status report liveness and the micro-batch stats of every entity.
+    """
+
+    def __init__(
+        self,
+        contracts: list[PolyglotContract],
+        host: str = "127.0.0.1",
+        port: int = 8765,
+        max_batch_records: int = 5_000,
+        max_wait: float = 0.005,
+        max_pending_requests: int = 1_024,
+        request_timeout: float = 30.0,
+        upsert: bool = True,
+    ):
+        """Initialize the Ingestion Service."""
+
+        if not contracts:
+            logs.error("Contracts cannot be empty.")
+            raise ValueError("Contracts cannot be empty.")
+
+        self._contracts: dict[str, PolyglotContract] = {c.entity.name: c for c in contracts}
+        self._batchers: dict[str, MicroBatcher] = {
+            name: MicroBatcher(contract, max_batch_records, max_wait, max_pending_requests, upsert)
+            for name, contract in self._contracts.items()
+        }
+        self._request_timeout: float = request_timeout
+
+        handler = type("IngestionRequestHandler", (_IngestionRequestHandler,), {"service": self})
+        self._server = ThreadingHTTPServer((host, port), handler)
+        self._server.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def address(self) -> tuple[str, int]:
+        """Get the host and port the service listens on, the port is chosen by the system when given as 0."""
+        return self._server.server_address[:2]
+
+    @property
+    def stats(self) -> list[IngestionEntityStats]:
+        """Get the micro-batch stats of every entity."""
+        return [batcher.stats for batcher in self._batchers.values()]
+
+    @staticmethod
+    def _get_records(payload: Any) -> list[dict] | None:
+        """Get the records of a request body, None when it holds none."""
+
+        if isinstance(payload, dict):
+            payload = payload["records"] if isinstance(payload.get("records"), list) else [payload]
+
+        if not isinstance(payload, list) or not all(isinstance(r, dict) for r in payload):
+            return None
+
+        return payload
+
+    def ingest(self, entity: str, payload: Any) -> tuple[HTTPStatus, str]:
+        """Validate and write the records of a request, returning the response status and body."""
+
+        contract = self._contracts.get(entity)
+        if contract is None:
+            return HTTPStatus.NOT_FOUND, json.dumps({"error": f"Entity {entity} not found."})
+
+        records = self._get_records(payload)
+        if not records:
+            return HTTPStatus.BAD_REQUEST, json.dumps({"error": "Body must hold a record or a list of records."})
+
+        result = contract.model.inflate_many(records)
+        ack = IngestionAck(entity=entity, rejected=len(result.errors), errors=result.errors)
+        if not result.records:
+            return HTTPStatus.UNPROCESSABLE_ENTITY, ack.model_dump_json()
+
+        try:
+            future = self._batchers[entity].submit(result.records, timeout=self._request_timeout)
+            ack.hydrate_returns, ack.batch_records, ack.snapshot_id = future.result(timeout=self._request_timeout)
+
+        except TimeoutError as e:
+            return HTTPStatus.SERVICE_UNAVAILABLE, json.dumps({"error": str(e) or "Commit timed out."})
+
+        except Exception as e:
+            return HTTPStatus.INTERNAL_SERVER_ERROR, json.dumps({"error": str(e)})
+
+        ack.accepted = len(result.records)
+        return HTTPStatus.OK, ack.model_dump_json()
+
+    def start(self) -> Self:
+        """Start the committers and serve requests on a background thread."""
+
+        for batcher in self._batchers.values():
+            batcher.start()
+
+        self._thread = threading.Thread(target=self._server.serve_forever, name="ygg-ingestion", daemon=True)
+        self._thread.start()
+
+        host, port = self.address
+        logs.info("Ingestion Service Started.", host=host, port=port, entities=sorted(self._contracts))
+        return self
+
+    def serve_forever(self) -> None:
+        """Serve requests until the process is interrupted."""
+
+        self.start()
+        try:
+            while self._thread.is_alive():
+                self._thread.join(timeout=1.0)
+
+        except KeyboardInterrupt:
+            logs.info("Ingestion Service interrupted.")
+
+        finally:
+            self.stop()
+
+    def stop(self) -> None:
+        """Stop serving, then stop the committers."""
+
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+
+        self._server.server_close()
+        for batcher in self._batchers.values():
+            batcher.stop()
+
+        for stats in self.stats:
+            logs.info("Ingestion Service Stopped.", **stats.model_dump())
+
+    def __enter__(self) -> Self:
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
@@ -1,16 +1,92 @@
 """Local files utilities."""
 
 import base64
-import hashlib
 import json
 import os
+import pickle
 import re
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 import yaml
 from dotenv import load_dotenv
 
+from ygg.utils.signature_engine import SignatureEngine
+from ygg.utils.ygg_metrics import metrics
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+FILE_CONTENT_CACHE_SIZE: int = 64
+
+_file_content_cache: OrderedDict[tuple[str, str], tuple[int, int, bytes]] = OrderedDict()
+_file_content_cache_lock = threading.Lock()
+
+
+def parse_json_bytes(content: bytes) -> Any:
+    """Parse JSON content, using orjson when it is installed."""
+    return orjson.loads(content) if orjson else json.loads(content)
+
+
+def _parse_json_file(file_path: Path) -> Any:
+    """Parse a JSON file, using orjson when it is installed."""
+    return parse_json_bytes(file_path.read_bytes())
+
+
+def _parse_yaml_file(file_path: Path) -> Any:
+    """Parse a YAML file, using the libyaml loader when it is available."""
+
+    with open(file_path, "r") as file:
+        return yaml.load(file, Loader=YAML_LOADER)
+
+
+def _get_cached_file_content(file_path: str | Path, parser: Callable[[Path], Any]) -> Any:
+    """Parse a file once per mtime and size, returning a private copy of the parsed content on every call."""
+
+    path = Path(file_path).resolve()
+    stat = path.stat()
+    key = (str(path), parser.__name__)
+
+    with _file_content_cache_lock:
+        cached = _file_content_cache.get(key)
+        if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            _file_content_cache.move_to_end(key)
+            metrics.increment("file_cache.hits")
+            # Callers mutate what they load, unpickling hands each one a fresh copy.
+            return pickle.loads(cached[2])
+
+    metrics.increment("file_cache.misses")
+    content = parser(path)
+    packed = pickle.dumps(content, protocol=pickle.HIGHEST_PROTOCOL)
+
+    with _file_content_cache_lock:
+        _file_content_cache[key] = (stat.st_mtime_ns, stat.st_size, packed)
+        _file_content_cache.move_to_end(key)
+        while len(_file_content_cache) > FILE_CONTENT_CACHE_SIZE:
+            _file_content_cache.popitem(last=False)
+
+    return content
+
+
+def get_file_content_signature(file_path: str | Path) -> str:
+    """Get the signature of a file content as the cache sees it, its resolved path, mtime and size."""
+
+    path = Path(file_path).resolve()
+    stat = path.stat()
+    return f"{path}:{stat.st_mtime_ns}:{stat.st_size}"
+
+
+def clear_file_content_cache() -> None:
+    """Drop every parsed file kept in the cache."""
+
+    with _file_content_cache_lock:
+        _file_content_cache.clear()
+
 
 def get_file_string_content(file_path: str) -> str:
     """Get file content as string."""
@@ -21,16 +97,13 @@ def get_file_string_content(file_path: str) -> str:
 def get_json_file_content(file_path: str) -> dict:
     """Get file content as JSON."""
 
-    with open(file_path, "r") as f:
-        schema_content = json.load(f)
-
+    schema_content = _get_cached_file_content(file_path, _parse_json_file)
     return schema_content or {}
 
 
 def get_yaml_content(file_path: str) -> dict:
     """Loads a YAML file and returns its content as a dictionary."""
-    with open(file_path, "r") as file:
-        return yaml.safe_load(file)
+    return _get_cached_file_content(file_path, _parse_yaml_file)
 
 
 def get_yaml_from_json_content(json_content: dict) -> str:
@@ -75,13 +148,8 @@ def replace_placeholders_with_env_values(config) -> dict[str, str | Any]:
 
 
 def get_json_signature(data: dict, algorithm: str = "sha256") -> str:
-    """Generates a sha256 signature for a JSON object."""
-
-    canonical_json = json.dumps(data, sort_keys=True, indent=None, separators=(",", ":"))
-    hasher = hashlib.new(algorithm)
-    hasher.update(canonical_json.encode("utf-8"))
-
-    return hasher.hexdigest()
+    """Generates a signature for a JSON object, sha256 by default."""
+    return SignatureEngine.for_algorithm(algorithm).sign(data)
 
 
 def pack_json_content_as_base64(content: dict) -> str:
@@ -0,0 +1,235 @@
+"""Bounded multi-stage pipeline, each stage running on its own worker threads."""
+
+import queue
+import threading
+import time
+from typing import Any, Callable, Iterable, Iterator
+
+from pydantic import ConfigDict, Field
+
+from ygg.helpers.logical_data_models import YggBaseModel
+from ygg.utils.ygg_logs import get_logger
+
+logs = get_logger(logger_name="Pipeline")
+
+QUEUE_POLL_INTERVAL: float = 0.1
+
+_END = object()
+
+
+class PipelineStage(YggBaseModel):
+    """Pipeline Stage."""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    name: str = Field(..., description="Stage name")
+    function: Callable[[Any], Any] = Field(..., description="Function applied to every item of the stage")
+    workers: int = Field(default=1, ge=1, description="Number of worker threads of the stage")
+    queue_size: int = Field(default=16, ge=1, description="Capacity of the queue feeding the stage")
+    batch_size: int | None = Field(
+        default=None, ge=1, description="Items are handed to the function as lists of up to this size when informed"
+    )
+    fan_out: bool = Field(default=False, description="Whether the function returns an iterable of output items")
+
+
+class PipelineStageMetrics(YggBaseModel):
+    """Pipeline Stage Metrics."""
+
+    name: str = Field(..., description="Stage name")
+    workers: int = Field(default=1, description="Number of worker threads of the stage")
+    items_in: int = Field(default=0, description="Items taken from the stage queue")
+    items_out: int = Field(default=0, description="Items handed to the next stage")
+    busy_seconds: float = Field(default=0.0, description="Time spent in the stage function, summed over workers")
+    queue_depth: int = Field(default=0, description="Items waiting in the stage queue")
+    max_queue_depth: int = Field(default=0, description="Highest number of items seen waiting in the stage queue")
+    throughput: float = Field(default=0.0, description="Items taken per second since the pipeline started")
+
+
+class Pipeline:
+    """Pipeline.
+
+    Items flow from the source through the stages over bounded queues, so a slow stage blocks the ones before it
+    instead of letting items pile up in memory, and stages waiting on I/O overlap with the ones using the CPU.
+    Items keep their order only when every stage has a single worker. A function returning None drops the item.
+    The first error stops every stage and is raised to the caller.
+    """
+
+    def __init__(self, stages: list[PipelineStage], name: str = "pipeline", output_queue_size: int = 16):
+        """Initialize the Pipeline."""
+
+        if not stages:
+            logs.error("Pipeline stages cannot be empty.", pipeline=name)
+            raise ValueError("Pipeline stages cannot be empty.")
+
+        self._name: str = name
+        self._stages: list[PipelineStage] = stages
+        self._queues: list[queue.Queue] = [queue.Queue(maxsize=s.queue_size) for s in stages]
+        self._queues.append(queue.Queue(maxsize=output_queue_size))
+
+        self._metrics: list[PipelineStageMetrics] = [
+            PipelineStageMetrics(name=s.name, workers=s.workers) for s in stages
+        ]
+        self._lock = threading.Lock()
+        self._running_workers: list[int] = [s.workers for s in stages]
+        self._stop = threading.Event()
+        self._error: BaseException | None = None
+        self._started_at: float | None = None
+
+    @property
+    def metrics(self) -> list[PipelineStageMetrics]:
+        """Get a snapshot of the metrics of every stage."""
+
+        elapsed = time.perf_counter() - self._started_at if self._started_at else 0.0
+        snapshot: list[PipelineStageMetrics] = []
+        with self._lock:
+            for i, metrics in enumerate(self._metrics):
+                stage_metrics = metrics.model_copy()
+                stage_metrics.queue_depth = self._queues[i].qsize()
+                stage_metrics.throughput = metrics.items_in / elapsed if elapsed else 0.0
+                snapshot.append(stage_metrics)
+
+        return snapshot
+
+    def _put(self, index: int, item: Any) -> bool:
+        """Put an item on a queue, waiting for room unless the pipeline is stopped."""
+
+        target = self._queues[index]
+        while not self._stop.is_set():
+            try:
+                target.put(item, timeout=QUEUE_POLL_INTERVAL)
+            except queue.Full:
+                continue
+
+            if index < len(self._metrics):
+                depth = target.qsize()
+                with self._lock:
+                    self._metrics[index].max_queue_depth = max(self._metrics[index].max_queue_depth, depth)
+            return True
+
+        return False
+
+    def _get(self, index: int) -> Any:
+        """Get an item from a queue, the end marker when the pipeline is stopped."""
+
+        source = self._queues[index]
+        while not self._stop.is_set():
+            try:
+                return source.get(timeout=QUEUE_POLL_INTERVAL)
+            except queue.Empty:
+                continue
+
+        return _END
+
+    def _fail(self, error: BaseException, stage: str) -> None:
+        """Keep the first error and stop every stage."""
+
+        with self._lock:
+            if self._error is None:
+                self._error = error
+                logs.error("Pipeline stage failed.", pipeline=self._name, stage=stage, error=str(error))
+
+        self._stop.set()
+
+    def _feed(self, source: Iterable[Any]) -> None:
+        """Put the source items on the first queue, then one end marker per first stage worker."""
+
+        try:
+            for item in source:
+                if not self._put(0, item):
+                    return
+
+        except Exception as e:
+            self._fail(e, "source")
+            return
+
+        for _ in range(self._stages[0].workers):
+            self._put(0, _END)
+
+    def _emit(self, index: int, stage: PipelineStage, result: Any) -> None:
+        """Hand the result of a stage function to the next stage."""
+
+        if result is None:
+            return
+
+        for item in result if stage.fan_out else (result,):
+            if not self._put(index + 1, item):
+                return
+
+            with self._lock:
+                self._metrics[index].items_out += 1
+
+    def _call(self, index: int, stage: PipelineStage, payload: Any, items: int) -> None:
+        """Run the stage function over an item, or a batch of items."""
+
+        start = time.perf_counter()
+        result = stage.function(payload)
+        with self._lock:
+            self._metrics[index].items_in += items
+            self._metrics[index].busy_seconds += time.perf_counter() - start
+
+        self._emit(index, stage, result)
+
+    def _work(self, index: int) -> None:
+        """Run a worker of a stage until its queue ends."""
+
+        stage = self._stages[index]
+        batch: list[Any] = []
+        try:
+            while (item := self._get(index)) is not _END:
+                if stage.batch_size is None:
+                    self._call(index, stage, item, 1)
+                    continue
+
+                batch.append(item)
+                if len(batch) >= stage.batch_size:
+                    self._call(index, stage, batch, len(batch))
+                    batch = []
+
+            if batch and not self._stop.is_set():
+                self._call(index, stage, batch, len(batch))
+
+        except Exception as e:
+            self._fail(e, stage.name)
+
+        finally:
+            with self._lock:
+                self._running_workers[index] -= 1
+                last_worker = self._running_workers[index] == 0
+
+            # The last worker of a stage closes the next one, once per downstream worker.
+            if last_worker:
+                next_workers = self._stages[index + 1].workers if index + 1 < len(self._stages) else 1
+                for _ in range(next_workers):
+                    self._put(index + 1, _END)
+
+    def run(self, source: Iterable[Any]) -> Iterator[Any]:
+        """Run the source through the stages, yielding the items coming out of the last stage."""
+
+        self._started_at = time.perf_counter()
+        threads: list[threading.Thread] = [
+            threading.Thread(target=self._feed, args=(source,), name=f"{self._name}-source", daemon=True)
+        ]
+        for index, stage in enumerate(self._stages):
+            threads += [
+                threading.Thread(target=self._work, args=(index,), name=f"{self._name}-{stage.name}-{w}", daemon=True)
+                for w in range(stage.workers)
+            ]
+
+        for thread in threads:
+            thread.start()
+
+        try:
+            while (item := self._get(len(self._stages))) is not _END:
+                yield item
+
+        finally:
+            # Also reached when the caller stops iterating early, the stages are stopped before returning.
+            self._stop.set()
+            for thread in threads:
+                thread.join()
+
+            for metrics in self.metrics:
+                logs.info("Pipeline Stage Metrics.", pipeline=self._name, **metrics.model_dump())
+
+        if self._error is not None:
+            raise self._error
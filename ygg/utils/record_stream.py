@@ -0,0 +1,156 @@
+"""Streaming readers of newline delimited JSON and multi-document YAML record files."""
+
+import re
+from pathlib import Path
+from typing import Any, Iterator
+
+import yaml
+from glom import glom
+
+from ygg.helpers.enums import RecordStreamFormat
+from ygg.helpers.logical_data_models import RecordChunk, StreamPosition
+from ygg.utils.commons import YAML_LOADER, parse_json_bytes
+from ygg.utils.ygg_logs import get_logger
+
+logs = get_logger(logger_name="RecordStream")
+
+RECORD_STREAM_SUFFIXES: dict[str, RecordStreamFormat] = {
+    ".ndjson": RecordStreamFormat.NDJSON,
+    ".jsonl": RecordStreamFormat.NDJSON,
+    ".yaml": RecordStreamFormat.YAML,
+    ".yml": RecordStreamFormat.YAML,
+}
+YAML_DOCUMENT_START = re.compile(rb"^---(\s|$)")
+YAML_DOCUMENT_END = re.compile(rb"^\.\.\.(\s|$)")
+YAML_CONTENT_LINE = re.compile(rb"^\s*[^\s#%]")
+
+
+class RecordStreamReader:
+    """Record Stream Reader.
+
+    Reads one document at a time, a JSON line or a YAML document, and yields the records found at the document
+    path, so memory follows the largest document instead of the file. Every record comes with the position to
+    resume from once it is processed: the byte offset of its document and the records of it already read.
+    """
+
+    def __init__(
+        self,
+        file_path: str | Path,
+        stream_format: RecordStreamFormat | None = None,
+        document_path: str = "",
+        chunk_size: int = 1_000,
+    ):
+        """Initialize the Record Stream Reader, the format follows the file suffix when not informed."""
+
+        self._file_path: Path = Path(file_path)
+        if stream_format is None:
+            stream_format = RECORD_STREAM_SUFFIXES.get(self._file_path.suffix.lower())
+
+        if stream_format is None:
+            logs.error("Record stream format not supported.", file=str(self._file_path))
+            raise ValueError(f"Record stream format of {self._file_path} is not supported.")
+
+        if chunk_size < 1:
+            logs.error("Chunk size must be positive.", chunk_size=chunk_size)
+            raise ValueError("Chunk size must be positive.")
+
+        self._stream_format: RecordStreamFormat = RecordStreamFormat(stream_format)
+        self._document_path: str = document_path
+        self._chunk_size: int = chunk_size
+
+    @property
+    def file_path(self) -> Path:
+        """Get the file path."""
+        return self._file_path
+
+    def _ndjson_documents(self, offset: int) -> Iterator[tuple[int, int, Any]]:
+        """Yield the JSON lines from an offset, with their start and end offsets."""
+
+        with open(self._file_path, "rb") as file:
+            file.seek(offset)
+            for line in file:
+                start, offset = offset, offset + len(line)
+                if line.strip():
+                    yield start, offset, parse_json_bytes(line)
+
+    def _yaml_documents(self, offset: int) -> Iterator[tuple[int, int, Any]]:
+        """Yield the YAML documents from an offset, with their start and end offsets."""
+
+        with open(self._file_path, "rb") as file:
+            file.seek(offset)
+            start, lines, has_content = offset, [], False
+            for line in file:
+                # Directives and comments before a document start marker belong to the next document.
+                if YAML_DOCUMENT_START.match(line) and has_content:
+                    yield from self._load_yaml_document(start, offset, lines)
+                    start, lines, has_content = offset, [], False
+
+                lines.append(line)
+                offset += len(line)
+                has_content = has_content or YAML_CONTENT_LINE.match(line) is not None
+
+                if YAML_DOCUMENT_END.match(line):
+                    yield from self._load_yaml_document(start, offset, lines)
+                    start, lines, has_content = offset, [], False
+
+            yield from self._load_yaml_document(start, offset, lines)
+
+    @staticmethod
+    def _load_yaml_document(start: int, end: int, lines: list[bytes]) -> Iterator[tuple[int, int, Any]]:
+        """Load a YAML document, skipping empty ones."""
+
+        document = yaml.load(b"".join(lines), Loader=YAML_LOADER) if lines else None
+        if document is not None:
+            yield start, end, document
+
+    def _get_records(self, document: Any) -> list[dict[str, Any]]:
+        """Get the records found at the document path."""
+
+        records = glom(document, self._document_path, default=None) if self._document_path else document
+        if isinstance(records, dict):
+            return [records]
+
+        return [r for r in records or [] if isinstance(r, dict)]
+
+    def records(self, start: StreamPosition | None = None) -> Iterator[tuple[StreamPosition, dict[str, Any]]]:
+        """Yield the records from a position, each with the position after it."""
+
+        start = start or StreamPosition()
+        documents = (
+            self._ndjson_documents(start.offset)
+            if self._stream_format == RecordStreamFormat.NDJSON
+            else self._yaml_documents(start.offset)
+        )
+
+        skip = start.index
+        for document_start, document_end, document in documents:
+            records = self._get_records(document)
+            for index in range(skip, len(records)):
+                last = index == len(records) - 1
+                position = (
+                    StreamPosition.model_construct(offset=document_end, index=0)
+                    if last
+                    else StreamPosition.model_construct(offset=document_start, index=index + 1)
+                )
+                yield position, records[index]
+
+            skip = 0
+
+    def chunks(self, start: StreamPosition | None = None) -> Iterator[RecordChunk]:
+        """Yield the records from a position in chunks, each with the position after it."""
+
+        chunk = RecordChunk(position=start or StreamPosition())
+        read = 0
+        for position, record in self.records(start):
+            chunk.records.append(record)
+            chunk.position = position
+            read += 1
+
+            if len(chunk.records) >= self._chunk_size:
+                yield chunk
+                chunk = RecordChunk(first_record=read, position=position)
+
+        if chunk.records:
+            yield chunk
+
+        logs.debug("Record stream read.", file=str(self._file_path), records=read)
@@ -1,18 +1,35 @@
 """Basic logging class for logging in JSON format."""
 
+import atexit
+import itertools
+import json
 import logging
+import os
+import queue
+import sys
+import threading
 import uuid
+from datetime import datetime, timezone
 from enum import Enum
 from functools import wraps
-from typing import Any, Callable, TypeVar
+from typing import IO, Any, Callable, TypeVar
 from uuid import uuid4
 
 import structlog
 
 from ygg.utils.custom_decorators import singleton
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 R = TypeVar("R")
 
+LOG_QUEUE_SIZE: int = 100_000
+LOG_QUEUE_BATCH: int = 512
+LOG_QUEUE_ERROR_TIMEOUT: float = 1.0
+
 
 class LogLevel(Enum):
     """Enum for logging levels.
@@ -32,9 +49,223 @@ class LogLevel(Enum):
     CRITICAL = logging.CRITICAL
 
 
+class LogMode(Enum):
+    """Enum for logging modes.
+
+    Development renders colored console lines and logs every level, production renders JSON lines, skips the
+    levels below the configured one before any work and numbers the entries with a counter instead of uuid4.
+    """
+
+    DEVELOPMENT = "development"
+    PRODUCTION = "production"
+
+
+class _QueueWriter:
+    """File-like writer handing log lines to a background thread, so the caller never waits on I/O.
+
+    When the writer falls too far behind lines are dropped, error lines first wait a moment for room. The number of
+    dropped lines is written as a line of its own once the writer catches up.
+    """
+
+    def __init__(self, file: IO[bytes], max_size: int = LOG_QUEUE_SIZE) -> None:
+        self._file = file
+        self._queue: queue.Queue[bytes | None] = queue.Queue(maxsize=max_size)
+        self._lock = threading.Lock()
+        self._dropped: int = 0
+        self._reported: int = 0
+        self._thread = threading.Thread(target=self._run, name="ygg-log-writer", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    @property
+    def dropped(self) -> int:
+        """Get the number of lines dropped while the queue was full."""
+        return self._dropped
+
+    def write(self, line: bytes, timeout: float | None = None) -> None:
+        """Queue a line, waiting up to the timeout for room before dropping it."""
+
+        try:
+            if timeout:
+                self._queue.put(line, timeout=timeout)
+            else:
+                self._queue.put_nowait(line)
+        except queue.Full:
+            with self._lock:
+                self._dropped += 1
+
+    def flush(self) -> None:
+        """Lines are flushed by the writer thread."""
+
+    def _run(self) -> None:
+        """Write the queued lines in batches until the end marker."""
+
+        while (line := self._queue.get()) is not None:
+            lines = [line]
+            while len(lines) < LOG_QUEUE_BATCH:
+                try:
+                    line = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+
+                if line is None:
+                    self._write(lines)
+                    return
+
+                lines.append(line)
+
+            self._write(lines)
+
+    def _write(self, lines: list[bytes]) -> None:
+        """Write a batch of lines to the file, followed by the count of the lines dropped since the last one."""
+
+        dropped = self._dropped
+        if dropped > self._reported:
+            lines.append(self._get_dropped_line(dropped - self._reported))
+            self._reported = dropped
+
+        self._file.write(b"".join(lines))
+        self._file.flush()
+
+    @staticmethod
+    def _get_dropped_line(dropped: int) -> bytes:
+        """Get the warning line reporting dropped lines, rendered as the production lines are."""
+
+        line = {
+            "dropped": dropped,
+            "logger": "YggLogs",
+            "event": "Log lines dropped, the writer fell behind.",
+            "level": "warning",
+            "timestamp": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+        }
+        return json.dumps(line).encode("utf-8") + b"\n"
+
+    def close(self) -> None:
+        """Write the lines still queued and stop the writer thread."""
+
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join(timeout=5)
+
+
+class _QueueLogger(structlog.BytesLogger):
+    """Byte logger writing to a queue writer, its error lines wait for room in the queue instead of being dropped."""
+
+    __slots__ = ()
+
+    def _msg_waiting(self, message: bytes) -> None:
+        """Queue an error line, waiting a moment for room."""
+        self._file.write(message + b"\n", timeout=LOG_QUEUE_ERROR_TIMEOUT)
+
+    fatal = failure = err = error = critical = exception = _msg_waiting
+
+
+class _QueueLoggerFactory(structlog.BytesLoggerFactory):
+    """Produce queue loggers."""
+
+    __slots__ = ()
+
+    def __call__(self, *args: Any) -> _QueueLogger:
+        return _QueueLogger(self._file, name=args[0] if args else None)
+
+
+class _LogSettings:
+    """Logging settings shared by every Logger, applied to structlog once."""
+
+    lock = threading.Lock()
+    configured: bool = False
+    mode: LogMode = LogMode.DEVELOPMENT
+    min_level: int = logging.NOTSET
+    sequence = itertools.count(1)
+    writer: _QueueWriter | None = None
+
+
+def _get_env_flag(name: str) -> bool:
+    """Get a boolean environment variable."""
+    return os.getenv(name, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def configure_logging(
+    mode: LogMode | str | None = None,
+    log_level: LogLevel | str | None = None,
+    background: bool | None = None,
+    force: bool = False,
+) -> None:
+    """
+    Configures structlog for every Logger, once per process unless forced.
+
+    Settings not informed come from the environment: YGG_LOG_MODE (development or production), YGG_LOG_LEVEL
+    (DEBUG, INFO, WARNING, ERROR or CRITICAL, production only) and YGG_LOG_QUEUE, which hands the production
+    lines to a background writer thread instead of writing them on the calling thread.
+
+    :param mode: The logging mode, development by default.
+    :param log_level: The lowest level logged in production, YGG_LOG_LEVEL or the Level singleton by default.
+    :param background: Whether production lines are written by a background thread.
+    :param force: Configure again even if logging was already configured, e.g. after loading a .env file.
+    """
+    with _LogSettings.lock:
+        if _LogSettings.configured and not force:
+            return
+
+        mode = LogMode(mode or os.getenv("YGG_LOG_MODE", "").lower() or LogMode.DEVELOPMENT)
+        if isinstance(log_level, str):
+            log_level = LogLevel[log_level.upper()]
+        elif log_level is None and os.getenv("YGG_LOG_LEVEL"):
+            log_level = LogLevel[os.getenv("YGG_LOG_LEVEL").upper()]
+        log_level = log_level or Level().level
+        background = _get_env_flag("YGG_LOG_QUEUE") if background is None else background
+
+        logging.basicConfig(format="%(message)s", level=log_level.value)
+
+        if mode == LogMode.DEVELOPMENT:
+            min_level = logging.NOTSET
+            processors = [
+                structlog.contextvars.merge_contextvars,
+                structlog.processors.add_log_level,
+                structlog.processors.StackInfoRenderer(),
+                structlog.dev.set_exc_info,
+                structlog.processors.TimeStamper(fmt="%Y-%m-%d %H:%M:%S", utc=True),
+                structlog.dev.ConsoleRenderer(),
+            ]
+            logger_factory = structlog.PrintLoggerFactory()
+
+        else:
+            min_level = log_level.value
+            processors = [
+                structlog.contextvars.merge_contextvars,
+                structlog.processors.add_log_level,
+                structlog.processors.TimeStamper(fmt="iso", utc=True),
+                structlog.processors.format_exc_info,
+                structlog.processors.JSONRenderer(serializer=orjson.dumps)
+                if orjson
+                else structlog.processors.JSONRenderer(),
+            ]
+            if background:
+                if _LogSettings.writer is None:
+                    _LogSettings.writer = _QueueWriter(sys.stdout.buffer)
+                logger_factory = _QueueLoggerFactory(file=_LogSettings.writer)
+            else:
+                logger_factory = structlog.BytesLoggerFactory() if orjson else structlog.PrintLoggerFactory()
+
+            # The byte logger expects bytes, the standard JSON renderer hands strings.
+            if background and not orjson:
+                processors.append(lambda _, __, event: event.encode("utf-8"))
+
+        structlog.configure(
+            processors=processors,
+            wrapper_class=structlog.make_filtering_bound_logger(min_level),
+            context_class=dict,
+            logger_factory=logger_factory,
+            cache_logger_on_first_use=True,
+        )
+
+        _LogSettings.mode = mode
+        _LogSettings.min_level = min_level
+        _LogSettings.configured = True
+
+
 def get_logger(logger_name: str | None = "", log_level: LogLevel | None = None) -> "Logger":
-    """Get logger with default parameters."""
-    log_level = Level(log_level).level
+    """Get logger with default parameters, log_level is ignored as the level is set once by configure_logging."""
     return Logger(name=logger_name, log_level=log_level)
 
 
@@ -87,30 +318,12 @@ class Logger:
         parameters and providing support for JSON-rendered logs. The logger defaults
         to a unique identifier unless explicitly set.
 
-        :param log_level: The logging level to use. Defaults to LogLevel.DEBUG.
+        :param log_level: Ignored, kept for compatibility. The level is process wide, set by configure_logging
+            from its log_level argument, YGG_LOG_LEVEL or the Level singleton.
         :param logger_uuid: A unique string identifier for the logger. If none is
             provided, a new UUID will be generated.
         """
-        log_level = Level().level if not log_level else log_level
-        logging.basicConfig(
-            format="%(message)s",
-            level=log_level.value,
-        )
-
-        structlog.configure(
-            processors=[
-                structlog.contextvars.merge_contextvars,
-                structlog.processors.add_log_level,
-                structlog.processors.StackInfoRenderer(),
-                structlog.dev.set_exc_info,
-                structlog.processors.TimeStamper(fmt="%Y-%m-%d %H:%M:%S", utc=True),
-                structlog.dev.ConsoleRenderer(),
-            ],
-            wrapper_class=structlog.make_filtering_bound_logger(logging.NOTSET),
-            context_class=dict,
-            logger_factory=structlog.PrintLoggerFactory(),
-            cache_logger_on_first_use=False,
-        )
+        configure_logging()
 
         self._pid = PID.Pid()
         self._uuid = logger_uuid or str(uuid4())
@@ -151,16 +364,20 @@ class Logger:
             :return: The result of calling the appropriate log method from the wrapped logging object.
             :rtype: Any
             """
-            kwargs = kwargs or {}
+            # Disabled levels return before any kwargs are built.
+            if level < _LogSettings.min_level:
+                return None
+
             kwargs["logger"] = self._name or "NA"
             kwargs["uuid"] = self._uuid
             kwargs["pid"] = self._pid
-            kwargs["id"] = str(uuid4())
+            kwargs["id"] = next(_LogSettings.sequence) if _LogSettings.mode == LogMode.PRODUCTION else str(uuid4())
 
             log_method = getattr(self._log, func.__name__)
 
             return log_method(message, **kwargs)
 
+        level = logging.getLevelName(func.__name__.upper())
         return logger
 
     @log
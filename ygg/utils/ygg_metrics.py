@@ -0,0 +1,317 @@
+"""Phase timers and counters of the contract pipeline, with pluggable exporters and a no-op mode."""
+
+import atexit
+import collections
+import os
+import re
+import threading
+import time
+from abc import ABC, abstractmethod
+from functools import wraps
+from pathlib import Path
+from typing import Any, Callable, TypeVar
+
+from ygg.helpers.logical_data_models import CounterMetric, MetricsSnapshot, TimerMetric
+from ygg.utils.ygg_logs import get_logger
+
+logs = get_logger(logger_name="YggMetrics")
+
+R = TypeVar("R")
+
+PROMETHEUS_NAME = re.compile(r"[^a-zA-Z0-9_]")
+
+_MetricKey = tuple[str, tuple[tuple[str, str], ...]]
+
+
+class MetricsExporter(ABC):
+    """Metrics Exporter, handed a snapshot on every export."""
+
+    @abstractmethod
+    def export(self, snapshot: MetricsSnapshot) -> None:
+        """Export a snapshot."""
+
+
+class PrometheusTextExporter(MetricsExporter):
+    """Prometheus Text Exporter, rewrites a text file for the node exporter textfile collector."""
+
+    def __init__(self, file_path: Path | str, prefix: str = "ygg"):
+        """Initialize the Prometheus Text Exporter."""
+
+        self._file_path: Path = Path(file_path)
+        self._prefix: str = prefix
+
+    def _name(self, name: str) -> str:
+        """Get the Prometheus name of a metric."""
+        return PROMETHEUS_NAME.sub("_", f"{self._prefix}_{name}")
+
+    @staticmethod
+    def _labels(labels: dict[str, str]) -> str:
+        """Get the Prometheus labels of a metric."""
+
+        if not labels:
+            return ""
+
+        escaped = {k: v.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for k, v in labels.items()}
+        return "{" + ",".join(f'{PROMETHEUS_NAME.sub("_", k)}="{v}"' for k, v in sorted(escaped.items())) + "}"
+
+    def export(self, snapshot: MetricsSnapshot) -> None:
+        """Write the snapshot, replacing the file at once so the collector never reads half of it."""
+
+        lines: list[str] = []
+        typed: set[str] = set()
+        for timer in snapshot.timers:
+            name, labels = self._name(f"{timer.name}_seconds"), self._labels(timer.labels)
+            if name not in typed:
+                lines.append(f"# TYPE {name} summary")
+                typed.add(name)
+            lines.append(f"{name}_count{labels} {timer.count}")
+            lines.append(f"{name}_sum{labels} {timer.total_seconds}")
+
+        for counter in snapshot.counters:
+            name = self._name(f"{counter.name}_total")
+            if name not in typed:
+                lines.append(f"# TYPE {name} counter")
+                typed.add(name)
+            lines.append(f"{name}{self._labels(counter.labels)} {counter.value}")
+
+        self._file_path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = self._file_path.with_suffix(self._file_path.suffix + ".tmp")
+        temporary.write_text("\n".join(lines) + "\n")
+        os.replace(temporary, self._file_path)
+
+
+class JsonLinesExporter(MetricsExporter):
+    """JSON Lines Exporter, appends every snapshot as one line."""
+
+    def __init__(self, file_path: Path | str):
+        """Initialize the JSON Lines Exporter."""
+        self._file_path: Path = Path(file_path)
+
+    def export(self, snapshot: MetricsSnapshot) -> None:
+        """Append the snapshot."""
+
+        self._file_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self._file_path, "a") as file:
+            file.write(snapshot.model_dump_json() + "\n")
+
+
+class SnapshotExporter(MetricsExporter):
+    """Snapshot Exporter, keeps the latest snapshots in memory for tests and in-process probes."""
+
+    def __init__(self, max_snapshots: int = 100):
+        """Initialize the Snapshot Exporter."""
+        self._snapshots: collections.deque[MetricsSnapshot] = collections.deque(maxlen=max_snapshots)
+
+    @property
+    def snapshots(self) -> list[MetricsSnapshot]:
+        """Get the kept snapshots, oldest first."""
+        return list(self._snapshots)
+
+    @property
+    def last(self) -> MetricsSnapshot | None:
+        """Get the latest snapshot."""
+        return self._snapshots[-1] if self._snapshots else None
+
+    def export(self, snapshot: MetricsSnapshot) -> None:
+        """Keep the snapshot."""
+        self._snapshots.append(snapshot)
+
+
+class _NoopSpan:
+    """Span doing nothing, handed out while metrics are disabled."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        return None
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class _Span:
+    """Span timing a phase into the metrics it came from."""
+
+    __slots__ = ("_metrics", "_key", "_start")
+
+    def __init__(self, metrics: "YggMetrics", key: _MetricKey):
+        self._metrics = metrics
+        self._key = key
+        self._start = 0.0
+
+    def __enter__(self) -> "_Span":
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self._metrics._observe(self._key, time.perf_counter() - self._start)
+
+
+class YggMetrics:
+    """Ygg Metrics.
+
+    Phase timers and counters, optionally labelled, e.g. by entity. While disabled every call returns after one
+    attribute check, spans are a shared object doing nothing, so the instrumentation can stay on the hot paths.
+    """
+
+    def __init__(self, enabled: bool = False, exporters: list[MetricsExporter] | None = None):
+        """Initialize the Ygg Metrics."""
+
+        self._enabled: bool = enabled
+        self._exporters: list[MetricsExporter] = exporters or []
+        self._lock = threading.Lock()
+        self._timers: dict[_MetricKey, list[float]] = {}
+        self._counters: dict[_MetricKey, float] = {}
+        self._export_at_exit: bool = False
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the metrics are recorded."""
+        return self._enabled
+
+    def enable(self, exporters: list[MetricsExporter] | None = None, export_at_exit: bool = True) -> None:
+        """Start recording, adding the exporters, and export once more when the process exits."""
+
+        with self._lock:
+            self._exporters += exporters or []
+            self._enabled = True
+            if export_at_exit and not self._export_at_exit:
+                atexit.register(self.export)
+                self._export_at_exit = True
+
+    def disable(self) -> None:
+        """Stop recording, keeping what was recorded."""
+        self._enabled = False
+
+    def reset(self) -> None:
+        """Drop every recorded timer and counter."""
+
+        with self._lock:
+            self._timers.clear()
+            self._counters.clear()
+
+    @staticmethod
+    def _key(name: str, labels: dict[str, Any]) -> _MetricKey:
+        """Get the key of a metric and its labels."""
+        return name, tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+    def _observe(self, key: _MetricKey, seconds: float) -> None:
+        """Add a span to a timer."""
+
+        with self._lock:
+            timer = self._timers.get(key)
+            if timer is None:
+                self._timers[key] = [1, seconds, seconds, seconds]
+                return
+
+            timer[0] += 1
+            timer[1] += seconds
+            timer[2] = min(timer[2], seconds)
+            timer[3] = max(timer[3], seconds)
+
+    def observe(self, name: str, seconds: float, **labels: Any) -> None:
+        """Add a span measured elsewhere to a timer."""
+
+        if self._enabled:
+            self._observe(self._key(name, labels), seconds)
+
+    def span(self, name: str, **labels: Any) -> _Span | _NoopSpan:
+        """Get a context manager timing a phase."""
+
+        if not self._enabled:
+            return _NOOP_SPAN
+
+        return _Span(self, self._key(name, labels))
+
+    def timed(self, name: str) -> Callable[[Callable[..., R]], Callable[..., R]]:
+        """Decorate a function timing every call as a phase."""
+
+        def decorator(func: Callable[..., R]) -> Callable[..., R]:
+            key = self._key(name, {})
+
+            @wraps(func)
+            def wrapper(*args: Any, **kwargs: Any) -> R:
+                if not self._enabled:
+                    return func(*args, **kwargs)
+
+                start = time.perf_counter()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    self._observe(key, time.perf_counter() - start)
+
+            return wrapper
+
+        return decorator
+
+    def increment(self, name: str, value: float = 1, **labels: Any) -> None:
+        """Add to a counter."""
+
+        if not self._enabled:
+            return
+
+        key = self._key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def snapshot(self) -> MetricsSnapshot:
+        """Get the recorded timers and counters."""
+
+        with self._lock:
+            timers = [
+                TimerMetric(
+                    name=name,
+                    labels=dict(labels),
+                    count=count,
+                    total_seconds=total,
+                    min_seconds=shortest,
+                    max_seconds=longest,
+                )
+                for (name, labels), (count, total, shortest, longest) in sorted(self._timers.items())
+            ]
+            counters = [
+                CounterMetric(name=name, labels=dict(labels), value=value)
+                for (name, labels), value in sorted(self._counters.items())
+            ]
+
+        return MetricsSnapshot(timestamp=time.time(), timers=timers, counters=counters)
+
+    def export(self) -> MetricsSnapshot:
+        """Hand a snapshot to every exporter, a failing exporter does not stop the others."""
+
+        snapshot = self.snapshot()
+        for exporter in self._exporters:
+            try:
+                exporter.export(snapshot)
+            except Exception as e:
+                logs.error("Metrics export failed.", exporter=type(exporter).__name__, error=str(e))
+
+        return snapshot
+
+
+def _get_env_exporters() -> list[MetricsExporter]:
+    """Get the exporters configured in the environment."""
+
+    exporters: list[MetricsExporter] = []
+    if prometheus_file := os.getenv("YGG_METRICS_PROMETHEUS_FILE"):
+        exporters.append(PrometheusTextExporter(prometheus_file))
+    if jsonl_file := os.getenv("YGG_METRICS_JSONL_FILE"):
+        exporters.append(JsonLinesExporter(jsonl_file))
+    return exporters
+
+
+def configure_metrics() -> None:
+    """Enable the metrics when YGG_METRICS is set, with the exporters of YGG_METRICS_PROMETHEUS_FILE and
+    YGG_METRICS_JSONL_FILE. Metrics already enabled are left as they are."""
+
+    if metrics.enabled or os.getenv("YGG_METRICS", "").strip().lower() not in ("1", "true", "yes", "on"):
+        return
+
+    metrics.enable(_get_env_exporters())
+
+
+metrics = YggMetrics()
+configure_metrics()